@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark of the methods of :class:`AsciiSignalIO` for reading a large
+delimited text file of signals, with a time column.
+
+Run with:
+    python examples/benchmark_ascii.py
+"""
+from __future__ import division, print_function
+
+import os
+import tempfile
+import timeit
+
+import numpy as np
+
+import neo
+
+
+def make_file(n_samples=500000, n_channels=8):
+    fd, filename = tempfile.mkstemp(suffix='.txt')
+    os.close(fd)
+    data = np.column_stack([np.arange(n_samples) / 10000.,
+                            np.random.randn(n_samples, n_channels)])
+    np.savetxt(filename, data, delimiter='\t', fmt='%.6f')
+    return filename, data.shape
+
+
+def main(repeat=3):
+    filename, shape = make_file()
+    io = neo.io.AsciiSignalIO(filename=filename)
+
+    def read(**kwargs):
+        return lambda: io.read_segment(delimiter='\t', timecolumn=0,
+                                       **kwargs)
+
+    cases = [
+        ('genfromtxt', read(method='genfromtxt')),
+        ('csv', read(method='csv')),
+        ('homemade', read(method='homemade')),
+        ('fast', read(method='fast')),
+        ('fast, 2 columns', read(method='fast', usecols=[1, 2])),
+        ('fast, parallel', read(method='fast', parallel=True)),
+    ]
+    print('%d lines, %d columns, %.1f MB' %
+          (shape + (os.path.getsize(filename) / 2 ** 20,)))
+    try:
+        for label, func in cases:
+            best = min(timeit.repeat(func, number=1, repeat=repeat))
+            print('%-18s %8.1f ms' % (label, best * 1e3))
+    finally:
+        os.remove(filename)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark of the construction throughput of Neo data objects, comparing
+the standard constructors with the trusted construction path used by the
+IO readers (``from_trusted_array``).
+
+Run with:
+    python examples/benchmark_construction.py
+"""
+from __future__ import division, print_function
+
+import timeit
+
+import numpy as np
+import quantities as pq
+
+import neo
+
+
+def main(n_objects=2000, n_samples=100, repeat=5):
+    times = [np.sort(np.random.uniform(0, 10, n_samples))
+             for _ in range(n_objects)]
+    labels = np.array(['a'] * n_samples, dtype='S')
+    rate = 1 * pq.kHz
+
+    cases = [
+        ('SpikeTrain',
+         lambda: [neo.SpikeTrain(t, units='s', t_stop=10.0, name='x')
+                  for t in times],
+         lambda: [neo.SpikeTrain.from_trusted_array(t, units='s',
+                                                    t_stop=10.0, name='x')
+                  for t in times]),
+        ('AnalogSignal',
+         lambda: [neo.AnalogSignal(t, units='mV', sampling_rate=rate,
+                                   name='x')
+                  for t in times],
+         lambda: [neo.AnalogSignal.from_trusted_array(t, units='mV',
+                                                      sampling_rate=rate,
+                                                      name='x')
+                  for t in times]),
+        ('Event',
+         lambda: [neo.Event(t, labels=labels, units='s', name='x')
+                  for t in times],
+         lambda: [neo.Event.from_trusted_array(t, labels=labels, units='s',
+                                               name='x')
+                  for t in times]),
+        ('Epoch',
+         lambda: [neo.Epoch(t, durations=t * pq.ms, labels=labels,
+                            units='s', name='x')
+                  for t in times],
+         lambda: [neo.Epoch.from_trusted_array(t, durations=t * pq.ms,
+                                               labels=labels, units='s',
+                                               name='x')
+                  for t in times]),
+    ]
+    print('%-14s %14s %14s' % ('', 'constructor', 'trusted'))
+    for label, standard, trusted in cases:
+        rates = []
+        for func in (standard, trusted):
+            best = min(timeit.repeat(func, number=1, repeat=repeat))
+            rates.append(n_objects / best)
+        print('%-14s %10.0f / s %10.0f / s' % (label, rates[0], rates[1]))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark of :meth:`IrregularlySampledSignal.resample` onto a regular time
+base, compared with calling :func:`numpy.interp` channel by channel on the
+raw arrays.
+
+Run with:
+    python examples/benchmark_resampling.py
+"""
+from __future__ import division, print_function
+
+import timeit
+
+import numpy as np
+import quantities as pq
+
+import neo
+
+
+def make_signal(n_samples=1000000, n_channels=8):
+    times = np.cumsum(np.random.uniform(0.5, 1.5, n_samples))
+    return neo.IrregularlySampledSignal(times, np.random.randn(n_samples,
+                                                               n_channels),
+                                        units='cm', time_units='ms')
+
+
+def per_channel(signal, at):
+    times = signal.times.magnitude
+    values = signal.magnitude
+    return np.column_stack([np.interp(at, times, values[:, i])
+                            for i in range(values.shape[1])])
+
+
+def main(repeat=3):
+    signal = make_signal()
+    rate = 1 * pq.kHz
+    at = signal.t_start.magnitude + np.arange(
+        int(signal.duration.magnitude) + 1)
+    cases = [
+        ('np.interp per channel', lambda: per_channel(signal, at)),
+        ('resample (linear)', lambda: signal.resample(rate, 'linear')),
+        ('resample (step)', lambda: signal.resample(rate)),
+        ('mean (linear)', lambda: signal.mean('linear')),
+    ]
+    print('%d samples, %d channels' % signal.shape)
+    for label, func in cases:
+        best = min(timeit.repeat(func, number=1, repeat=repeat))
+        print('%-24s %8.1f ms' % (label, best * 1e3))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""
+Micro-benchmark of the cost of slicing :class:`AnalogSignal` and
+:class:`SpikeTrain` objects.
+
+Every slice or view of a Neo data object goes through
+``__array_finalize__``, so for small slices taken in a tight loop the
+time is dominated by copying the metadata over rather than by NumPy.
+
+Run with:
+    python examples/benchmark_slicing.py
+"""
+from __future__ import division, print_function
+
+import timeit
+
+import numpy as np
+import quantities as pq
+
+import neo
+
+
+def make_objects(n_samples=100000, n_channels=4, n_spikes=10000):
+    signal = neo.AnalogSignal(np.random.randn(n_samples, n_channels),
+                              units='mV', sampling_rate=1*pq.kHz,
+                              name='signal', description='benchmark',
+                              file_origin='none', foo='bar')
+    train = neo.SpikeTrain(np.sort(np.random.uniform(0, 100, n_spikes)),
+                           units='s', t_stop=100*pq.s, name='train',
+                           description='benchmark', file_origin='none',
+                           waveforms=np.zeros((n_spikes, 1, 8))*pq.mV,
+                           foo='bar')
+    return signal, train
+
+
+def main(number=20000, repeat=5):
+    signal, train = make_objects()
+    cases = [
+        # slices not starting at 0 also pay for recomputing t_start
+        ('AnalogSignal[:10]', lambda: signal[:10]),
+        ('AnalogSignal.view()', lambda: signal.view()),
+        ('SpikeTrain[:10]', lambda: train[:10]),
+        ('SpikeTrain.view()', lambda: train.view()),
+    ]
+    for label, func in cases:
+        best = min(timeit.repeat(func, number=number, repeat=repeat))
+        print('%-24s %8.2f us per call' % (label, best / number * 1e6))
+
+
+if __name__ == '__main__':
+    main()
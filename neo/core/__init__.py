@@ -23,6 +23,10 @@ Classes:
 
 .. autoclass:: SpikeTrain
 
+Functions:
+
+.. autofunction:: concatenate_signals
+
 """
 
 # needed for python 3 compatibility
@@ -33,7 +37,7 @@ from neo.core.segment import Segment
 from neo.core.channelindex import ChannelIndex
 from neo.core.unit import Unit
 
-from neo.core.analogsignal import AnalogSignal
+from neo.core.analogsignal import AnalogSignal, concatenate_signals
 from neo.core.irregularlysampledsignal import IrregularlySampledSignal
 
 from neo.core.event import Event
@@ -24,7 +24,8 @@ import logging
 import numpy as np
 import quantities as pq
 
-from neo.core.baseneo import BaseNeo, MergeError, merge_annotations
+from neo.core.baseneo import (BaseNeo, MergeError, merge_annotations,
+                              merge_many_annotations)
 from neo.core.channelindex import ChannelIndex
 
 logger = logging.getLogger("Neo")
@@ -147,6 +148,11 @@ class AnalogSignal(BaseNeo, pq.Quantity):
     *Operations available on this object*:
         == != + * /
 
+    *Trusted construction*:
+        IO readers whose data are already validated can use
+        :meth:`from_trusted_array`, which skips the checks and the copy
+        done by the constructor.
+
     '''
 
     _single_parent_objects = ('Segment', 'ChannelIndex')
@@ -155,6 +161,10 @@ class AnalogSignal(BaseNeo, pq.Quantity):
                         ('sampling_rate', pq.Quantity, 0),
                         ('t_start', pq.Quantity, 0))
     _recommended_attrs = BaseNeo._recommended_attrs
+    # the attributes that views and slices take over in __array_finalize__
+    _finalize_attrs = ('_t_start', '_sampling_rate', 'annotations', 'name',
+                       'file_origin', 'description', 'segment',
+                       'channel_index')
 
     def __new__(cls, signal, units=None, dtype=None, copy=True,
                 t_start=0 * pq.s, sampling_rate=None, sampling_period=None,
@@ -208,16 +218,56 @@ class AnalogSignal(BaseNeo, pq.Quantity):
         BaseNeo.__init__(self, name=name, file_origin=file_origin,
                          description=description, **annotations)
 
+    @classmethod
+    def from_trusted_array(cls, signal, units=None, t_start=0 * pq.s,
+                           sampling_rate=None, sampling_period=None,
+                           name=None, file_origin=None, description=None,
+                           **annotations):
+        '''
+        Construct an :class:`AnalogSignal` from data that is already known to
+        be valid, as produced by the IO readers.
+
+        :attr:`signal` is a 1D or 2D array (or :class:`~quantities.Quantity`)
+        that is already in :attr:`units` and is used as it is, without
+        copying.  :attr:`t_start` and :attr:`sampling_rate` (or
+        :attr:`sampling_period`) must be quantities.
+
+        Unlike the constructor, this does not rescale the signal, does not
+        check that the sampling rate and period are consistent and does not
+        check that the annotations are valid.
+        '''
+        if units is None:
+            try:
+                units = signal.units
+            except AttributeError:
+                raise ValueError("Units must be specified")
+
+        obj = np.asarray(signal).view(cls)
+        if obj.ndim == 1:
+            obj.shape = (-1, 1)
+        obj._dimensionality = pq.quantity.validate_dimensionality(units)
+        obj._t_start = t_start
+        if sampling_rate is None:
+            sampling_rate = 1.0 / sampling_period
+        obj._sampling_rate = sampling_rate
+        obj.annotations = annotations
+        obj.name = name
+        obj.file_origin = file_origin
+        obj.description = description
+        return obj
+
     def __reduce__(self):
         '''
         Map the __new__ function onto _new_AnalogSignalArray, so that pickle
         works
+
+        The data is neither copied when pickling nor when unpickling.
         '''
         return _new_AnalogSignalArray, (self.__class__,
-                                        np.array(self),
+                                        self.view(np.ndarray),
                                         self.units,
                                         self.dtype,
-                                        True,
+                                        False,
                                         self.t_start,
                                         self.sampling_rate,
                                         self.sampling_period,
@@ -239,10 +289,22 @@ class AnalogSignal(BaseNeo, pq.Quantity):
         constructor, and these are set in __new__. Then they are just
         copied over here.
         '''
+        if isinstance(obj, AnalogSignal):
+            # Views and slices take over the attributes listed in
+            # _finalize_attrs from the original object in one step rather
+            # than one by one. Rebinding an attribute on either object
+            # afterwards does not affect the other.
+            attrs = obj.__dict__
+            self.__dict__.update([(name, attrs[name])
+                                  for name in self._finalize_attrs
+                                  if name in attrs])
+            super(AnalogSignal, self).__array_finalize__(obj)
+            return
+
         super(AnalogSignal, self).__array_finalize__(obj)
         self._t_start = getattr(obj, '_t_start', 0 * pq.s)
         self._sampling_rate = getattr(obj, '_sampling_rate', None)
-       
+
         # The additional arguments
         self.annotations = getattr(obj, 'annotations', {})
 
@@ -561,13 +623,20 @@ class AnalogSignal(BaseNeo, pq.Quantity):
             _pp(line)
 
 
-    def time_slice(self, t_start, t_stop):
+    def time_slice(self, t_start, t_stop, copy=True):
         '''
         Creates a new AnalogSignal corresponding to the time slice of the
         original AnalogSignal between times t_start, t_stop. Note, that for
         numerical stability reasons if t_start, t_stop do not fall exactly on
         the time bins defined by the sampling_period they will be rounded to
         the nearest sampling bins.
+
+        By default the data of the slice is a copy. If `copy` is False, the
+        slice is a view on the original data, obtained by basic slicing
+        without allocating a new array: modifying the values of one modifies
+        the other, and the original array is kept in memory as long as the
+        view exists. The metadata (annotations, parents...) are shared the
+        same way in both cases.
         '''
 
         # checking start time and transforming to start index
@@ -590,13 +659,58 @@ class AnalogSignal(BaseNeo, pq.Quantity):
             raise ValueError('t_start, t_stop have to be withing the analog \
                               signal duration')
 
-        # we're going to send the list of indicies so that we get *copy* of the
-        # sliced data
-        obj = super(AnalogSignal, self).__getitem__(np.arange(i, j, 1))
+        if copy:
+            # we're going to send the list of indicies so that we get *copy*
+            # of the sliced data
+            obj = super(AnalogSignal, self).__getitem__(np.arange(i, j, 1))
+        else:
+            obj = super(AnalogSignal, self).__getitem__(slice(i, j))
         obj.t_start = self.t_start + i * self.sampling_period
 
         return obj
 
+    def time_slices(self, times, durations=None):
+        '''
+        Extract many windows of the same length at once and return them as
+        a 3D :class:`~quantities.Quantity` of shape
+        (number of windows, samples per window, channels).
+
+        `times` are the starts of the windows (quantity array 1D), or an
+        :class:`Epoch`, in which case `durations` defaults to the durations
+        of the epoch. `durations` is a quantity scalar or a quantity array
+        with one value per window; all windows must contain the same number
+        of samples. As in :meth:`time_slice`, times are rounded to the
+        nearest sampling bins.
+
+        The indices are computed once for all windows and the data is
+        extracted with a single gather, so the result is a copy.
+        '''
+        if durations is None:
+            durations = getattr(times, 'durations', None)
+            if durations is None:
+                raise ValueError('durations must be specified')
+
+        units = self.sampling_period.units
+        period = self.sampling_period.magnitude
+        starts = np.atleast_1d(times.rescale(units).magnitude)
+        lengths = np.atleast_1d(durations.rescale(units).magnitude)
+
+        i = np.rint((starts - self.t_start.rescale(units).magnitude) /
+                    period).astype(np.intp)
+        n = np.unique(np.rint(lengths / period).astype(np.intp))
+        if n.size > 1:
+            raise ValueError('all windows must have the same number of '
+                             'samples')
+        n = int(n[0]) if n.size else 0
+
+        if i.size and ((i.min() < 0) or (i.max() + n > len(self))):
+            raise ValueError('windows have to be within the analog signal '
+                             'duration')
+
+        index = i[:, np.newaxis] + np.arange(n)
+        return pq.Quantity(self.magnitude[index], units=self.units,
+                           copy=False)
+
     def merge(self, other):
         '''
         Merge another :class:`AnalogSignal` into this one.
@@ -606,53 +720,11 @@ class AnalogSignal(BaseNeo, pq.Quantity):
 
         If the attributes of the two :class:`AnalogSignal` are not
         compatible, an Exception is raised.
-        '''
-        if self.sampling_rate != other.sampling_rate:
-            raise MergeError("Cannot merge, different sampling rates")
-        if self.t_start != other.t_start:
-            raise MergeError("Cannot merge, different t_start")
-        if self.segment != other.segment:
-            raise MergeError("Cannot merge these two signals as they belong to different segments.")
-        if hasattr(self, "lazy_shape"):
-            if hasattr(other, "lazy_shape"):
-                if self.lazy_shape[0] != other.lazy_shape[0]:
-                    raise MergeError("Cannot merge signals of different length.")
-                merged_lazy_shape = (self.lazy_shape[0], self.lazy_shape[1] + other.lazy_shape[1])
-            else:
-                raise MergeError("Cannot merge a lazy object with a real object.")
-        if other.units != self.units:
-            other = other.rescale(self.units)
-        stack = np.hstack(map(np.array, (self, other)))
-        kwargs = {}
-        for name in ("name", "description", "file_origin"):
-            attr_self = getattr(self, name)
-            attr_other = getattr(other, name)
-            if attr_self == attr_other:
-                kwargs[name] = attr_self
-            else:
-                kwargs[name] = "merge(%s, %s)" % (attr_self, attr_other)
-        merged_annotations = merge_annotations(self.annotations,
-                                               other.annotations)
-        kwargs.update(merged_annotations)
-        signal = AnalogSignal(stack, units=self.units, dtype=self.dtype,
-                              copy=False, t_start=self.t_start,
-                              sampling_rate=self.sampling_rate,
-                              **kwargs)
-        signal.segment = self.segment
-        # merge channel_index (move to ChannelIndex.merge()?)
-        if self.channel_index and other.channel_index:
-            signal.channel_index = ChannelIndex(
-                    index=np.arange(signal.shape[1]),
-                    channel_ids=np.hstack([self.channel_index.channel_ids,
-                                           other.channel_index.channel_ids]),
-                    channel_names=np.hstack([self.channel_index.channel_names,
-                                             other.channel_index.channel_names]))
-        else:
-            signal.channel_index = ChannelIndex(index=np.arange(signal.shape[1]))
 
-        if hasattr(self, "lazy_shape"):
-            signal.lazy_shape = merged_lazy_shape
-        return signal
+        To merge more than two signals, use :func:`concatenate_signals`,
+        which copies each of them only once.
+        '''
+        return concatenate_signals([self, other], axis='channels')
 
     def as_array(self, units=None):
         """
@@ -670,3 +742,149 @@ class AnalogSignal(BaseNeo, pq.Quantity):
         Return the signal as a quantities array.
         """
         return self.view(pq.Quantity)
+
+
+def _merged_attr(values):
+    '''
+    Merge the values of a universally recommended attribute, as done by
+    :meth:`AnalogSignal.merge`.
+    '''
+    if all(value == values[0] for value in values[1:]):
+        return values[0]
+    return "merge(%s)" % ", ".join(str(value) for value in values)
+
+
+def concatenate_signals(signals, axis='channels'):
+    '''
+    Concatenate several :class:`AnalogSignal` objects into a new one.
+
+    If `axis` is 'channels' (default), the signals are put side by side
+    (column-wise), as done by :meth:`AnalogSignal.merge`.  They must have
+    the same sampling rate, t_start, length and segment.
+
+    If `axis` is 'time', the signals are put one after the other.  They must
+    have the same sampling rate and number of channels, and each signal must
+    start where the previous one stops (to within half a sampling period).
+
+    The compatibility of the signals is checked once, the output array is
+    allocated once and each signal is copied into it exactly once, in the
+    units of the first signal.  Names, descriptions and file origins are
+    merged as in :meth:`AnalogSignal.merge` and annotations with
+    :func:`merge_many_annotations`.  If the signals are not compatible, a
+    :class:`MergeError` is raised.
+    '''
+    signals = list(signals)
+    if not signals:
+        raise ValueError("No signals to concatenate")
+    if axis not in ('channels', 'time'):
+        raise ValueError("axis must be 'channels' or 'time', not %r" % axis)
+    first = signals[0]
+    sampling_rate = first.sampling_rate
+
+    lazy = [hasattr(sig, "lazy_shape") for sig in signals]
+    if any(lazy) and not all(lazy):
+        raise MergeError("Cannot merge a lazy object with a real object.")
+    if all(lazy):
+        shapes = [sig.lazy_shape for sig in signals]
+    else:
+        shapes = [sig.shape for sig in signals]
+
+    for sig in signals[1:]:
+        if sig.sampling_rate != sampling_rate:
+            raise MergeError("Cannot merge, different sampling rates")
+
+    if axis == 'channels':
+        for sig, shape in zip(signals[1:], shapes[1:]):
+            if sig.t_start != first.t_start:
+                raise MergeError("Cannot merge, different t_start")
+            if sig.segment is not first.segment:
+                raise MergeError("Cannot merge these signals as they belong "
+                                 "to different segments.")
+            if shape[0] != shapes[0][0]:
+                raise MergeError("Cannot merge signals of different length.")
+        segment = first.segment
+    else:
+        t_units = first.t_start.units
+        period = float(first.sampling_period.rescale(t_units).magnitude)
+        t_stop = float(first.t_start.magnitude)
+        for sig, shape in zip(signals, shapes):
+            if shape[1] != shapes[0][1]:
+                raise MergeError("Cannot merge signals with different "
+                                 "numbers of channels.")
+            t_start = float(sig.t_start.rescale(t_units).magnitude)
+            if abs(t_start - t_stop) > period / 2:
+                raise MergeError("Cannot concatenate, the signals are not "
+                                 "contiguous in time.")
+            t_stop = t_start + shape[0] * period
+        if all(sig.segment is first.segment for sig in signals):
+            segment = first.segment
+        else:
+            segment = None
+
+    # copy each signal once into the preallocated output
+    units = first.units
+    dim = first.dimensionality
+    factors = []
+    for sig in signals:
+        if sig.dimensionality == dim:
+            factors.append(1.0)
+        else:
+            factors.append(float(pq.Quantity(1.0, sig.dimensionality
+                                             ).rescale(units).magnitude))
+    dtype = np.result_type(*[sig.dtype for sig in signals])
+    if any(factor != 1.0 for factor in factors):
+        dtype = np.result_type(dtype, float)
+    if axis == 'channels':
+        out = np.empty((first.shape[0], sum(sig.shape[1] for sig in signals)),
+                       dtype=dtype)
+        view = lambda i, j: out[:, i:j]
+        sizes = [sig.shape[1] for sig in signals]
+    else:
+        out = np.empty((sum(sig.shape[0] for sig in signals), first.shape[1]),
+                       dtype=dtype)
+        view = lambda i, j: out[i:j]
+        sizes = [sig.shape[0] for sig in signals]
+    i = 0
+    for sig, factor, size in zip(signals, factors, sizes):
+        target = view(i, i + size)
+        target[...] = sig.magnitude
+        if factor != 1.0:
+            target *= factor
+        i += size
+
+    kwargs = {}
+    for name in ("name", "description", "file_origin"):
+        kwargs[name] = _merged_attr([getattr(sig, name) for sig in signals])
+    kwargs.update(merge_many_annotations([sig.annotations
+                                          for sig in signals]))
+    signal = AnalogSignal.from_trusted_array(out, units=units,
+                                             t_start=first.t_start,
+                                             sampling_rate=sampling_rate,
+                                             **kwargs)
+    signal.segment = segment
+
+    if axis == 'channels':
+        # merge channel_index (move to ChannelIndex.merge()?)
+        if all(sig.channel_index for sig in signals):
+            signal.channel_index = ChannelIndex(
+                index=np.arange(signal.shape[1]),
+                channel_ids=np.concatenate(
+                    [sig.channel_index.channel_ids for sig in signals]),
+                channel_names=np.concatenate(
+                    [sig.channel_index.channel_names for sig in signals]))
+        else:
+            signal.channel_index = ChannelIndex(
+                index=np.arange(signal.shape[1]))
+        if all(lazy):
+            signal.lazy_shape = (shapes[0][0],
+                                 sum(shape[1] for shape in shapes))
+    else:
+        if all(sig.channel_index is first.channel_index for sig in signals):
+            signal.channel_index = first.channel_index
+        else:
+            signal.channel_index = ChannelIndex(
+                index=np.arange(signal.shape[1]))
+        if all(lazy):
+            signal.lazy_shape = (sum(shape[0] for shape in shapes),
+                                 shapes[0][1])
+    return signal
@@ -9,6 +9,7 @@ from __future__ import absolute_import, division, print_function
 
 from datetime import datetime, date, time, timedelta
 from decimal import Decimal
+from functools import reduce
 import logging
 from numbers import Number
 
@@ -120,6 +121,157 @@ def merge_annotations(A, B):
     return merged
 
 
+def merge_many_annotations(annotations_list):
+    """
+    Merge several sets of annotations at once.
+
+    The rules are those of :func:`merge_annotations` applied from left to
+    right, but the arrays and lists found under the same key are
+    concatenated in a single step rather than one pair at a time.
+    """
+    values = {}
+    names = []
+    for annotations in annotations_list:
+        for name, value in annotations.items():
+            if name not in values:
+                values[name] = []
+                names.append(name)
+            values[name].append(value)
+
+    merged = {}
+    for name in names:
+        items = values[name]
+        first = items[0]
+        try:
+            for item in items[1:]:
+                assert type(item) == type(first), \
+                    'type(%s) %s != type(%s) %s' % (first, type(first),
+                                                    item, type(item))
+            if len(items) == 1:
+                merged[name] = first
+            elif isinstance(first, np.ndarray):
+                merged[name] = np.concatenate([np.ravel(item)
+                                               for item in items])
+            elif isinstance(first, list):
+                merged[name] = [elem for item in items for elem in item]
+            else:
+                merged[name] = reduce(merge_annotation, items)
+        except BaseException:
+            merged[name] = "MERGE CONFLICT"  # as in merge_annotations
+    logger.debug("Merging annotations: %s merged=%s", annotations_list,
+                 merged)
+    return merged
+
+
+def _time_magnitude(value, dimensionality, default):
+    """
+    Return the time `value` as a magnitude in `dimensionality`, to compare
+    it with the raw times of a data object.
+
+    Plain numbers are taken to be in `dimensionality` already (as when
+    comparing them with a quantity array), and None gives `default`.
+    """
+    if value is None:
+        return default
+    if hasattr(value, 'dimensionality'):
+        if value.dimensionality != dimensionality:
+            value = value.rescale(dimensionality)
+        return value.magnitude
+    return value
+
+
+def _sorted_slice(times, start, stop):
+    """
+    Return the slice of the sorted array `times` with the values between
+    (and including) `start` and `stop`, found by binary search.
+    """
+    return slice(np.searchsorted(times, start, 'left'),
+                 np.searchsorted(times, stop, 'right'))
+
+
+class _SortedTimes(object):
+    """
+    Mixin for the data objects which remember in `_sorted` whether their
+    times are in increasing order, or None if this is not known yet.
+
+    `_sorted` is reset by item assignment and by the in-place operators and
+    methods of the object itself, but not when the times are modified
+    through another array sharing them, such as a view. Objects whose times
+    are not the array itself override :meth:`_ordered_times`, and reset
+    `_sorted` when the times are replaced.
+    """
+
+    def __setitem__(self, i, value):
+        """
+        Set the value the item or slice :attr:`i`.
+        """
+        self._sorted = None
+        super(_SortedTimes, self).__setitem__(i, value)
+
+    def __iadd__(self, other):
+        self._sorted = None
+        return super(_SortedTimes, self).__iadd__(other)
+
+    def __isub__(self, other):
+        self._sorted = None
+        return super(_SortedTimes, self).__isub__(other)
+
+    def __imul__(self, other):
+        self._sorted = None
+        return super(_SortedTimes, self).__imul__(other)
+
+    def __idiv__(self, other):
+        self._sorted = None
+        return super(_SortedTimes, self).__idiv__(other)
+
+    def __itruediv__(self, other):
+        self._sorted = None
+        return super(_SortedTimes, self).__itruediv__(other)
+
+    def __ifloordiv__(self, other):
+        self._sorted = None
+        return super(_SortedTimes, self).__ifloordiv__(other)
+
+    def __imod__(self, other):
+        self._sorted = None
+        return super(_SortedTimes, self).__imod__(other)
+
+    def __ipow__(self, other):
+        self._sorted = None
+        return super(_SortedTimes, self).__ipow__(other)
+
+    def sort(self, *args, **kwargs):
+        self._sorted = None
+        super(_SortedTimes, self).sort(*args, **kwargs)
+
+    def fill(self, value):
+        self._sorted = None
+        super(_SortedTimes, self).fill(value)
+
+    def put(self, *args, **kwargs):
+        self._sorted = None
+        super(_SortedTimes, self).put(*args, **kwargs)
+
+    def itemset(self, *args):
+        self._sorted = None
+        super(_SortedTimes, self).itemset(*args)
+
+    def _ordered_times(self):
+        """
+        The magnitude of the times whose order is remembered.
+        """
+        return self.magnitude
+
+    def _is_sorted(self):
+        """
+        Whether the times are in increasing order.
+        """
+        if self._sorted is None:
+            times = self._ordered_times()
+            self._sorted = bool((times[1:] >= times[:-1]).all())
+        return self._sorted
+
+
 def _reference_name(class_name):
     """
     Given the name of a class, return an attribute name to be used for
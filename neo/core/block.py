@@ -13,7 +13,9 @@ from __future__ import absolute_import, division, print_function
 
 from datetime import datetime
 
-from neo.core.container import Container, unique_objs
+from neo.core.container import Container
+from neo.core.channelindex import ChannelIndex
+from neo.core.unit import Unit
 
 
 class Block(Container):
@@ -99,34 +101,65 @@ class Block(Container):
         self.rec_datetime = rec_datetime
         self.index = index
 
-    @property
-    def data_children_recur(self):
-        '''
-        All data child objects stored in the current object,
-        obtained recursively.
-        '''
-        # subclassing this to remove duplicate objects such as SpikeTrain
-        # objects in both Segment and Unit
-        # Only Block can have duplicate items right now, so implement
-        # this here for performance reasons.
-        return tuple(unique_objs(super(Block, self).data_children_recur))
-
-    def list_children_by_class(self, cls):
-        '''
-        List all children of a particular class recursively.
-
-        You can either provide a class object, a class name,
-        or the name of the container storing the class.
-        '''
-        # subclassing this to remove duplicate objects such as SpikeTrain
-        # objects in both Segment and Unit
-        # Only Block can have duplicate items right now, so implement
-        # this here for performance reasons.
-        return unique_objs(super(Block, self).list_children_by_class(cls))
-
     @property
     def list_units(self):
         '''
         Return a list of all :class:`Unit` objects in the :class:`Block`.
         '''
         return self.list_children_by_class('unit')
+
+    def time_slice(self, t_start=None, t_stop=None):
+        '''
+        Return a new :class:`Block` containing the time slices of all of the
+        :class:`Segment` objects of the current one between :attr:`t_start`
+        and :attr:`t_stop`, as returned by :meth:`Segment.time_slice`.
+        Either parameter can be None to use infinite endpoints for the time
+        interval.
+
+        The :class:`ChannelIndex` and :class:`Unit` objects are copied, and
+        hold the sliced children in place of the original ones.  Children
+        that are not in any :class:`Segment` are left out.
+        '''
+        blk = Block(name=self.name, description=self.description,
+                    file_origin=self.file_origin,
+                    file_datetime=self.file_datetime,
+                    rec_datetime=self.rec_datetime, index=self.index,
+                    **self.annotations)
+
+        sliced = {}
+        for seg in self.segments:
+            new_seg = seg.time_slice(t_start, t_stop)
+            blk.segments.append(new_seg)
+            for attr in seg._data_child_containers:
+                for obj, new in zip(getattr(seg, attr),
+                                    getattr(new_seg, attr)):
+                    sliced[id(obj)] = new
+
+        def take_sliced(objs):
+            return [sliced[id(obj)] for obj in objs if id(obj) in sliced]
+
+        for chx in self.channel_indexes:
+            new_chx = ChannelIndex(index=chx.index,
+                                   channel_names=chx.channel_names,
+                                   channel_ids=chx.channel_ids,
+                                   name=chx.name,
+                                   description=chx.description,
+                                   file_origin=chx.file_origin,
+                                   coordinates=chx.coordinates,
+                                   **chx.annotations)
+            for attr in chx._data_child_containers:
+                setattr(new_chx, attr, take_sliced(getattr(chx, attr)))
+            for unit in chx.units:
+                new_unit = Unit(name=unit.name, description=unit.description,
+                                file_origin=unit.file_origin,
+                                **unit.annotations)
+                new_unit.spiketrains = take_sliced(unit.spiketrains)
+                new_chx.units.append(new_unit)
+            blk.channel_indexes.append(new_chx)
+
+        # the slices still point to the parents of the original objects
+        for new in sliced.values():
+            for parent in new._single_parent_containers:
+                setattr(new, parent, None)
+        blk.create_many_to_one_relationship()
+        return blk
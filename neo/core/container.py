@@ -10,6 +10,8 @@ defined in :module:`neo.core.analogsignalarray`.
 # needed for python 3 compatibility
 from __future__ import absolute_import, division, print_function
 
+from itertools import chain
+
 from neo.core.baseneo import BaseNeo, _reference_name, _container_name
 
 
@@ -23,7 +25,73 @@ def unique_objs(objs):
             if id(obj) not in seen and not seen.add(id(obj))]
 
 
-def filterdata(data, targdict=None, objects=None, **kwargs):
+def _matches(obj, key, value):
+    """
+    Return True if the attribute or the annotation key of obj equals value.
+    """
+    if hasattr(obj, key) and getattr(obj, key) == value:
+        return True
+    return key in obj.annotations and obj.annotations[key] == value
+
+
+class _FilterIndex(object):
+    """
+    Inverted index from (key, value) to the objects in data having this
+    value as attribute or annotation, built one key at a time on the first
+    query for that key.
+
+    Objects whose value is not hashable are kept apart and checked
+    on each query.
+    """
+
+    def __init__(self, data):
+        self.data = data
+        self._keys = {}
+
+    def _build(self, key):
+        lookup = {}
+        unhashable = []
+        for obj in self.data:
+            values = []
+            if hasattr(obj, key):
+                values.append(getattr(obj, key))
+            if key in obj.annotations:
+                values.append(obj.annotations[key])
+            for val in values:
+                try:
+                    objs = lookup.setdefault(val, [])
+                except TypeError:
+                    if not unhashable or unhashable[-1] is not obj:
+                        unhashable.append(obj)
+                    continue
+                if not objs or objs[-1] is not obj:
+                    objs.append(obj)
+        self._keys[key] = (lookup, unhashable)
+
+    def lookup(self, key, value):
+        """
+        Return the objects matching key=value, or None if value cannot be
+        looked up in the index.
+        """
+        try:
+            hash(value)
+        except TypeError:
+            return None
+        if key not in self._keys:
+            self._build(key)
+        lookup, unhashable = self._keys[key]
+        matches = lookup.get(value, [])
+        if unhashable:
+            extra = set(id(obj) for obj in unhashable
+                        if _matches(obj, key, value))
+            if extra:
+                extra.update(id(obj) for obj in matches)
+                matches = [obj for obj in self.data if id(obj) in extra]
+        return matches
+
+
+def filterdata(data, targdict=None, objects=None, filter_index=None,
+               **kwargs):
     """
     Return a list of the objects in data matching *any* of the search terms
     in either their attributes or annotations.  Search terms can be
@@ -37,6 +105,9 @@ def filterdata(data, targdict=None, objects=None, **kwargs):
     objects (optional) should be the name of a Neo object type,
     a neo object class, or a list of one or both of these.  If specified,
     only these objects will be returned.
+
+    filter_index (optional) is a :class:`_FilterIndex` built on data, used
+    to look up the first set of search terms.
     """
 
     # if objects are specified, get the classes
@@ -63,20 +134,24 @@ def filterdata(data, targdict=None, objects=None, **kwargs):
     if not hasattr(targdict, 'keys'):
         # for performance reasons, only do the object filtering on the first
         # iteration
-        results = filterdata(data, targdict=targdict[0], objects=objects)
+        results = filterdata(data, targdict=targdict[0], objects=objects,
+                             filter_index=filter_index)
         for targ in targdict[1:]:
             results = filterdata(results, targdict=targ)
         return results
 
     # do the actual filtering
     results = []
+    seen = set()
     for key, value in sorted(targdict.items()):
-        for obj in data:
-            if (hasattr(obj, key) and getattr(obj, key) == value and
-                    all([obj is not res for res in results])):
-                results.append(obj)
-            elif (key in obj.annotations and obj.annotations[key] == value and
-                    all([obj is not res for res in results])):
+        matches = None
+        if filter_index is not None:
+            matches = filter_index.lookup(key, value)
+        if matches is None:
+            matches = [obj for obj in data if _matches(obj, key, value)]
+        for obj in matches:
+            if id(obj) not in seen:
+                seen.add(id(obj))
                 results.append(obj)
 
     # keep only objects of the correct classes
@@ -163,12 +238,20 @@ class Container(BaseNeo):
                          the current object or any of its children,
                          any of its children's children, etc.
 
+    The properties above return tuples; all of them are built on
+    :iter_children:, which walks the hierarchy lazily.
+
     The following "universal" methods are available
     (in  addition to those of BaseNeo):
         :size: A dictionary where each key is an attribute storing child
                objects and the value is the number of objects stored in that
                attribute.
 
+        :iter_children(**args): Iterates over the children of the current
+                                object, optionally recursively and only
+                                for a particular class, each object
+                                being returned once.
+
         :filter(**args): Retrieves children of the current object that
                          have particular properties.
 
@@ -286,23 +369,101 @@ class Container(BaseNeo):
         """
         return self._single_child_containers + self._multi_child_containers
 
+    def _iter_containers(self, containers):
+        """
+        Iterate over the objects stored in the given container attributes.
+        """
+        return chain.from_iterable(getattr(self, attr) for attr in containers)
+
+    def _iter_container_children(self):
+        """
+        Iterate over the container child objects, not recursively.
+        """
+        return self._iter_containers(self._container_child_containers +
+                                     self._multi_child_containers)
+
+    def _iter_data_children_recur(self):
+        """
+        Iterate recursively over the data child objects,
+        without removing duplicates.
+        """
+        return chain(self._iter_containers(self._data_child_containers),
+                     chain.from_iterable(
+                         child._iter_data_children_recur()
+                         for child in self._iter_container_children()))
+
+    def _iter_container_children_recur(self):
+        """
+        Iterate recursively over the container child objects,
+        without removing duplicates.
+        """
+        return chain(self._iter_container_children(),
+                     chain.from_iterable(
+                         child._iter_container_children_recur()
+                         for child in self._iter_container_children()))
+
+    def iter_children(self, data=True, container=True, recursive=True,
+                      cls=None):
+        """
+        Iterate over the child objects of the current object, data objects
+        first, then container objects.  Each object is only returned once,
+        even if it is reachable through several parents (for example a
+        :class:`SpikeTrain` stored in both a :class:`Segment` and a
+        :class:`Unit`).
+
+        If data is True (default), include data objects.
+        If container is True (default), include container objects.
+        If recursive is True (default), descend into child containers.
+
+        cls (optional) is a class object or a class name.  If specified,
+        only objects of this class are returned, and data and container
+        are ignored.
+        """
+        if cls is not None:
+            if not hasattr(cls, 'lower'):
+                cls = cls.__name__
+            container_name = _container_name(cls)
+            if recursive:
+                containers = self._iter_container_children_recur()
+            else:
+                containers = ()
+            objs = chain(getattr(self, container_name, []),
+                         chain.from_iterable(getattr(child, container_name, [])
+                                             for child in containers))
+        else:
+            objs = []
+            if data:
+                if recursive:
+                    objs.append(self._iter_data_children_recur())
+                else:
+                    objs.append(
+                        self._iter_containers(self._data_child_containers))
+            if container:
+                if recursive:
+                    objs.append(self._iter_container_children_recur())
+                else:
+                    objs.append(self._iter_container_children())
+            objs = chain.from_iterable(objs)
+
+        seen = set()
+        for obj in objs:
+            if id(obj) not in seen:
+                seen.add(id(obj))
+                yield obj
+
     @property
     def _single_children(self):
         """
         All child objects that can only have single parents.
         """
-        childs = [list(getattr(self, attr)) for attr in
-                  self._single_child_containers]
-        return tuple(sum(childs, []))
+        return tuple(self._iter_containers(self._single_child_containers))
 
     @property
     def _multi_children(self):
         """
         All child objects that can have multiple parents.
         """
-        childs = [list(getattr(self, attr)) for attr in
-                  self._multi_child_containers]
-        return tuple(sum(childs, []))
+        return tuple(self._iter_containers(self._multi_child_containers))
 
     @property
     def data_children(self):
@@ -310,9 +471,7 @@ class Container(BaseNeo):
         All data child objects stored in the current object.
         Not recursive.
         """
-        childs = [list(getattr(self, attr)) for attr in
-                  self._data_child_containers]
-        return tuple(sum(childs, []))
+        return tuple(self.iter_children(container=False, recursive=False))
 
     @property
     def container_children(self):
@@ -320,10 +479,7 @@ class Container(BaseNeo):
         All container child objects stored in the current object.
         Not recursive.
         """
-        childs = [list(getattr(self, attr)) for attr in
-                  self._container_child_containers +
-                  self._multi_child_containers]
-        return tuple(sum(childs, []))
+        return tuple(self.iter_children(data=False, recursive=False))
 
     @property
     def children(self):
@@ -331,7 +487,7 @@ class Container(BaseNeo):
         All child objects stored in the current object.
         Not recursive.
         """
-        return self.data_children + self.container_children
+        return tuple(self.iter_children(recursive=False))
 
     @property
     def data_children_recur(self):
@@ -339,9 +495,7 @@ class Container(BaseNeo):
         All data child objects stored in the current object,
         obtained recursively.
         """
-        childs = [list(child.data_children_recur) for child in
-                  self.container_children]
-        return self.data_children + tuple(sum(childs, []))
+        return tuple(self.iter_children(container=False))
 
     @property
     def container_children_recur(self):
@@ -349,9 +503,7 @@ class Container(BaseNeo):
         All container child objects stored in the current object,
         obtained recursively.
         """
-        childs = [list(child.container_children_recur) for child in
-                  self.container_children]
-        return self.container_children + tuple(sum(childs, []))
+        return tuple(self.iter_children(data=False))
 
     @property
     def children_recur(self):
@@ -359,7 +511,7 @@ class Container(BaseNeo):
         All child objects stored in the current object,
         obtained recursively.
         """
-        return self.data_children_recur + self.container_children_recur
+        return tuple(self.iter_children())
 
     @property
     def size(self):
@@ -371,7 +523,7 @@ class Container(BaseNeo):
                     for name in self._child_containers)
 
     def filter(self, targdict=None, data=True, container=False, recursive=True,
-               objects=None, **kwargs):
+               objects=None, use_index=False, **kwargs):
         """
         Return a list of child objects matching *any* of the search terms
         in either their attributes or annotations.  Search terms can be
@@ -392,6 +544,17 @@ class Container(BaseNeo):
         containers not in objects will still be descended into.
         This overrides data and container.
 
+        If use_index is True (default False), an index of the children by
+        attribute and annotation values is kept on this object and reused
+        by later calls with use_index=True, so that repeated queries cost
+        the number of matches and of child containers, not the number of
+        data children.  The index is rebuilt when children are added or
+        removed, or when a list of children is replaced.  Replacing a child
+        in place (``seg.spiketrains[0] = train``) or changing the attributes
+        or annotations of the children after the index has been built is
+        not seen, in that case call filter with use_index=False.  The index
+        is not pickled or copied.
+
 
         Examples::
 
@@ -402,21 +565,60 @@ class Container(BaseNeo):
             data = True
             container = True
 
-        children = []
         # get the objects we want
-        if data:
-            if recursive:
-                children.extend(self.data_children_recur)
-            else:
-                children.extend(self.data_children)
-        if container:
-            if recursive:
-                children.extend(self.container_children_recur)
-            else:
-                children.extend(self.container_children)
+        filter_index = None
+        if use_index:
+            filter_index = self._get_filter_index(data, container, recursive)
+            children = filter_index.data
+        else:
+            children = list(self.iter_children(data=data, container=container,
+                                               recursive=recursive))
 
         return filterdata(children, objects=objects,
-                          targdict=targdict, **kwargs)
+                          targdict=targdict, filter_index=filter_index,
+                          **kwargs)
+
+    def _child_lists(self, recursive=True):
+        """
+        The lists holding the children of the current object, and of its
+        descendants if recursive is True.
+        """
+        objs = [self]
+        if recursive:
+            objs = chain(objs, self._iter_container_children_recur())
+        return [getattr(obj, name) for obj in objs
+                for name in obj._child_containers]
+
+    def _get_filter_index(self, data, container, recursive):
+        """
+        Return the :class:`_FilterIndex` of the children for this kind of
+        query, building a new one if a list of children has been replaced
+        or has changed length since the last one was built.
+
+        Only the lists are checked, not the data children themselves.
+        """
+        kind = (data, container, recursive)
+        lists = self._child_lists(recursive=recursive)
+        lengths = [len(lst) for lst in lists]
+        indices = self.__dict__.setdefault('_filter_indices', {})
+        if kind in indices:
+            old_lists, old_lengths, filter_index = indices[kind]
+            if old_lengths == lengths and all(
+                    old is new for old, new in zip(old_lists, lists)):
+                return filter_index
+        filter_index = _FilterIndex(list(self.iter_children(
+            data=data, container=container, recursive=recursive)))
+        # the lists are kept so that they can be compared by identity
+        indices[kind] = (lists, lengths, filter_index)
+        return filter_index
+
+    def __getstate__(self):
+        """
+        The filter indices are not pickled or copied.
+        """
+        state = self.__dict__.copy()
+        state.pop('_filter_indices', None)
+        return state
 
     def list_children_by_class(self, cls):
         """
@@ -425,13 +627,49 @@ class Container(BaseNeo):
         You can either provide a class object, a class name,
         or the name of the container storing the class.
         """
-        if not hasattr(cls, 'lower'):
-            cls = cls.__name__
-        container_name = _container_name(cls)
-        objs = list(getattr(self, container_name, []))
-        for child in self.container_children_recur:
-            objs.extend(getattr(child, container_name, []))
-        return objs
+        return list(self.iter_children(cls=cls))
+
+    def _link_children(self, single=True, multi=True, force=False,
+                       append=True, recursive=True):
+        """
+        Create the parent relationships of the children of the current
+        object, and optionally of all of its descendants, in a single walk
+        over the tree.
+
+        Each container is visited only once.  Membership of the parent lists
+        of many-to-many children is tracked by identity in a set, so linking
+        does not get slower as the parent lists grow.
+        """
+        parents = [self]
+        if recursive:
+            parents = chain(parents, self.iter_children(data=False))
+        linked = {}
+        for parent in parents:
+            clsname = parent.__class__.__name__
+            if single:
+                parent_name = _reference_name(clsname)
+                for child in parent._iter_containers(
+                        parent._single_child_containers):
+                    if force or getattr(child, parent_name, False) is None:
+                        setattr(child, parent_name, parent)
+            if not multi:
+                continue
+            parent_name = _container_name(clsname)
+            for child in parent._iter_containers(
+                    parent._multi_child_containers):
+                if not hasattr(child, parent_name):
+                    continue
+                if not append:
+                    setattr(child, parent_name, [parent])
+                    continue
+                target = getattr(child, parent_name)
+                key = (id(child), parent_name)
+                known = linked.get(key)
+                if known is None:
+                    known = linked[key] = set(id(obj) for obj in target)
+                if id(parent) not in known:
+                    known.add(id(parent))
+                    target.append(parent)
 
     def create_many_to_one_relationship(self, force=False, recursive=True):
         """
@@ -450,15 +688,7 @@ class Container(BaseNeo):
         If recursive is True desecend into child objects and create
         relationships there
         """
-        parent_name = _reference_name(self.__class__.__name__)
-        for child in self._single_children:
-            if (hasattr(child, parent_name) and
-                    getattr(child, parent_name) is None or force):
-                setattr(child, parent_name, self)
-        if recursive:
-            for child in self.container_children:
-                child.create_many_to_one_relationship(force=force,
-                                                      recursive=True)
+        self._link_children(multi=False, force=force, recursive=recursive)
 
     def create_many_to_many_relationship(self, append=True, recursive=True):
         """
@@ -469,21 +699,7 @@ class Container(BaseNeo):
         If recursive is True desecend into child objects and create
         relationships there
         """
-        parent_name = _container_name(self.__class__.__name__)
-        for child in self._multi_children:
-            if not hasattr(child, parent_name):
-                continue
-            if append:
-                target = getattr(child, parent_name)
-                if not self in target:
-                    target.append(self)
-                continue
-            setattr(child, parent_name, [self])
-
-        if recursive:
-            for child in self.container_children:
-                child.create_many_to_many_relationship(append=append,
-                                                       recursive=True)
+        self._link_children(single=False, append=append, recursive=recursive)
 
     def create_relationship(self, force=False, append=True, recursive=True):
         """
@@ -492,6 +708,11 @@ class Container(BaseNeo):
         For children of the current object that can have more than one parent
         of this type, put the current object in the parent list.
 
+        Both kinds of relationship are created in a single pass over the
+        tree, so IOs building large objects should add all of the children
+        first and call this once at the end rather than relinking after
+        each addition.
+
         If the current object is a :class:`Block`, you want to run
         populate_RecordingChannel first, because this will create new objects
         that this method will link up.
@@ -501,12 +722,7 @@ class Container(BaseNeo):
         If recursive is True desecend into child objects and create
         relationships there
         """
-        self.create_many_to_one_relationship(force=force, recursive=False)
-        self.create_many_to_many_relationship(append=append, recursive=False)
-        if recursive:
-            for child in self.container_children:
-                child.create_relationship(force=force, append=append,
-                                          recursive=True)
+        self._link_children(force=force, append=append, recursive=recursive)
 
     def merge(self, other):
         """
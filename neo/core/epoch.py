@@ -14,7 +14,8 @@ import sys
 import numpy as np
 import quantities as pq
 
-from neo.core.baseneo import BaseNeo, merge_annotations
+from neo.core.baseneo import (BaseNeo, merge_annotations, _sorted_slice,
+                              _SortedTimes, _time_magnitude)
 
 PY_VER = sys.version_info[0]
 
@@ -27,7 +28,7 @@ def _new_epoch(cls, times=None, durations=None, labels=None, units=None,
     return Epoch( times=times, durations=durations, labels=labels, units=units, name=name, file_origin=file_origin,
                  description=description, **annotations)
 
-class Epoch(BaseNeo, pq.Quantity):
+class Epoch(_SortedTimes, BaseNeo, pq.Quantity):
     '''
     Array of epochs.
 
@@ -63,6 +64,10 @@ class Epoch(BaseNeo, pq.Quantity):
     Note: Any other additional arguments are assumed to be user-specific
     metadata and stored in :attr:`annotations`,
 
+    IO readers whose data are already validated can use
+    :meth:`from_trusted_array`, which skips the checks and the copy done by
+    the constructor.
+
     '''
 
     _single_parent_objects = ('Segment',)
@@ -112,13 +117,48 @@ class Epoch(BaseNeo, pq.Quantity):
         '''
         BaseNeo.__init__(self, name=name, file_origin=file_origin,
                          description=description, **annotations)
+
+    @classmethod
+    def from_trusted_array(cls, times, durations=None, labels=None,
+                           units=None, name=None, description=None,
+                           file_origin=None, **annotations):
+        '''
+        Construct an :class:`Epoch` from data that is already known to be
+        valid, as produced by the IO readers.
+
+        :attr:`times` is a 1D array (or :class:`~quantities.Quantity`) that
+        is already in :attr:`units` and is used as it is, without copying.
+        :attr:`durations` must be a quantity array.
+        Unlike the constructor, this does not check the units or the
+        annotations.
+        '''
+        if durations is None:
+            durations = np.array([]) * pq.s
+        if labels is None:
+            labels = np.array([], dtype='S')
+        if units is None:
+            try:
+                units = times.units
+            except AttributeError:
+                raise ValueError('you must specify units')
+
+        obj = np.asarray(times).view(cls)
+        obj._dimensionality = pq.quantity.validate_dimensionality(units)
+        obj.durations = durations
+        obj.labels = labels
+        obj.annotations = annotations
+        obj.name = name
+        obj.file_origin = file_origin
+        obj.description = description
+        return obj
+
     def __reduce__(self):
         '''
         Map the __new__ function onto _new_BaseAnalogSignal, so that pickle
         works
         '''
         return _new_epoch, (self.__class__, self.times, self.durations, self.labels, self.units,
-                            self.name, self.file_origin, self.description,
+                            self.name, self.description, self.file_origin,
                             self.annotations)      
 
     def __array_finalize__(self, obj):
@@ -130,6 +170,8 @@ class Epoch(BaseNeo, pq.Quantity):
         self.file_origin = getattr(obj, 'file_origin', None)
         self.description = getattr(obj, 'description', None)
         self.segment = getattr(obj, 'segment', None)
+        # the order of the new object is unknown, it is checked when needed
+        self._sorted = None
 
     def __repr__(self):
         '''
@@ -202,19 +244,34 @@ class Epoch(BaseNeo, pq.Quantity):
         the original :class:`Epoch` between (and including) times
         :attr:`t_start` and :attr:`t_stop`. Either parameter can also be None
         to use infinite endpoints for the time interval.
-        '''
-        _t_start = t_start
-        _t_stop = t_stop
-        if t_start is None:
-            _t_start = -np.inf
-        if t_stop is None:
-            _t_stop = np.inf
 
-        indices = (self >= _t_start) & (self <= _t_stop)
+        If the times are in increasing order, which is checked once and
+        remembered until they are modified through this :class:`Epoch` (by
+        item assignment, in-place operators or :meth:`sort`; changes made
+        through a view are not seen), the bounds are found by binary
+        search and the slice, its durations and labels are views on the
+        original ones.
+        '''
+        dim = self.dimensionality
+        return self._time_slice(_time_magnitude(t_start, dim, -np.inf),
+                                _time_magnitude(t_stop, dim, np.inf))
 
-        new_epc = self[indices]
-        new_epc.durations = self.durations[indices]
-        new_epc.labels = self.labels[indices]
+    def _time_slice(self, start, stop):
+        '''
+        Time slice between the magnitudes :attr:`start` and :attr:`stop`,
+        in the units of the :class:`Epoch`, with its durations and labels.
+        '''
+        times = self.magnitude
+        if self._is_sorted():
+            index = _sorted_slice(times, start, stop)
+        else:
+            index = (times >= start) & (times <= stop)
+        new_epc = self[index]
+        for attr in ('durations', 'labels'):
+            value = getattr(self, attr)
+            if value is not None and len(value) == len(self):
+                setattr(new_epc, attr, value[index])
+        new_epc._sorted = self._sorted
         return new_epc
 
     def as_array(self, units=None):
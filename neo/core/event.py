@@ -14,7 +14,8 @@ import sys
 import numpy as np
 import quantities as pq
 
-from neo.core.baseneo import BaseNeo, merge_annotations
+from neo.core.baseneo import (BaseNeo, merge_annotations, _sorted_slice,
+                              _SortedTimes, _time_magnitude)
 
 PY_VER = sys.version_info[0]
 
@@ -28,7 +29,7 @@ def _new_event(cls, signal, times = None, labels=None, units=None, name=None,
     return Event(signal=signal, times=times, labels=labels, units=units, name=name, file_origin=file_origin,
                  description=description, **annotations)
 
-class Event(BaseNeo, pq.Quantity):
+class Event(_SortedTimes, BaseNeo, pq.Quantity):
     '''
     Array of events.
 
@@ -60,6 +61,10 @@ class Event(BaseNeo, pq.Quantity):
     Note: Any other additional arguments are assumed to be user-specific
     metadata and stored in :attr:`annotations`.
 
+    IO readers whose data are already validated can use
+    :meth:`from_trusted_array`, which skips the checks and the copy done by
+    the constructor.
+
     '''
 
     _single_parent_objects = ('Segment',)
@@ -105,6 +110,37 @@ class Event(BaseNeo, pq.Quantity):
         '''
         BaseNeo.__init__(self, name=name, file_origin=file_origin,
                          description=description, **annotations)
+
+    @classmethod
+    def from_trusted_array(cls, times, labels=None, units=None, name=None,
+                           description=None, file_origin=None,
+                           **annotations):
+        '''
+        Construct an :class:`Event` from data that is already known to be
+        valid, as produced by the IO readers.
+
+        :attr:`times` is a 1D array (or :class:`~quantities.Quantity`) that
+        is already in :attr:`units` and is used as it is, without copying.
+        Unlike the constructor, this does not check the units or the
+        annotations.
+        '''
+        if labels is None:
+            labels = np.array([], dtype='S')
+        if units is None:
+            try:
+                units = times.units
+            except AttributeError:
+                raise ValueError('you must specify units')
+
+        obj = np.asarray(times).view(cls)
+        obj._dimensionality = pq.quantity.validate_dimensionality(units)
+        obj.labels = labels
+        obj.annotations = annotations
+        obj.name = name
+        obj.file_origin = file_origin
+        obj.description = description
+        return obj
+
     def __reduce__(self):
         '''
         Map the __new__ function onto _new_BaseAnalogSignal, so that pickle
@@ -122,6 +158,8 @@ class Event(BaseNeo, pq.Quantity):
         self.file_origin = getattr(obj, 'file_origin', None)
         self.description = getattr(obj, 'description', None)
         self.segment = getattr(obj, 'segment', None)
+        # the order of the new object is unknown, it is checked when needed
+        self._sorted = None
 
     def __repr__(self):
         '''
@@ -189,18 +227,33 @@ class Event(BaseNeo, pq.Quantity):
         Creates a new :class:`Event` corresponding to the time slice of
         the original :class:`Event` between (and including) times
         :attr:`t_start` and :attr:`t_stop`. Either parameter can also be None
-        to use infinite endpoints for the time interval.
+        to use infinite endpoints for the time interval. The
+        :attr:`labels` are sliced with the times, as for :class:`Epoch`.
+
+        If the times are in increasing order, which is checked once and
+        remembered until they are modified through this :class:`Event` (by
+        item assignment, in-place operators or :meth:`sort`; changes made
+        through a view are not seen), the bounds are found by binary
+        search and the slice is a view on the original :class:`Event`.
         '''
-        _t_start = t_start
-        _t_stop = t_stop
-        if t_start is None:
-            _t_start = -np.inf
-        if t_stop is None:
-            _t_stop = np.inf
-
-        indices = (self >= _t_start) & (self <= _t_stop)
-        new_evt = self[indices]
+        dim = self.dimensionality
+        return self._time_slice(_time_magnitude(t_start, dim, -np.inf),
+                                _time_magnitude(t_stop, dim, np.inf))
 
+    def _time_slice(self, start, stop):
+        '''
+        Time slice between the magnitudes :attr:`start` and :attr:`stop`,
+        in the units of the :class:`Event`, with its labels.
+        '''
+        times = self.magnitude
+        if self._is_sorted():
+            index = _sorted_slice(times, start, stop)
+        else:
+            index = (times >= start) & (times <= stop)
+        new_evt = self[index]
+        if self.labels is not None and len(self.labels) == len(self):
+            new_evt.labels = self.labels[index]
+        new_evt._sorted = self._sorted
         return new_evt
 
     def as_array(self, units=None):
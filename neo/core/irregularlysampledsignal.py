@@ -25,7 +25,9 @@ from __future__ import absolute_import, division, print_function
 import numpy as np
 import quantities as pq
 
-from neo.core.baseneo import BaseNeo, MergeError, merge_annotations
+from neo.core.baseneo import (BaseNeo, MergeError, merge_annotations,
+                              _sorted_slice, _SortedTimes, _time_magnitude)
+from neo.core.analogsignal import AnalogSignal
 
 
 def _new_IrregularlySampledSignal(cls, times, signal, units=None, time_units=None, dtype=None,
@@ -40,7 +42,41 @@ def _new_IrregularlySampledSignal(cls, times, signal, units=None, time_units=Non
                description=description, **annotations)
 
 
-class IrregularlySampledSignal(BaseNeo, pq.Quantity):
+def _interpolate(times, values, at, interpolation=None):
+    '''
+    Interpolate the 2D array `values`, sampled at the sorted 1D array `times`,
+    at the times in the 1D array `at`.
+
+    All the channels (columns) are handled at once: the position of every
+    time in `at` is looked up only once, and then used for every channel.
+
+    If `interpolation` is None, the values change stepwise at the sampling
+    times, if it is 'linear' they are linearly interpolated between them.
+    '''
+    if interpolation is None:
+        idx = np.searchsorted(times, at, side='right') - 1
+        np.clip(idx, 0, len(times) - 1, out=idx)
+        return values.take(idx, axis=0)
+    elif interpolation == 'linear':
+        if len(times) < 2:
+            return values.take(np.zeros(len(at), dtype=int), axis=0)
+        # fractional sample positions, shared by all the channels
+        frac = np.interp(at, times, np.arange(len(times), dtype=float))
+        idx = frac.astype(int)
+        np.clip(idx, 0, len(times) - 2, out=idx)
+        frac -= idx
+        result = values.take(idx, axis=0).astype(np.result_type(values, frac),
+                                                 copy=False)
+        delta = values.take(idx + 1, axis=0) - result
+        delta *= frac[:, np.newaxis]
+        result += delta
+        return result
+    else:
+        raise NotImplementedError("Unknown interpolation method: %r" %
+                                  (interpolation,))
+
+
+class IrregularlySampledSignal(_SortedTimes, BaseNeo, pq.Quantity):
     '''
     An array of one or more analog signals with samples taken at arbitrary time points.
 
@@ -166,14 +202,16 @@ class IrregularlySampledSignal(BaseNeo, pq.Quantity):
         '''
         Map the __new__ function onto _new_IrregularlySampledSignal, so that pickle
         works
+
+        The data is neither copied when pickling nor when unpickling.
         '''
         return _new_IrregularlySampledSignal, (self.__class__,
                                                self.times, 
-                                               np.array(self),
+                                               self.view(np.ndarray),
                                                self.units, 
                                                self.times.units, 
                                                self.dtype,
-                                               True, 
+                                               False, 
                                                self.name, 
                                                self.file_origin,
                                                self.description,
@@ -247,6 +285,19 @@ class IrregularlySampledSignal(BaseNeo, pq.Quantity):
         return obj
 
 
+    @property
+    def times(self):
+        '''
+        The times of the samples.
+        '''
+        return self._times
+
+    @times.setter
+    def times(self, times):
+        self._times = times
+        # the order of the new times is checked when needed
+        self._sorted = None
+
     @property
     def duration(self):
         '''
@@ -407,10 +458,17 @@ class IrregularlySampledSignal(BaseNeo, pq.Quantity):
         times.
 
         If :attr:`interpolation` is None, we assume that values change
-        stepwise at sampling times.
+        stepwise at sampling times.  If it is 'linear', the signal is
+        linearly interpolated between sampling times (trapezoidal rule).
         '''
         if interpolation is None:
             return (self[:-1]*self.sampling_intervals.reshape(-1, 1)).sum()/self.duration
+        elif interpolation == 'linear':
+            values = self.magnitude
+            intervals = np.diff(self.times.magnitude).reshape(-1, 1)
+            total = ((values[:-1] + values[1:]) * intervals).sum() / 2
+            duration = self.times.magnitude[-1] - self.times.magnitude[0]
+            return pq.Quantity(total / duration, units=self.units)
         else:
             raise NotImplementedError
 
@@ -424,11 +482,78 @@ class IrregularlySampledSignal(BaseNeo, pq.Quantity):
                  which samples should be created (times must be within the
                  signal duration, there is no extrapolation), a sampling rate
                  with dimensions (1/Time) or a sampling interval
-                 with dimensions (Time).
+                 with dimensions (Time), or an :class:`AnalogSignal` whose
+                 time base (t_start, sampling rate and length) should be
+                 used.
             :interpolation: one of: None, 'linear'
-        '''
-        # further interpolation methods could be added
-        raise NotImplementedError
+
+        If `at` is an array of times, an :class:`IrregularlySampledSignal`
+        sampled at those times is returned, otherwise an
+        :class:`AnalogSignal` starting at :attr:`t_start`.  If
+        `interpolation` is None, we assume that values change stepwise at
+        sampling times.
+
+        All the channels are interpolated at once.
+        '''
+        if interpolation not in (None, 'linear'):
+            # further interpolation methods could be added
+            raise NotImplementedError("Unknown interpolation method: %r" %
+                                      (interpolation,))
+        time_units = self.times.units
+        times = self.times.magnitude
+        sampling_rate = None
+        if isinstance(at, AnalogSignal):
+            sampling_rate = at.sampling_rate
+            t_start = at.t_start.rescale(time_units)
+            period = at.sampling_period.rescale(time_units)
+            n_samples = at.shape[0]
+            new_times = None
+        elif isinstance(at, pq.Quantity):
+            dims = at.dimensionality.simplified
+            if dims == pq.s.dimensionality and at.ndim == 0:
+                period = at.rescale(time_units)
+            elif dims == pq.Hz.dimensionality.simplified and at.ndim == 0:
+                sampling_rate = at
+                period = (1 / at).rescale(time_units)
+            elif dims == pq.s.dimensionality:
+                new_times = at.rescale(time_units).magnitude.ravel()
+            else:
+                raise ValueError("at must be an array of times, a sampling "
+                                 "rate or a sampling interval, not %s" % at)
+            if at.ndim == 0:
+                if period <= 0:
+                    raise ValueError("The sampling interval must be positive")
+                t_start = self.t_start
+                # allow for rounding errors in the last sample
+                n_samples = int(np.floor(float(self.duration / period) *
+                                         (1 + 1e-12))) + 1
+                new_times = None
+        else:
+            raise ValueError("at must be a Quantity or an AnalogSignal")
+
+        if new_times is None:
+            new_times = (t_start.magnitude +
+                         period.magnitude * np.arange(n_samples))
+        # allow for rounding errors at both ends
+        tol = 4 * np.finfo(float).eps * np.abs(times[[0, -1]]).max()
+        if len(new_times) and (new_times.min() < times[0] - tol or
+                               new_times.max() > times[-1] + tol):
+            raise ValueError("Cannot resample outside the signal duration, "
+                             "there is no extrapolation")
+
+        values = _interpolate(times, self.magnitude, new_times,
+                              interpolation)
+        kwargs = dict(name=self.name, file_origin=self.file_origin,
+                      description=self.description)
+        kwargs.update(self.annotations)
+        if isinstance(at, AnalogSignal) or at.ndim == 0:
+            return AnalogSignal.from_trusted_array(
+                values, units=self.units, t_start=t_start,
+                sampling_rate=sampling_rate, sampling_period=period,
+                **kwargs)
+        return IrregularlySampledSignal(new_times, values, units=self.units,
+                                        time_units=time_units, copy=False,
+                                        **kwargs)
 
     def rescale(self, units):
         '''
@@ -498,38 +623,49 @@ class IrregularlySampledSignal(BaseNeo, pq.Quantity):
             signal.lazy_shape = merged_lazy_shape
         return signal
 
-    def time_slice (self, t_start, t_stop):
+    def time_slice(self, t_start, t_stop):
         '''
         Creates a new :class:`IrregularlySampledSignal` corresponding to the time slice of
         the original :class:`IrregularlySampledSignal` between times
         `t_start` and `t_stop`. Either parameter can also be None
         to use infinite endpoints for the time interval.
-        '''
-        _t_start = t_start
-        _t_stop = t_stop
-
-        if t_start is None:
-            _t_start = -np.inf
-        if t_stop is None:
-            _t_stop = np.inf
-        indices = (self.times >= _t_start) & (self.times <= _t_stop)
-
-        count = 0
-        id_start = None
-        id_stop = None
-        for i in indices :
-            if id_start == None :
-                if i == True :
-                    id_start = count
-            else :
-                if i == False : 
-                    id_stop = count
-                    break
-            count += 1
-        
-        new_st = self[id_start:id_stop]
-
-        return new_st
+
+        The slice is a view on the original signal, from the first sample
+        in the window to the first one after it, and is empty if no sample
+        is in the window.  If :attr:`times` is in increasing order, which is
+        checked once and remembered until :attr:`times` is assigned again
+        (changes made in place are not seen), the bounds are found by
+        binary search.
+        '''
+        dim = self.times.dimensionality
+        return self._time_slice(_time_magnitude(t_start, dim, -np.inf),
+                                _time_magnitude(t_stop, dim, np.inf))
+
+    def _ordered_times(self):
+        '''
+        The magnitude of :attr:`times`, whose order is remembered.
+        '''
+        return self.times.magnitude
+
+    def _time_slice(self, start, stop):
+        '''
+        Time slice between the magnitudes :attr:`start` and :attr:`stop`,
+        in the units of :attr:`times`, from the first sample in the window
+        to the first one after it.
+        '''
+        times = self.times.magnitude
+        if self._is_sorted():
+            new_st = self[_sorted_slice(times, start, stop)]
+            new_st._sorted = True
+            return new_st
+        inside = (times >= start) & (times <= stop)
+        first = np.flatnonzero(inside)
+        if not len(first):
+            return self[:0]
+        i = first[0]
+        after = np.flatnonzero(~inside[i:])
+        j = i + after[0] if len(after) else len(times)
+        return self[i:j]
 
     def as_array(self, units=None):
         """
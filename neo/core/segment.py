@@ -13,10 +13,127 @@ from __future__ import absolute_import, division, print_function
 from datetime import datetime
 
 import numpy as np
+import quantities as pq
 
 from neo.core.container import Container
 
 
+def _extremum(values, arg):
+    '''
+    Return the item of the list of quantity scalars :attr:`values` picked
+    by :attr:`arg` (:func:`numpy.argmin` or :func:`numpy.argmax`) once all
+    of them are converted to the units of the first one.
+
+    The values are grouped by unit, and each group is converted at once.
+    '''
+    groups = {}
+    for i, value in enumerate(values):
+        groups.setdefault(value._dimensionality, []).append(i)
+    magnitudes = np.array([value.magnitude for value in values], dtype=float)
+    if len(groups) > 1:
+        units = values[0].units
+        for dim, indices in groups.items():
+            magnitudes[indices] *= float(pq.Quantity(1.0, dim).rescale(units))
+    return values[arg(magnitudes)]
+
+
+class _TimeConverter(object):
+    '''
+    Convert time quantities to magnitudes in a common unit, computing the
+    conversion factor of each unit only once.
+    '''
+    def __init__(self, units):
+        self.units = units
+        self._factors = {}
+
+    def factor(self, value):
+        '''
+        The factor converting a magnitude in the units of :attr:`value` to
+        the common unit.
+        '''
+        dim = value._dimensionality
+        try:
+            return self._factors[dim]
+        except KeyError:
+            factor = float(pq.Quantity(1.0, dim).rescale(self.units))
+            self._factors[dim] = factor
+            return factor
+
+    def __call__(self, value):
+        return value.magnitude * self.factor(value)
+
+
+def _slice_analogsignal(sig, t_start, t_stop, convert):
+    '''
+    Time slice of an :class:`AnalogSignal` as a view, clipped to the
+    signal.  :attr:`t_start` and :attr:`t_stop` are in the common unit of
+    :attr:`convert`.
+    '''
+    sig_t_start = sig.t_start
+    start = float(convert(sig_t_start))
+    period = float(convert(sig.sampling_period))
+    i = 0
+    j = len(sig)
+    if t_start > -np.inf:
+        i = min(max(int(np.rint((t_start - start) / period)), 0), j)
+    if t_stop < np.inf:
+        j = min(max(int(np.rint((t_stop - start) / period)), i), j)
+    obj = pq.Quantity.__getitem__(sig, slice(i, j))
+    obj.t_start = pq.Quantity(
+        sig_t_start.magnitude + i * period / convert.factor(sig_t_start),
+        sig_t_start.dimensionality)
+    return obj
+
+
+def _slice_spiketrain(train, t_start, t_stop, convert):
+    '''
+    Time slice of a :class:`SpikeTrain`, including both ends, as for
+    :meth:`SpikeTrain.time_slice`.
+    '''
+    factor = convert.factor(train)
+    start = t_start / factor
+    stop = t_stop / factor
+    times = train.magnitude
+    if train._is_sorted():
+        i = np.searchsorted(times, start, 'left')
+        j = np.searchsorted(times, stop, 'right')
+        obj = train[i:j]
+    else:
+        obj = train[(times >= start) & (times <= stop)]
+    obj.t_start = _clip_time(train.t_start, t_start, max, convert)
+    obj.t_stop = _clip_time(train.t_stop, t_stop, min, convert)
+    return obj
+
+
+def _clip_time(value, bound, func, convert):
+    '''
+    Apply :attr:`func` (:func:`max` or :func:`min`) to the quantity scalar
+    :attr:`value` and to :attr:`bound`, in the common unit of
+    :attr:`convert`, and return the result in the units of :attr:`value`.
+    '''
+    bound = bound / convert.factor(value)
+    return pq.Quantity(func(float(value.magnitude), bound),
+                       value.dimensionality, dtype=value.dtype)
+
+
+def _slice_irregularlysampledsignal(sig, t_start, t_stop, convert):
+    '''
+    Time slice of an :class:`IrregularlySampledSignal` as a view, as for
+    :meth:`IrregularlySampledSignal.time_slice`.
+    '''
+    factor = convert.factor(sig.times)
+    return sig._time_slice(t_start / factor, t_stop / factor)
+
+
+def _slice_event(obj, t_start, t_stop, convert):
+    '''
+    Time slice of an :class:`Event` or an :class:`Epoch`, including both
+    ends, with its labels and durations.
+    '''
+    factor = convert.factor(obj)
+    return obj._time_slice(t_start / factor, t_stop / factor)
+
+
 class Segment(Container):
     '''
     A container for data sharing a common time basis.
@@ -97,21 +214,36 @@ class Segment(Container):
         self.rec_datetime = rec_datetime
         self.index = index
 
+    def _time_bounds(self):
+        '''
+        Return the earliest start and the latest stop of the children, or
+        None for both if there are no children with times.
+
+        The values are compared in a common unit using NumPy.
+        '''
+        sigs = (self.analogsignals + self.spiketrains +
+                self.irregularlysampledsignals)
+        t_starts = [sig.t_start for sig in sigs]
+        t_stops = [sig.t_stop for sig in sigs]
+        for obj in self.epochs + self.events:
+            if len(obj):
+                times = obj.view(pq.Quantity)
+                t_starts.append(times[0])
+                t_stops.append(times[-1])
+
+        if not t_starts:
+            return None, None
+        return (_extremum(t_starts, np.argmin),
+                _extremum(t_stops, np.argmax))
+
     # t_start attribute is handled as a property so type checking can be done
     @property
     def t_start(self):
         '''
         Time when first signal begins.
         '''
-        t_starts = [sig.t_start for sig in self.analogsignals + self.spiketrains + self.irregularlysampledsignals]
-        t_starts += [e.times[0] for e in self.epochs + self.events if len(e.times) > 0]
-
         # t_start is not defined if no children are present
-        if len(t_starts)==0:
-            return None
-
-        t_start = min(t_starts)
-        return t_start
+        return self._time_bounds()[0]
 
     # t_stop attribute is handled as a property so type checking can be done
     @property
@@ -119,15 +251,55 @@ class Segment(Container):
         '''
         Time when last signal ends.
         '''
-        t_stops = [sig.t_stop for sig in self.analogsignals +  self.spiketrains + self.irregularlysampledsignals]
-        t_stops += [e.times[-1] for e in self.epochs + self.events if len(e.times) > 0]
-
         # t_stop is not defined if no children are present
-        if len(t_stops)==0:
-            return None
+        return self._time_bounds()[1]
 
-        t_stop = max(t_stops)
-        return t_stop
+    def time_slice(self, t_start=None, t_stop=None):
+        '''
+        Return a new :class:`Segment` containing the time slices of all of
+        the data children of the current one between :attr:`t_start` and
+        :attr:`t_stop`.  Either parameter can be None to use infinite
+        endpoints for the time interval.
+
+        The bounds are converted once for each unit used by the children,
+        instead of once per child.  The :class:`AnalogSignal` and
+        :class:`IrregularlySampledSignal` slices, and the slices of sorted
+        :class:`SpikeTrain` objects, are views on the original data.
+        Each :class:`AnalogSignal` is clipped to the interval, and is empty
+        if it does not overlap it.
+
+        The children of the new :class:`Segment` keep their links to the
+        :class:`Unit` and :class:`ChannelIndex` of the original children.
+        Use :meth:`Block.time_slice` to get new ones as well.
+        '''
+        if t_start is not None:
+            units = t_start.units
+        elif t_stop is not None:
+            units = t_stop.units
+        else:
+            units = pq.s
+        convert = _TimeConverter(units)
+        start = -np.inf if t_start is None else float(convert(t_start))
+        stop = np.inf if t_stop is None else float(convert(t_stop))
+
+        seg = Segment(name=self.name, description=self.description,
+                      file_origin=self.file_origin,
+                      file_datetime=self.file_datetime,
+                      rec_datetime=self.rec_datetime, index=self.index,
+                      **self.annotations)
+        seg.analogsignals = [_slice_analogsignal(sig, start, stop, convert)
+                             for sig in self.analogsignals]
+        seg.spiketrains = [_slice_spiketrain(train, start, stop, convert)
+                           for train in self.spiketrains]
+        seg.irregularlysampledsignals = [
+            _slice_irregularlysampledsignal(sig, start, stop, convert)
+            for sig in self.irregularlysampledsignals]
+        seg.events = [_slice_event(evt, start, stop, convert)
+                      for evt in self.events]
+        seg.epochs = [_slice_event(epc, start, stop, convert)
+                      for epc in self.epochs]
+        seg.create_many_to_one_relationship(force=True, recursive=False)
+        return seg
 
     def take_spiketrains_by_unit(self, unit_list=None):
         '''
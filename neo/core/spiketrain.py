@@ -24,7 +24,7 @@ from __future__ import absolute_import, division, print_function
 import numpy as np
 import quantities as pq
 
-from neo.core.baseneo import BaseNeo
+from neo.core.baseneo import BaseNeo, _SortedTimes
 
 
 def check_has_dimensions_time(*values):
@@ -88,6 +88,18 @@ def _check_waveform_dimensions(spiketrain):
                                                      waveforms.shape[0]))
 
 
+def _trusted_time(value, dim, dtype):
+    '''
+    Convert :attr:`value`, a float in the units given by :attr:`dim` or a
+    quantity, to a new quantity scalar with the given units and dtype.
+    '''
+    if hasattr(value, 'dimensionality'):
+        if value.dimensionality.items() != dim.items():
+            value = value.rescale(dim)
+        value = value.magnitude
+    return pq.Quantity(value, units=dim, dtype=dtype)
+
+
 def _new_spiketrain(cls, signal, t_stop, units=None, dtype=None,
                     copy=True, sampling_rate=1.0 * pq.Hz,
                     t_start=0.0 * pq.s, waveforms=None, left_sweep=None,
@@ -104,7 +116,7 @@ def _new_spiketrain(cls, signal, t_stop, units=None, dtype=None,
                       description, **annotations)
 
 
-class SpikeTrain(BaseNeo, pq.Quantity):
+class SpikeTrain(_SortedTimes, BaseNeo, pq.Quantity):
     '''
     :class:`SpikeTrain` is a :class:`Quantity` array of spike times.
 
@@ -190,6 +202,20 @@ class SpikeTrain(BaseNeo, pq.Quantity):
         (along dimension 0). Note that t_start and t_stop are not changed
         automatically, although you can still manually change them.
 
+    *Sorting*:
+        A :class:`SpikeTrain` sorted by time (checked once when needed,
+        known after :meth:`sort` or when created sorted by an IO) is sliced
+        by :meth:`time_slice` with a binary search, and its
+        :attr:`waveforms` become views. Setting items, in-place operators,
+        :meth:`fill`, :meth:`put` and :meth:`itemset` forget the order;
+        changes made through another array sharing the times, such as a
+        view, are not seen.
+
+    *Trusted construction*:
+        IO readers whose data are already validated can use
+        :meth:`from_trusted_array`, which skips the checks and the copy
+        done by the constructor.
+
     '''
 
     _single_parent_objects = ('Segment', 'Unit')
@@ -201,6 +227,10 @@ class SpikeTrain(BaseNeo, pq.Quantity):
                            ('left_sweep', pq.Quantity, 0),
                            ('sampling_rate', pq.Quantity, 0)) +
                           BaseNeo._recommended_attrs)
+    # the attributes that views and slices take over in __array_finalize__
+    _finalize_attrs = ('t_start', 't_stop', 'waveforms', 'left_sweep',
+                       'sampling_rate', 'segment', 'unit', 'annotations',
+                       'name', 'file_origin', 'description', 'lazy_shape')
 
     def __new__(cls, times, t_stop, units=None, dtype=None, copy=True,
                 sampling_rate=1.0 * pq.Hz, t_start=0.0 * pq.s, waveforms=None,
@@ -295,6 +325,9 @@ class SpikeTrain(BaseNeo, pq.Quantity):
         obj.segment = None
         obj.unit = None
 
+        # the order of the times is checked when needed
+        obj._sorted = None
+
         # Error checking (do earlier?)
         _check_time_in_range(obj, obj.t_start, obj.t_stop, view=True)
 
@@ -317,29 +350,74 @@ class SpikeTrain(BaseNeo, pq.Quantity):
         BaseNeo.__init__(self, name=name, file_origin=file_origin,
                          description=description, **annotations)
 
+    @classmethod
+    def from_trusted_array(cls, times, t_stop, units=None, t_start=0.0,
+                           sampling_rate=1.0 * pq.Hz, waveforms=None,
+                           left_sweep=None, name=None, file_origin=None,
+                           description=None, **annotations):
+        '''
+        Construct a :class:`SpikeTrain` from data that is already known to be
+        valid, as produced by the IO readers.
+
+        :attr:`times` is a 1D array (or :class:`~quantities.Quantity`) that
+        is already in :attr:`units` and is used as it is, without copying.
+        :attr:`t_start` and :attr:`t_stop` may be floats in :attr:`units`
+        or quantities, which are converted to :attr:`units`.
+
+        Unlike the constructor, this does not check that the units are
+        times, that the spikes are within [t_start, t_stop], that the
+        number of waveforms matches the number of spikes or that the
+        annotations are valid.  Invalid input gives an invalid object.
+        '''
+        if units is None:
+            try:
+                units = times.units
+            except AttributeError:
+                raise ValueError('you must specify units')
+        dim = pq.quantity.validate_dimensionality(units)
+
+        obj = np.asarray(times).view(cls)
+        obj._dimensionality = dim
+        obj.t_start = _trusted_time(t_start, dim, obj.dtype)
+        obj.t_stop = _trusted_time(t_stop, dim, obj.dtype)
+        obj.waveforms = waveforms
+        obj.left_sweep = left_sweep
+        obj.sampling_rate = sampling_rate
+        obj.annotations = annotations
+        obj.name = name
+        obj.file_origin = file_origin
+        obj.description = description
+        return obj
+
     def rescale(self, units):
         '''
         Return a copy of the :class:`SpikeTrain` converted to the specified
         units
         '''
         if self.dimensionality == pq.quantity.validate_dimensionality(units):
-            return self.copy()
-        spikes = self.view(pq.Quantity)
-        return SpikeTrain(times=spikes, t_stop=self.t_stop, units=units,
-                          sampling_rate=self.sampling_rate,
-                          t_start=self.t_start, waveforms=self.waveforms,
-                          left_sweep=self.left_sweep, name=self.name,
-                          file_origin=self.file_origin,
-                          description=self.description, **self.annotations)
+            new_st = self.copy()
+        else:
+            spikes = self.view(pq.Quantity)
+            new_st = SpikeTrain(times=spikes, t_stop=self.t_stop, units=units,
+                                sampling_rate=self.sampling_rate,
+                                t_start=self.t_start,
+                                waveforms=self.waveforms,
+                                left_sweep=self.left_sweep, name=self.name,
+                                file_origin=self.file_origin,
+                                description=self.description,
+                                **self.annotations)
+        new_st._sorted = self._sorted
+        return new_st
 
     def __reduce__(self):
         '''
         Map the __new__ function onto _new_BaseAnalogSignal, so that pickle
         works
+
+        The data is neither copied when pickling nor when unpickling.
         '''
-        import numpy
-        return _new_spiketrain, (self.__class__, numpy.array(self),
-                                 self.t_stop, self.units, self.dtype, True,
+        return _new_spiketrain, (self.__class__, self.view(np.ndarray),
+                                 self.t_stop, self.units, self.dtype, False,
                                  self.sampling_rate, self.t_start,
                                  self.waveforms, self.left_sweep,
                                  self.name, self.file_origin, self.description,
@@ -359,6 +437,21 @@ class SpikeTrain(BaseNeo, pq.Quantity):
         Note that the :attr:`waveforms` attibute is not sliced here. Nor is
         :attr:`t_start` or :attr:`t_stop` modified.
         '''
+        if isinstance(obj, SpikeTrain):
+            # Views and slices take over the attributes listed in
+            # _finalize_attrs from the original object in one step rather
+            # than one by one. Rebinding an attribute on either object
+            # afterwards does not affect the other.
+            attrs = obj.__dict__
+            self.__dict__.update([(name, attrs[name])
+                                  for name in self._finalize_attrs
+                                  if name in attrs])
+            super(SpikeTrain, self).__array_finalize__(obj)
+            # the order of the new object is unknown,
+            # slicing sets it back in __getitem__
+            self._sorted = None
+            return
+
         # This calls Quantity.__array_finalize__ which deals with
         # dimensionality
         super(SpikeTrain, self).__array_finalize__(obj)
@@ -380,6 +473,10 @@ class SpikeTrain(BaseNeo, pq.Quantity):
         self.segment = getattr(obj, 'segment', None)
         self.unit = getattr(obj, 'unit', None)
 
+        # the order of the new object is unknown,
+        # slicing sets it back in __getitem__
+        self._sorted = None
+
         # The additional arguments
         self.annotations = getattr(obj, 'annotations', {})
 
@@ -412,6 +509,7 @@ class SpikeTrain(BaseNeo, pq.Quantity):
         # We have sorted twice, but `self = self[sort_indices]` introduces
         # a dependency on the slicing functionality of SpikeTrain.
         super(SpikeTrain, self).sort()
+        self._sorted = True
 
     def __getslice__(self, i, j):
         '''
@@ -428,6 +526,7 @@ class SpikeTrain(BaseNeo, pq.Quantity):
         # update waveforms
         if obj.waveforms is not None:
             obj.waveforms = obj.waveforms[i:j]
+        obj._sorted = self._sorted
         return obj
 
     def __add__(self, time):
@@ -441,12 +540,15 @@ class SpikeTrain(BaseNeo, pq.Quantity):
         spikes = self.view(pq.Quantity)
         check_has_dimensions_time(time)
         _check_time_in_range(spikes + time, self.t_start, self.t_stop)
-        return SpikeTrain(times=spikes + time, t_stop=self.t_stop,
-                          units=self.units, sampling_rate=self.sampling_rate,
-                          t_start=self.t_start, waveforms=self.waveforms,
-                          left_sweep=self.left_sweep, name=self.name,
-                          file_origin=self.file_origin,
-                          description=self.description, **self.annotations)
+        new_st = SpikeTrain(times=spikes + time, t_stop=self.t_stop,
+                            units=self.units,
+                            sampling_rate=self.sampling_rate,
+                            t_start=self.t_start, waveforms=self.waveforms,
+                            left_sweep=self.left_sweep, name=self.name,
+                            file_origin=self.file_origin,
+                            description=self.description, **self.annotations)
+        new_st._sorted = self._sorted
+        return new_st
 
     def __sub__(self, time):
         '''
@@ -459,12 +561,15 @@ class SpikeTrain(BaseNeo, pq.Quantity):
         spikes = self.view(pq.Quantity)
         check_has_dimensions_time(time)
         _check_time_in_range(spikes - time, self.t_start, self.t_stop)
-        return SpikeTrain(times=spikes - time, t_stop=self.t_stop,
-                          units=self.units, sampling_rate=self.sampling_rate,
-                          t_start=self.t_start, waveforms=self.waveforms,
-                          left_sweep=self.left_sweep, name=self.name,
-                          file_origin=self.file_origin,
-                          description=self.description, **self.annotations)
+        new_st = SpikeTrain(times=spikes - time, t_stop=self.t_stop,
+                            units=self.units,
+                            sampling_rate=self.sampling_rate,
+                            t_start=self.t_start, waveforms=self.waveforms,
+                            left_sweep=self.left_sweep, name=self.name,
+                            file_origin=self.file_origin,
+                            description=self.description, **self.annotations)
+        new_st._sorted = self._sorted
+        return new_st
 
     def __getitem__(self, i):
         '''
@@ -473,6 +578,13 @@ class SpikeTrain(BaseNeo, pq.Quantity):
         obj = super(SpikeTrain, self).__getitem__(i)
         if hasattr(obj, 'waveforms') and obj.waveforms is not None:
             obj.waveforms = obj.waveforms.__getitem__(i)
+        if isinstance(obj, SpikeTrain):
+            # slices with a positive step and boolean masks keep the order
+            if isinstance(i, slice):
+                if self._sorted and (i.step is None or i.step > 0):
+                    obj._sorted = True
+            elif getattr(i, 'dtype', None) == bool and self._sorted:
+                obj._sorted = True
         return obj
 
     def __setitem__(self, i, value):
@@ -491,6 +603,7 @@ class SpikeTrain(BaseNeo, pq.Quantity):
         if not hasattr(value, "units"):
             value = pq.Quantity(value, units=self.units)
         _check_time_in_range(value, self.t_start, self.t_stop)
+        self._sorted = None
         super(SpikeTrain, self).__setslice__(i, j, value)
 
     def _copy_data_complement(self, other):
@@ -534,6 +647,13 @@ class SpikeTrain(BaseNeo, pq.Quantity):
         the original :class:`SpikeTrain` between (and including) times
         :attr:`t_start` and :attr:`t_stop`. Either parameter can also be None
         to use infinite endpoints for the time interval.
+
+        If the times are in increasing order, which is checked once and
+        remembered until they are modified through this :class:`SpikeTrain`
+        (by item assignment, in-place operators or :meth:`sort`; changes
+        made through a view are not seen), the bounds are found by binary
+        search and the times and :attr:`waveforms` of the slice are views
+        on the original ones.
         '''
         _t_start = t_start
         _t_stop = t_stop
@@ -541,13 +661,26 @@ class SpikeTrain(BaseNeo, pq.Quantity):
             _t_start = -np.inf
         if t_stop is None:
             _t_stop = np.inf
-        indices = (self >= _t_start) & (self <= _t_stop)
-        new_st = self[indices]
+
+        if self._is_sorted():
+            times = self.magnitude
+            i = 0
+            j = len(times)
+            if t_start is not None:
+                i = np.searchsorted(
+                    times, _t_start.rescale(self.units).magnitude, 'left')
+            if t_stop is not None:
+                j = np.searchsorted(
+                    times, _t_stop.rescale(self.units).magnitude, 'right')
+            new_st = self[i:j]
+        else:
+            indices = (self >= _t_start) & (self <= _t_stop)
+            new_st = self[indices]
+            if self.waveforms is not None:
+                new_st.waveforms = self.waveforms[indices]
 
         new_st.t_start = max(_t_start, self.t_start)
         new_st.t_stop = min(_t_stop, self.t_stop)
-        if self.waveforms is not None:
-            new_st.waveforms = self.waveforms[indices]
 
         return new_st
 
@@ -78,6 +78,10 @@ Classes:
 
 .. autoclass:: neo.io.WinWcpIO
 
+Proxy objects, returned by some IO classes when reading lazily:
+
+.. autoclass:: neo.io.AnalogSignalProxy
+
 """
 
 import os.path
@@ -136,6 +140,8 @@ from neo.io.tdtio import TdtIO
 from neo.io.winedrio import WinEdrIO
 from neo.io.winwcpio import WinWcpIO
 
+from neo.io.proxyobjects import AnalogSignalProxy
+
 
 iolist = [
           AlphaOmegaIO,
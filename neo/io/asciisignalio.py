@@ -17,6 +17,7 @@ import numpy as np
 import quantities as pq
 
 from neo.io.baseio import BaseIO
+from neo.io.tools import read_text_columns
 from neo.core import AnalogSignal, Segment
 
 
@@ -56,7 +57,7 @@ class AsciiSignalIO(BaseIO):
                                         ('unit' , { 'value' : 'V', } ),
                                         ('sampling_rate' , { 'value' : 1000., } ),
                                         ('t_start' , { 'value' : 0., } ),
-                                        ('method' , { 'value' : 'homemade', 'possible' : ['genfromtxt' , 'csv' , 'homemade' ] }) ,
+                                        ('method' , { 'value' : 'homemade', 'possible' : ['genfromtxt' , 'csv' , 'homemade' , 'fast' ] }) ,
                                         ]
                             }
     write_params       = {
@@ -97,6 +98,7 @@ class AsciiSignalIO(BaseIO):
                                         unit = pq.V,
 
                                         method = 'genfromtxt',
+                                        parallel = False,
 
                                         ):
         """
@@ -109,12 +111,17 @@ class AsciiSignalIO(BaseIO):
             t_start : time of the first sample
             unit : unit of AnalogSignal can be a str or directly a Quantities
 
-            method :  'genfromtxt' or 'csv' or 'homemade'
+            method :  'genfromtxt' or 'csv' or 'homemade' or 'fast'
                         in case of bugs you can try one of this methods
 
                         'genfromtxt' use numpy.genfromtxt
                         'csv' use cvs module
                         'homemade' use a intuitive more robust but slow method
+                        'fast' parse the file by chunks with numpy, keeping only
+                        the columns in usecols and timecolumn. Use it for
+                        large files of numbers.
+            parallel : with method 'fast', True or a number of processes to
+                       parse parts of the file in parallel
 
         """
         seg = Segment(file_origin = os.path.basename(self.filename))
@@ -133,8 +140,19 @@ class AsciiSignalIO(BaseIO):
 
 
 
+        # file column of each column of sig
+        columns = None
+
         #loadtxt
-        if method == 'genfromtxt' :
+        if method == 'fast':
+            if usecols is not None:
+                columns = sorted(set(usecols) | set([timecolumn]) -
+                                 set([None]))
+            # each column is contiguous, the signals are views on it
+            sig = read_text_columns(self.filename, usecols=columns,
+                                    skiprows=skiprows, delimiter=delimiter,
+                                    dtype='f', parallel=parallel, order='F')
+        elif method == 'genfromtxt' :
             sig = np.genfromtxt(self.filename,
                                         delimiter = delimiter,
                                         usecols = usecols ,
@@ -143,11 +161,11 @@ class AsciiSignalIO(BaseIO):
             if len(sig.shape) ==1:
                 sig = sig[:, np.newaxis]
         elif method == 'csv' :
-            tab = [l for l in  csv.reader( file(self.filename,'rU') , delimiter = delimiter ) ]
+            tab = [l for l in  csv.reader( open(self.filename) , delimiter = delimiter ) ]
             tab = tab[skiprows:]
             sig = np.array( tab , dtype = 'f')
         elif method == 'homemade' :
-            fid = open(self.filename,'rU')
+            fid = open(self.filename)
             for l in range(skiprows):
                 fid.readline()
             tab = [ ]
@@ -160,24 +178,28 @@ class AsciiSignalIO(BaseIO):
                 tab.append(l)
             sig = np.array( tab , dtype = 'f')
 
+        if columns is None:
+            columns = list(range(sig.shape[1]))
+
         if timecolumn is not None:
-            sampling_rate = 1./np.mean(np.diff(sig[:,timecolumn])) * pq.Hz
-            t_start = sig[0,timecolumn] * pq.s
+            times = sig[:, columns.index(timecolumn)]
+            sampling_rate = 1./np.mean(np.diff(times)) * pq.Hz
+            t_start = times[0] * pq.s
 
 
 
-        for i in range(sig.shape[1]) :
+        for j, i in enumerate(columns) :
             if timecolumn == i : continue
             if usecols is not None and i not in usecols: continue
 
             if lazy:
                 signal = [ ]*unit
             else:
-                signal = sig[:,i]*unit
+                signal = pq.Quantity(sig[:,j], units=unit.units, copy=False)
 
             anaSig = AnalogSignal(signal, sampling_rate=sampling_rate,
                                   t_start=t_start, channel_index=i,
-                                  name='Column %d'%i)
+                                  name='Column %d'%i, copy=False)
             if lazy:
                 anaSig.lazy_shape = sig.shape
             seg.analogsignals.append( anaSig )
@@ -12,10 +12,10 @@ Author: sgarcia
 
 import os
 
-import numpy as np
 import quantities as pq
 
 from neo.io.baseio import BaseIO
+from neo.io.tools import parse_numbers
 from neo.core import Segment, SpikeTrain
 
 
@@ -95,16 +95,16 @@ class AsciiSpikeTrainIO(BaseIO):
         if not cascade:
             return seg
 
-        f = open(self.filename, 'Ur')
+        f = open(self.filename, 'rb')
         for i,line in enumerate(f) :
-            alldata = line[:-1].split(delimiter)
-            if alldata[-1] == '': alldata = alldata[:-1]
-            if alldata[0] == '': alldata = alldata[1:]
+            # each line is converted by numpy at once
+            alldata = parse_numbers(line, delimiter=delimiter,
+                                    name=self.filename)[:, 0]
             if lazy:
                 spike_times = [ ]
                 t_stop = t_start
             else:
-                spike_times = np.array(alldata).astype('f')
+                spike_times = alldata.astype('f')
                 t_stop = spike_times.max()*unit
 
             sptr = SpikeTrain(spike_times*unit, t_start=t_start, t_stop=t_stop)
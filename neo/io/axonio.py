@@ -39,6 +39,7 @@ reads abf files - would be good to cross-check
 import struct
 import datetime
 import os
+from collections import OrderedDict
 from io import open, BufferedReader
 
 import numpy as np
@@ -60,14 +61,93 @@ class StructFile(BufferedReader):
             self.seek(offset)
         self.write(struct.pack(fmt, *args))
 
+    def read_record(self, description, offset=None):
+        """
+        Read a record described by a list of (key, fmt) with a single
+        struct call and return it as a dict.
+        """
+        if offset is not None:
+            self.seek(offset)
+        st, fields = _record_struct(description)
+        val = st.unpack(self.read(st.size))
+        record = {}
+        pos = 0
+        for key, n in fields:
+            if n == 1:
+                record[key] = val[pos]
+            else:
+                record[key] = np.array(val[pos:pos + n])
+            pos += n
+        return record
+
+
+_record_structs = {}
+
+
+def _record_struct(description):
+    """
+    Compiled struct and number of values per field for a record description.
+    Fields are packed without alignment, as when they are read one by one.
+    """
+    key = tuple(description)
+    if key not in _record_structs:
+        fmt = '=' + ''.join(f for _, f in description)
+        fields = []
+        for k, f in description:
+            size = struct.calcsize('=' + f)
+            fields.append((k, len(struct.unpack('=' + f, b'\x00' * size))))
+        _record_structs[key] = (struct.Struct(fmt), fields)
+    return _record_structs[key]
+
+
+class _FrozenDict(dict):
+    """
+    Read-only dict used for cached headers, which are shared between
+    all readers of the same file.
+    """
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("cached AxonIO headers are read-only")
+
+    __setitem__ = __delitem__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
 
-def reformat_integer_v1(data, nbchannel, header):
+    def __reduce__(self):
+        return (_FrozenDict, (dict(self),))
+
+
+def _freeze(obj):
+    """
+    Recursively make a parsed header immutable.
+    """
+    if isinstance(obj, dict):
+        return _FrozenDict((k, _freeze(v)) for k, v in iteritems(obj))
+    if isinstance(obj, list):
+        return tuple(_freeze(v) for v in obj)
+    if isinstance(obj, np.ndarray):
+        obj.setflags(write=False)
+    return obj
+
+
+# parsed headers shared across AxonIO instances,
+# keyed by (filename, mtime, size, metadata_only), in least recently used order
+_header_cache = OrderedDict()
+_HEADER_CACHE_SIZE = 256
+
+
+def reformat_integer_v1(data, nbchannel, header, channels=None):
     """
     reformat when dtype is int16 for ABF version 1
+
+    channels gives, for each column of data, its position in the
+    acquisition sequence (default: all nbchannel channels in order).
     """
     chans = [chan_num for chan_num in
              header['nADCSamplingSeq'] if chan_num >= 0]
-    for n, i in enumerate(chans[:nbchannel]):  # respect SamplingSeq
+    if channels is None:
+        channels = range(nbchannel)
+    for n, c in enumerate(channels):  # respect SamplingSeq
+        i = chans[c]
         data[:, n] /= header['fInstrumentScaleFactor'][i]
         data[:, n] /= header['fSignalGain'][i]
         data[:, n] /= header['fADCProgrammableGain'][i]
@@ -79,20 +159,25 @@ def reformat_integer_v1(data, nbchannel, header):
         data[:, n] -= header['fSignalOffset'][i]
 
 
-def reformat_integer_v2(data, nbchannel, header):
+def reformat_integer_v2(data, nbchannel, header, channels=None):
     """
     reformat when dtype is int16 for ABF version 2
+
+    channels gives, for each column of data, its ADC channel position
+    (default: all nbchannel channels in order).
     """
-    for i in range(nbchannel):
-        data[:, i] /= header['listADCInfo'][i]['fInstrumentScaleFactor']
-        data[:, i] /= header['listADCInfo'][i]['fSignalGain']
-        data[:, i] /= header['listADCInfo'][i]['fADCProgrammableGain']
+    if channels is None:
+        channels = range(nbchannel)
+    for n, i in enumerate(channels):
+        data[:, n] /= header['listADCInfo'][i]['fInstrumentScaleFactor']
+        data[:, n] /= header['listADCInfo'][i]['fSignalGain']
+        data[:, n] /= header['listADCInfo'][i]['fADCProgrammableGain']
         if header['listADCInfo'][i]['nTelegraphEnable']:
-            data[:, i] /= header['listADCInfo'][i]['fTelegraphAdditGain']
-        data[:, i] *= header['protocol']['fADCRange']
-        data[:, i] /= header['protocol']['lADCResolution']
-        data[:, i] += header['listADCInfo'][i]['fInstrumentOffset']
-        data[:, i] -= header['listADCInfo'][i]['fSignalOffset']
+            data[:, n] /= header['listADCInfo'][i]['fTelegraphAdditGain']
+        data[:, n] *= header['protocol']['fADCRange']
+        data[:, n] /= header['protocol']['lADCResolution']
+        data[:, n] += header['listADCInfo'][i]['fInstrumentOffset']
+        data[:, n] -= header['listADCInfo'][i]['fSignalOffset']
 
 
 def clean_string(s):
@@ -150,7 +235,24 @@ class AxonIO(BaseIO):
         BaseIO.__init__(self)
         self.filename = filename
 
-    def read_block(self, lazy=False, cascade=True):
+    def read_block(self, lazy=False, cascade=True, episodes=None,
+                   channels=None, t_start=None, t_stop=None):
+        """
+        Arguments:
+            episodes: list of episode (sweep) indices to read.
+                Default None reads all episodes. A ValueError is raised
+                for an episode which is not in the file.
+            channels: list of ADC channel positions (in acquisition order)
+                to read. Default None reads all channels. A ValueError is
+                raised for a channel which is not in the file.
+            t_start: Quantity, only the samples at or after t_start are
+                read. Episodes entirely outside [t_start, t_stop] are
+                skipped. Default None means from the start of each episode.
+            t_stop: Quantity, only the samples before t_stop are read.
+                Default None means up to the end of each episode.
+
+        Only the requested part of the data section is read from disk.
+        """
 
         header = self.read_header()
         version = header['fFileVersionNumber']
@@ -240,40 +342,88 @@ class AxonIO(BaseIO):
                 sampling_rate = 1.e6 / \
                     header['protocol']['fADCSequenceInterval'] * pq.Hz
 
+            if version < 2.:
+                fSynchTimeUnit = header['fSynchTimeUnit']
+            elif version >= 2.:
+                fSynchTimeUnit = header['protocol']['fSynchTimeUnit']
+
+            # length and position of every sweep in the data section
+            lengths = np.array(episode_array['len'], dtype='int64')
+            if (fSynchTimeUnit != 0) and (mode == 1):
+                lengths = (lengths / fSynchTimeUnit).astype('int64')
+            positions = np.cumsum(lengths) - lengths
+
+            if episodes is None:
+                episodes = range(episode_array.size)
+            else:
+                episodes = list(episodes)
+                for j in episodes:
+                    if not 0 <= j < episode_array.size:
+                        raise ValueError('episode %r does not exist, the '
+                                         'file has %d episodes' %
+                                         (j, episode_array.size))
+
+            if version < 2.:
+                chans = [chan_num for chan_num in
+                         header['nADCSamplingSeq'] if chan_num >= 0]
+            else:
+                chans = range(nbchannel)
+            nb_read_channel = min(nbchannel, len(chans))
+            if channels is None:
+                channels = range(nb_read_channel)
+            else:
+                channels = list(channels)
+                for n in channels:
+                    if not 0 <= n < nb_read_channel:
+                        raise ValueError('channel %r does not exist, the '
+                                         'file has %d channels' %
+                                         (n, nb_read_channel))
+
             # construct block
             # one sweep = one segment in a block
-            pos = 0
-            for j in range(episode_array.size):
+            for j in episodes:
                 seg = Segment(index=j)
 
-                length = episode_array[j]['len']
-
-                if version < 2.:
-                    fSynchTimeUnit = header['fSynchTimeUnit']
-                elif version >= 2.:
-                    fSynchTimeUnit = header['protocol']['fSynchTimeUnit']
-
-                if (fSynchTimeUnit != 0) and (mode == 1):
-                    length /= fSynchTimeUnit
+                if (fSynchTimeUnit == 0):
+                    seg_t_start = float(episode_array[j]['offset']) / \
+                        sampling_rate
+                else:
+                    seg_t_start = float(episode_array[j]['offset']) * \
+                        fSynchTimeUnit * 1e-6 * pq.s
+                seg_t_start = seg_t_start.rescale('s')
+
+                # restrict the sweep to [t_start, t_stop] by sample offset
+                nbsample = int(lengths[j] // nbchannel)
+                i_start, i_stop = 0, nbsample
+                if t_start is not None:
+                    i_start = int(np.ceil(
+                        ((t_start - seg_t_start) * sampling_rate).simplified))
+                    i_start = min(max(i_start, 0), nbsample)
+                if t_stop is not None:
+                    i_stop = int(np.ceil(
+                        ((t_stop - seg_t_start) * sampling_rate).simplified))
+                    i_stop = min(max(i_stop, i_start), nbsample)
+                if (t_start is not None or t_stop is not None) and \
+                        i_stop <= i_start:
+                    continue
+                sig_t_start = seg_t_start + i_start / sampling_rate
 
                 if not lazy:
-                    subdata = data[pos:pos+length]
-                    subdata = subdata.reshape((int(subdata.size/nbchannel),
-                                               nbchannel)).astype('f')
+                    pos = int(positions[j])
+                    subdata = data[pos + i_start * nbchannel:
+                                   pos + i_stop * nbchannel]
+                    subdata = subdata.reshape((i_stop - i_start, nbchannel))
+                    subdata = subdata[:, channels].astype('f')
                     if dt == np.dtype('i2'):
                         if version < 2.:
-                            reformat_integer_v1(subdata, nbchannel, header)
+                            reformat_integer_v1(subdata, nbchannel, header,
+                                                channels=channels)
                         elif version >= 2.:
-                            reformat_integer_v2(subdata, nbchannel, header)
-
-                pos += length
+                            reformat_integer_v2(subdata, nbchannel, header,
+                                                channels=channels)
 
-                if version < 2.:
-                    chans = [chan_num for chan_num in
-                             header['nADCSamplingSeq'] if chan_num >= 0]
-                else:
-                    chans = range(nbchannel)
-                for n, i in enumerate(chans[:nbchannel]):  # fix SamplingSeq
+                for n, c in enumerate(channels):  # fix SamplingSeq
+                    i = chans[c]
                     if version < 2.:
                         name = header['sADCChannelName'][i].replace(b' ', b'')
                         unit = header['sADCUnits'][i].replace(b'\xb5', b'u').\
@@ -285,11 +435,6 @@ class AxonIO(BaseIO):
                         unit = lADCIi['ADCChUnits'].replace(b'\xb5', b'u').\
                             replace(b' ', b'').decode('utf-8')
                         num = header['listADCInfo'][i]['nADCNum']
-                    if (fSynchTimeUnit == 0):
-                        t_start = float(episode_array[j]['offset']) / sampling_rate
-                    else:
-                        t_start = float(episode_array[j]['offset']) * fSynchTimeUnit *1e-6* pq.s
-                    t_start = t_start.rescale('s')
                     try:
                         pq.Quantity(1, unit)
                     except:
@@ -301,25 +446,30 @@ class AxonIO(BaseIO):
                         signal = pq.Quantity(subdata[:, n], unit)
 
                     anaSig = AnalogSignal(signal, sampling_rate=sampling_rate,
-                                          t_start=t_start,
+                                          t_start=sig_t_start,
                                           name=name.decode("utf-8"),
                                           channel_index=int(num))
                     if lazy:
-                        anaSig.lazy_shape = length / nbchannel
+                        anaSig.lazy_shape = i_stop - i_start
                     seg.analogsignals.append(anaSig)
                 bl.segments.append(seg)
 
-            if mode in [3, 5]:  # TODO check if tags exits in other mode
+            if mode in [3, 5] and bl.segments:
+                # TODO check if tags exits in other mode
                 # tag is EventArray that should be attached to Block
                 # It is attched to the first Segment
                 times = []
                 labels = []
                 comments = []
                 for i, tag in enumerate(header['listTag']):
-                    times.append(tag['lTagTime']/sampling_rate)
+                    tag_time = tag['lTagTime'] / sampling_rate
+                    if (t_start is not None and tag_time < t_start) or \
+                            (t_stop is not None and tag_time > t_stop):
+                        continue
+                    times.append(tag_time)
                     labels.append(str(tag['nTagType']))
                     comments.append(clean_string(tag['sComment']))
-                times = np.array(times)
+                times = np.array([t.simplified.magnitude for t in times])
                 labels = np.array(labels, dtype='S')
                 comments = np.array(comments, dtype='S')
                 # attach all tags to the first segment.
@@ -335,10 +485,45 @@ class AxonIO(BaseIO):
         bl.create_many_to_one_relationship()
         return bl
 
-    def read_header(self,):
+    def read_header(self, metadata_only=False):
         """
         read the header of the file
 
+        The header is parsed once per (filename, modification time, size)
+        and cached, up to the _HEADER_CACHE_SIZE most recently used
+        headers; the returned object is shared and read-only
+        (dicts are read-only, lists are tuples, arrays are not writeable).
+
+        If metadata_only is True, the tags, DAC and epoch sections are not
+        parsed, which is enough for querying the version, the number of
+        episodes and channels or the sampling rate. A full header is
+        returned instead if one is already cached.
+        """
+        filename = os.path.abspath(self.filename)
+        stat = os.stat(filename)
+        key = (filename, stat.st_mtime, stat.st_size)
+        keys = [key + (False, )]
+        if metadata_only:
+            keys.append(key + (True, ))
+        for k in keys:
+            if k in _header_cache:
+                # most recently used headers are at the end
+                header = _header_cache.pop(k)
+                _header_cache[k] = header
+                return header
+
+        header = self._parse_header(metadata_only=metadata_only)
+        if header is not None:
+            header = _freeze(header)
+            _header_cache[key + (metadata_only, )] = header
+            while len(_header_cache) > _HEADER_CACHE_SIZE:
+                _header_cache.popitem(last=False)
+        return header
+
+    def _parse_header(self, metadata_only=False):
+        """
+        parse the header of the file
+
         The strategy here differs from the original script under Matlab.
         In the original script for ABF2, it completes the header with
         information that is located in other structures.
@@ -361,6 +546,7 @@ class AxonIO(BaseIO):
         elif f_file_signature == b'ABF2':
             header_description = headerDescriptionV2
         else:
+            fid.close()
             return None
 
         # construct dict
@@ -384,18 +570,14 @@ class AxonIO(BaseIO):
 
         if header['fFileVersionNumber'] < 2.:
             # tags
-            listTag = []
-            for i in range(header['lNumTagEntries']):
-                fid.seek(header['lTagSectionPtr'] + i * 64)
-                tag = {}
-                for key, fmt in TagInfoDescription:
-                    val = fid.read_f(fmt)
-                    if len(val) == 1:
-                        tag[key] = val[0]
-                    else:
-                        tag[key] = np.array(val)
-                listTag.append(tag)
-            header['listTag'] = listTag
+            if not metadata_only:
+                listTag = []
+                for i in range(header['lNumTagEntries']):
+                    tag = fid.read_record(
+                        TagInfoDescription,
+                        offset=header['lTagSectionPtr'] + i * 64)
+                    listTag.append(tag)
+                header['listTag'] = listTag
             #protocol name formatting #TODO move to read_protocol?
             header['sProtocolPath'] = clean_string(header['sProtocolPath'])
             header['sProtocolPath'] = header['sProtocolPath'].\
@@ -432,43 +614,32 @@ class AxonIO(BaseIO):
             header['listADCInfo'] = []
             for i in range(sections['ADCSection']['llNumEntries']):
                 # read ADCInfo
-                fid.seek(sections['ADCSection']['uBlockIndex'] *
-                         BLOCKSIZE + sections['ADCSection']['uBytes'] * i)
-                ADCInfo = {}
-                for key, fmt in ADCInfoDescription:
-                    val = fid.read_f(fmt)
-                    if len(val) == 1:
-                        ADCInfo[key] = val[0]
-                    else:
-                        ADCInfo[key] = np.array(val)
+                ADCInfo = fid.read_record(
+                    ADCInfoDescription,
+                    offset=sections['ADCSection']['uBlockIndex'] *
+                    BLOCKSIZE + sections['ADCSection']['uBytes'] * i)
                 ADCInfo['ADCChNames'] = strings[ADCInfo['lADCChannelNameIndex'] - 1]
                 ADCInfo['ADCChUnits'] = strings[ADCInfo['lADCUnitsIndex'] - 1]
                 header['listADCInfo'].append(ADCInfo)
 
             # protocol sections
-            protocol = {}
-            fid.seek(sections['ProtocolSection']['uBlockIndex'] * BLOCKSIZE)
-            for key, fmt in protocolInfoDescription:
-                val = fid.read_f(fmt)
-                if len(val) == 1:
-                    protocol[key] = val[0]
-                else:
-                    protocol[key] = np.array(val)
+            protocol = fid.read_record(
+                protocolInfoDescription,
+                offset=sections['ProtocolSection']['uBlockIndex'] * BLOCKSIZE)
             header['protocol'] = protocol
             header['sProtocolPath'] = strings[header['uProtocolPathIndex']-1]
 
+            if metadata_only:
+                fid.close()
+                return header
+
             # tags
             listTag = []
             for i in range(sections['TagSection']['llNumEntries']):
-                fid.seek(sections['TagSection']['uBlockIndex'] *
-                         BLOCKSIZE + sections['TagSection']['uBytes'] * i)
-                tag = {}
-                for key, fmt in TagInfoDescription:
-                    val = fid.read_f(fmt)
-                    if len(val) == 1:
-                        tag[key] = val[0]
-                    else:
-                        tag[key] = np.array(val)
+                tag = fid.read_record(
+                    TagInfoDescription,
+                    offset=sections['TagSection']['uBlockIndex'] *
+                    BLOCKSIZE + sections['TagSection']['uBytes'] * i)
                 listTag.append(tag)
 
             header['listTag'] = listTag
@@ -477,15 +648,10 @@ class AxonIO(BaseIO):
             header['listDACInfo'] = []
             for i in range(sections['DACSection']['llNumEntries']):
                 # read DACInfo
-                fid.seek(sections['DACSection']['uBlockIndex'] *
-                         BLOCKSIZE + sections['DACSection']['uBytes'] * i)
-                DACInfo = {}
-                for key, fmt in DACInfoDescription:
-                    val = fid.read_f(fmt)
-                    if len(val) == 1:
-                        DACInfo[key] = val[0]
-                    else:
-                        DACInfo[key] = np.array(val)
+                DACInfo = fid.read_record(
+                    DACInfoDescription,
+                    offset=sections['DACSection']['uBlockIndex'] *
+                    BLOCKSIZE + sections['DACSection']['uBytes'] * i)
                 DACInfo['DACChNames'] = strings[DACInfo['lDACChannelNameIndex']
                                                 - 1]
                 DACInfo['DACChUnits'] = strings[
@@ -502,16 +668,10 @@ class AxonIO(BaseIO):
             header['dictEpochInfoPerDAC'] = {}
             for i in range(sections['EpochPerDACSection']['llNumEntries']):
                 #  read DACInfo
-                fid.seek(sections['EpochPerDACSection']['uBlockIndex'] *
-                         BLOCKSIZE +
-                         sections['EpochPerDACSection']['uBytes'] * i)
-                EpochInfoPerDAC = {}
-                for key, fmt in EpochInfoPerDACDescription:
-                    val = fid.read_f(fmt)
-                    if len(val) == 1:
-                        EpochInfoPerDAC[key] = val[0]
-                    else:
-                        EpochInfoPerDAC[key] = np.array(val)
+                EpochInfoPerDAC = fid.read_record(
+                    EpochInfoPerDACDescription,
+                    offset=sections['EpochPerDACSection']['uBlockIndex'] *
+                    BLOCKSIZE + sections['EpochPerDACSection']['uBytes'] * i)
 
                 DACNum = EpochInfoPerDAC['nDACNum']
                 EpochNum = EpochInfoPerDAC['nEpochNum']
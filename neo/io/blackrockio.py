@@ -1739,7 +1739,7 @@ class BlackrockIO(BaseIO):
         # mask for given time interval
         mask = (times >= n_start) & (times < n_stop)
         if np.sum(mask) > 0:
-            ev = Event(
+            ev = Event.from_trusted_array(
                 times=times[mask].astype(float),
                 labels=labels[mask],
                 name=ev_dict['name'],
@@ -1774,13 +1774,16 @@ class BlackrockIO(BaseIO):
         else:
             times = np.array([]) * event_unit
 
-        st = SpikeTrain(
+        st = SpikeTrain.from_trusted_array(
             times=times,
             name=name,
             description=desc,
             file_origin='.'.join([self._filenames['nev'], 'nev']),
             t_start=n_start,
             t_stop=n_stop)
+        # the spike packets of a nev file are in time order, which lets
+        # SpikeTrain.time_slice use a binary search
+        st._sorted = True
 
         if lazy:
             st.lazy_shape = np.shape(times)
@@ -1902,8 +1905,9 @@ class BlackrockIO(BaseIO):
 
             t_start = data_times[0].rescale(nsx_time_unit)
 
-        anasig = AnalogSignal(
-            signal=pq.Quantity(sig_ch, sig_unit, copy=False),
+        anasig = AnalogSignal.from_trusted_array(
+            signal=sig_ch,
+            units=sig_unit,
             sampling_rate=sampling_rate,
             t_start=t_start,
             name=labels[idx_ch],
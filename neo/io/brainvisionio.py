@@ -17,6 +17,7 @@ import numpy as np
 import quantities as pq
 
 from neo.io.baseio import BaseIO
+from neo.io.proxyobjects import AnalogSignalProxy, memmap_signals
 from neo.core import Segment, AnalogSignal, Event
 
 
@@ -69,8 +70,9 @@ class BrainVisionIO(BaseIO):
 
         assert header['Common Infos'][
             'DataFormat'] == 'BINARY', NotImplementedError
-        assert header['Common Infos'][
-            'DataOrientation'] == 'MULTIPLEXED', NotImplementedError
+        orientation = header['Common Infos']['DataOrientation']
+        assert orientation in ('MULTIPLEXED', 'VECTORIZED'), \
+            NotImplementedError
         nb_channel = int(header['Common Infos']['NumberOfChannels'])
         sampling_rate = 1.e6 / float(
             header['Common Infos']['SamplingInterval']) * pq.Hz
@@ -85,32 +87,26 @@ class BrainVisionIO(BaseIO):
         if not cascade:
             return seg
 
-        # read binary
-        if not lazy:
-            binary_file = os.path.splitext(self.filename)[0] + '.eeg'
-            sigs = np.memmap(binary_file, dt, 'r', ).astype('f')
-
-            n = int(sigs.size / nb_channel)
-            sigs = sigs[:n * nb_channel]
-            sigs = sigs.reshape(n, nb_channel)
+        # memory-map binary
+        binary_file = os.path.splitext(self.filename)[0] + '.eeg'
+        sigs = memmap_signals(binary_file, dt, nb_channel,
+                              interleaved=orientation == 'MULTIPLEXED')
 
         for c in range(nb_channel):
             name, ref, res, units = header['Channel Infos'][
                 'Ch%d' % (c + 1,)].split(',')
             units = pq.Quantity(1, units.replace('µ', 'u'))
+            gain = 1.
+            if dt == np.int16 or dt == np.int32:
+                gain = float(res)
+            anasig = AnalogSignalProxy(sigs[:, c], units=units,
+                                       sampling_rate=sampling_rate,
+                                       gain=gain, dtype='f', name=name,
+                                       channel_index=c)
             if lazy:
-                signal = [] * units
+                anasig = anasig.lazy_signal()
             else:
-                signal = sigs[:,c]*units
-                if dt == np.int16 or dt == np.int32:
-                    signal *= np.float(res) 
-            anasig = AnalogSignal(signal = signal,
-                                                channel_index = c,
-                                                name = name,
-                                                sampling_rate = sampling_rate,
-                                                )
-            if lazy:
-                anasig.lazy_shape = -1
+                anasig = anasig.load()
             seg.analogsignals.append(anasig)
 
         # read marker
@@ -145,7 +141,7 @@ class BrainVisionIO(BaseIO):
 def read_brain_soup(filename):
     section = None
     all_info = {}
-    for line in open(filename, 'rU'):
+    for line in open(filename):
         line = line.strip('\n').strip('\r')
         if line.startswith('['):
             section = re.findall('\[([\S ]+)\]', line)[0]
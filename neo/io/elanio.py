@@ -28,6 +28,7 @@ import numpy as np
 import quantities as pq
 
 from neo.io.baseio import BaseIO
+from neo.io.proxyobjects import AnalogSignalProxy, memmap_signals
 from neo.core import Segment, AnalogSignal, Event
 
 
@@ -92,7 +93,7 @@ class ElanIO(BaseIO):
 
         # # Read header file
 
-        f = open(self.filename + '.ent', 'rU')
+        f = open(self.filename + '.ent')
         #version
         version = f.readline()
         if version[:2] != 'V2' and version[:2] != 'V3':
@@ -193,30 +194,29 @@ class ElanIO(BaseIO):
 
         f.close()
 
-        #raw data
+        #raw data, big-endian and interleaved, memory-mapped
         n = int(round(np.log(max_logic[0] - min_logic[0]) / np.log(2)) / 8)
-        data = np.fromfile(self.filename, dtype='i' + str(n))
-        data = data.byteswap().reshape(
-            (data.size / (nbchannel + 2), nbchannel + 2)).astype('f4')
+        data = memmap_signals(self.filename, '>i' + str(n), nbchannel + 2)
         for c in range(nbchannel):
-            if lazy:
-                sig = []
-            else:
-                sig = (data[:, c] - min_logic[c]) / (
-                    max_logic[c] - min_logic[c]) * \
-                    (max_physic[c] - min_physic[c]) + min_physic[c]
+            # linear conversion of the logical range to the physical one
+            gain = (max_physic[c] - min_physic[c]) / (
+                max_logic[c] - min_logic[c])
+            offset = min_physic[c] - min_logic[c] * gain
 
             try:
                 unit = pq.Quantity(1, units[c])
             except:
                 unit = pq.Quantity(1, '')
 
-            ana_sig = AnalogSignal(
-                sig * unit, sampling_rate=sampling_rate,
-                t_start=0. * pq.s, name=labels[c], channel_index=c)
-            if lazy:
-                ana_sig.lazy_shape = data.shape[0]
+            ana_sig = AnalogSignalProxy(
+                data[:, c], units=unit, sampling_rate=sampling_rate,
+                gain=gain, offset=offset, t_start=0. * pq.s, dtype='f4',
+                name=labels[c], channel_index=c)
             ana_sig.annotate(channel_name=labels[c])
+            if lazy:
+                ana_sig = ana_sig.lazy_signal()
+            else:
+                ana_sig = ana_sig.load()
             seg.analogsignals.append(ana_sig)
 
         # triggers
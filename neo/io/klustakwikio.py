@@ -16,23 +16,17 @@ weren't set. Consider removing those annotations if they are redundant.
 
 import glob
 import logging
+import multiprocessing
 import os.path
 import shutil
 
 # note neo.core need only numpy and quantitie
 import numpy as np
-try:
-    import matplotlib.mlab as mlab
-except ImportError as err:
-    HAVE_MLAB = False
-    MLAB_ERR = err
-else:
-    HAVE_MLAB = True
-    MLAB_ERR = None
 
 
 # I need to subclass BaseIO
 from neo.io.baseio import BaseIO
+from neo.io.tools import read_numeric_table
 
 from neo.core import Block, Segment, Unit, SpikeTrain
 
@@ -106,8 +100,6 @@ class KlustaKwikIO(BaseIO):
         sampling_rate : in Hz, necessary because the KlustaKwik files
             stores data in samples.
         """
-        if not HAVE_MLAB:
-            raise MLAB_ERR
         BaseIO.__init__(self)
         #self.filename = os.path.normpath(filename)
         self.filename, self.basename = os.path.split(os.path.abspath(filename))
@@ -164,33 +156,45 @@ class KlustaKwikIO(BaseIO):
             if len(spks) != len(uids):
                 raise ValueError("lengths of fet and clu files are different")
 
+            # Sort the spikes by cluster in one pass, keeping them in time
+            # order within each cluster, so that the spikes and features of
+            # each cluster are contiguous slices of a single array
+            order = np.argsort(uids, kind='mergesort')
+            unique_unit_ids, first, counts = np.unique(
+                uids[order], return_index=True, return_counts=True)
+            t_stop = spks.max() / self.sampling_rate if len(spks) else 0.0
+            if not lazy:
+                times = spks[order] / self.sampling_rate
+                if features.shape[1] != 0:
+                    features = features[order]
+
             # Create Unit for each cluster
-            unique_unit_ids = np.unique(uids)
-            for unit_id in sorted(unique_unit_ids):
+            for unit_id, i, n in zip(unique_unit_ids, first, counts):
                 # Initialize the unit
                 u = Unit(name=('unit %d from group %d' % (unit_id, group)),
                     index=unit_id, group=group)
 
                 # Initialize a new SpikeTrain for the spikes from this unit
                 if lazy:
-                    st = SpikeTrain(
+                    st = SpikeTrain.from_trusted_array(
                         times=[],
-                        units='sec', t_start=0.0,
-                        t_stop=spks.max() / self.sampling_rate,
+                        units='sec', t_start=0.0, t_stop=t_stop,
                         name=('unit %d from group %d' % (unit_id, group)))
-                    st.lazy_shape = len(spks[uids==unit_id])
+                    st.lazy_shape = n
                 else:
-                    st = SpikeTrain(
-                        times=spks[uids==unit_id] / self.sampling_rate,
-                        units='sec', t_start=0.0,
-                        t_stop=spks.max() / self.sampling_rate,
+                    st = SpikeTrain.from_trusted_array(
+                        times=times[i:i + n],
+                        units='sec', t_start=0.0, t_stop=t_stop,
                         name=('unit %d from group %d' % (unit_id, group)))
+                # the spikes are in time order within each cluster, which
+                # lets SpikeTrain.time_slice use a binary search
+                st._sorted = True
                 st.annotations['cluster'] = unit_id
                 st.annotations['group'] = group
 
-                # put features in
-                if not lazy and len(features) != 0:
-                    st.annotations['waveform_features'] = features
+                # put in the features of this unit's spikes, as a view
+                if not lazy and features.shape[1] != 0:
+                    st.annotations['waveform_features'] = features[i:i + n]
 
                 # Link
                 u.spiketrains.append(st)
@@ -202,58 +206,52 @@ class KlustaKwikIO(BaseIO):
     # Helper hidden functions for reading
     def _load_spike_times(self, fetfilename):
         """Reads and returns the spike times and features"""
-        f = file(fetfilename, 'r')
-
-        # Number of clustering features is integer on first line
-        nbFeatures = int(f.readline().strip())
+        with open(fetfilename, 'rb') as f:
+            # Number of clustering features is integer on first line
+            nbFeatures = int(f.readline().strip())
 
-        # Each subsequent line consists of nbFeatures values, followed by
-        # the spike time in samples.
-        names = ['fet%d' % n for n in xrange(nbFeatures)]
-        names.append('spike_time')
+            # Each subsequent line consists of nbFeatures values, followed
+            # by the spike time in samples.
+            data = read_numeric_table(f, nbFeatures + 1)
 
-        # Load into recarray
-        data = mlab.csv2rec(f, names=names, skiprows=1, delimiter=' ')
-        f.close()
+        # The format stores integers, keep them as such
+        if np.array_equal(data, np.rint(data)):
+            data = data.astype(np.int64)
 
-        # get features
-        features = np.array([data['fet%d' % n] for n in xrange(nbFeatures)])
-
-        # Return the spike_time column
-        return data['spike_time'], features.transpose()
+        # Return the spike_time column and the features
+        return data[:, -1], data[:, :-1]
 
     def _load_unit_id(self, clufilename):
         """Reads and return the cluster ids as int32"""
-        f = file(clufilename, 'r')
-
-        # Number of clusters on this tetrode is integer on first line
-        nbClusters = int(f.readline().strip())
-
-        # Read each cluster name as a string
-        cluster_names = f.readlines()
-        f.close()
-
-        # Convert names to integers
-        # I think the spec requires cluster names to be integers, but
-        # this code could be modified to support string names which are
-        # auto-numbered.
-        try:
-            cluster_ids = [int(name) for name in cluster_names]
-        except ValueError:
+        with open(clufilename, 'rb') as f:
+            # Number of clusters on this tetrode is integer on first line
+            nbClusters = int(f.readline().strip())
+
+            # Read the cluster ids
+            # I think the spec requires cluster names to be integers, but
+            # this code could be modified to support string names which are
+            # auto-numbered.
+            try:
+                cluster_ids = read_numeric_table(f, 1).ravel()
+            except ValueError:
+                raise ValueError("Could not convert cluster name to "
+                                 "integer in %s" % clufilename)
+        if not np.array_equal(cluster_ids, np.rint(cluster_ids)):
             raise ValueError(
                 "Could not convert cluster name to integer in %s" % clufilename)
 
         # convert to numpy array and error check
-        cluster_ids = np.array(cluster_ids, dtype=np.int32)
-        if len(np.unique(cluster_ids)) != nbClusters:
+        cluster_ids = cluster_ids.astype(np.int32)
+        n_unique = len(np.unique(cluster_ids))
+        if n_unique != nbClusters:
             logging.warning("warning: I got %d clusters instead of %d in %s" % (
-                len(np.unique(cluster_ids)), nbClusters, clufilename))
+                n_unique, nbClusters, clufilename))
 
         return cluster_ids
 
 
     # writing functions
-    def write_block(self, block):
+    def write_block(self, block, parallel=False):
         """Write spike times and unit ids to disk.
 
         Currently descends hierarchy from block to segment to spiketrain.
@@ -276,26 +274,27 @@ class KlustaKwikIO(BaseIO):
 
         If the files already exist, backup copies are created by appending
         the filenames with a "~".
+
+        The lines of each file are formatted in large chunks, each written
+        in one call.  If `parallel` is True, the groups are written at the
+        same time by a pool of worker processes.
         """
         # set basename
         if self.basename is None:
             logging.warning("warning: no basename provided, using `basename`")
             self.basename = 'basename'
 
-        # First create file handles for each group which will be stored
-        self._make_all_file_handles(block)
-
+        # Collect the spike times (in samples), features and cluster of
+        # each spiketrain, by group
+        group2trains = {}
+        group2clusters = {}
         # We'll detect how many features belong in each group
         self._group2features = {}
 
         # Iterate through segments in this block
         for seg in block.segments:
-            # Write each spiketrain of the segment
             for st in seg.spiketrains:
-                # Get file handles for this spiketrain using its group
                 group = self.st2group(st)
-                fetfilehandle = self._fetfilehandles[group]
-                clufilehandle = self._clufilehandles[group]
 
                 # Get the id to write to clu file for this spike train
                 cluster = self.st2cluster(st)
@@ -308,15 +307,14 @@ class KlustaKwikIO(BaseIO):
 
                 # Convert to samples
                 spike_times_in_samples = np.rint(
-                    np.array(st) * sr).astype(np.int)
+                    np.array(st) * sr).astype(np.int64)
 
                 # Try to get features from spiketrain
                 try:
                     all_features = st.annotations['waveform_features']
                 except KeyError:
                     # Use empty
-                    all_features = [
-                        [] for _ in range(len(spike_times_in_samples))]
+                    all_features = np.empty((len(spike_times_in_samples), 0))
                 all_features = np.asarray(all_features)
                 if all_features.ndim != 2:
                     raise ValueError("waveform features should be 2d array")
@@ -328,29 +326,36 @@ class KlustaKwikIO(BaseIO):
                     # First time through .. set number of features
                     n_features = all_features.shape[1]
                     self._group2features[group] = n_features
-
-                    # and write to first line of file
-                    fetfilehandle.write("%d\n" % n_features)
+                    group2trains[group] = []
+                    group2clusters[group] = []
                 if n_features != all_features.shape[1]:
                     raise ValueError("inconsistent number of features: " +
                         "supposed to be %d but I got %d" %\
                         (n_features, all_features.shape[1]))
 
-                # Write features and time for each spike
-                for stt, features in zip(spike_times_in_samples, all_features):
-                    # first features
-                    for val in features:
-                        fetfilehandle.write(str(val))
-                        fetfilehandle.write(" ")
-
-                    # now time
-                    fetfilehandle.write("%d\n" % stt)
-
-                    # and cluster id
-                    clufilehandle.write("%d\n" % cluster)
-
-        # We're done, so close the files
-        self._close_all_files()
+                group2trains[group].append(
+                    (spike_times_in_samples, all_features, cluster))
+                if cluster not in group2clusters[group]:
+                    group2clusters[group].append(cluster)
+
+        tasks = []
+        for group, trains in group2trains.items():
+            fetfilename, clufilename = self._new_group(group)
+            tasks.append((fetfilename, clufilename,
+                          len(group2clusters[group]),
+                          self._group2features[group], trains))
+
+        if parallel and len(tasks) > 1:
+            pool = multiprocessing.Pool(min(len(tasks),
+                                            multiprocessing.cpu_count()))
+            try:
+                pool.map(_write_group_task, tasks)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            for task in tasks:
+                _write_group_task(task)
 
     # Helper functions for writing
     def st2group(self, st):
@@ -367,29 +372,9 @@ class KlustaKwikIO(BaseIO):
         except KeyError:
             return 0
 
-    def _make_all_file_handles(self, block):
-        """Get the tetrode (group) of each neuron (cluster) by descending
-        the hierarchy through segment and block.
-        Store in a dict {group_id: list_of_clusters_in_that_group}
-        """
-        group2clusters = {}
-        for seg in block.segments:
-            for st in seg.spiketrains:
-                group = self.st2group(st)
-                cluster = self.st2cluster(st)
-
-                if group in group2clusters:
-                    if cluster not in group2clusters[group]:
-                        group2clusters[group].append(cluster)
-                else:
-                    group2clusters[group] = [cluster]
-
-        # Make new file handles for each group
-        self._fetfilehandles, self._clufilehandles = {}, {}
-        for group, clusters in group2clusters.items():
-            self._new_group(group, nbClusters=len(clusters))
-
-    def _new_group(self, id_group, nbClusters):
+    def _new_group(self, id_group):
+        """Return the names of the fet and clu files of a group, after
+        backing up the existing files"""
         # generate filenames
         fetfilename = os.path.join(self.filename,
             self.basename + ('.fet.%d' % id_group))
@@ -402,17 +387,41 @@ class KlustaKwikIO(BaseIO):
         if os.path.exists(clufilename):
             shutil.copyfile(clufilename, clufilename + '~')
 
-        # create file handles
-        self._fetfilehandles[id_group] = file(fetfilename, 'w')
-        self._clufilehandles[id_group] = file(clufilename, 'w')
+        return fetfilename, clufilename
+
+
+def _write_group_task(task):
+    """Unpack the arguments of `_write_group`, for `Pool.map`"""
+    return _write_group(*task)
 
-        # write out first line
-        #self._fetfilehandles[id_group].write("0\n") # Number of features
-        self._clufilehandles[id_group].write("%d\n" % nbClusters)
 
-    def _close_all_files(self):
-        for val in self._fetfilehandles.values(): val.close()
-        for val in self._clufilehandles.values(): val.close()
+def _write_group(fetfilename, clufilename, nbClusters, nbFeatures, trains,
+                 chunk_size=65536):
+    """Write the fet and clu files of a group.
+
+    `trains` is a list of (spike times in samples, features, cluster id)
+    tuples.  The lines are formatted by chunks of `chunk_size` spikes, with
+    a single string formatting operation and a single write per chunk.
+    """
+    with open(fetfilename, 'w') as fetfile:
+        with open(clufilename, 'w') as clufile:
+            fetfile.write("%d\n" % nbFeatures)
+            clufile.write("%d\n" % nbClusters)
+            for spike_times, features, cluster in trains:
+                # features, as integers if they are, then the time
+                if features.dtype.kind in 'biu':
+                    line = "%d " * nbFeatures + "%d\n"
+                else:
+                    line = "%r " * nbFeatures + "%d\n"
+                if nbFeatures:
+                    rows = np.column_stack([features, spike_times])
+                else:
+                    rows = spike_times.reshape(-1, 1)
+                for i in range(0, len(rows), chunk_size):
+                    chunk = rows[i:i + chunk_size]
+                    fetfile.write((line * len(chunk)) %
+                                  tuple(chunk.ravel().tolist()))
+                clufile.write(("%d\n" % cluster) * len(spike_times))
 
 
 class FilenameParser:
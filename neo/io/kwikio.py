@@ -44,6 +44,7 @@ from neo.io.baseio import BaseIO
 # to import from core
 from neo.core import (Segment, SpikeTrain, Unit, Epoch, AnalogSignal,
                       ChannelIndex, Block)
+from neo.io.proxyobjects import AnalogSignalProxy
 import neo.io.tools
 
 
@@ -98,6 +99,7 @@ class KwikIO(BaseIO):
                    cluster_group=None,
                    raw_data_units='uV',
                    get_raw_data=False,
+                   raw_waveforms=False,
                    ):
         """
         Reads a block with segments and channel_indexes
@@ -105,8 +107,14 @@ class KwikIO(BaseIO):
         Parameters:
         get_waveforms: bool, default = False
             Wether or not to get the waveforms
+        raw_waveforms: bool, default = False
+            If True, the waveforms are cut from the raw traces with
+            :meth:`read_waveforms`, for all the clusters of a channel group
+            at once, instead of being loaded one cluster at a time by klusta
         get_raw_data: bool, default = False
-            Wether or not to get the raw traces
+            Wether or not to get the raw traces. If lazy is True, the empty
+            signal keeps an :class:`AnalogSignalProxy` of them in its
+            `lazy_proxy` attribute
         raw_data_units: str, default = "uV"
             SI units of the raw trace according to voltage_gain given to klusta
         cluster_group: str, default = None
@@ -126,17 +134,23 @@ class KwikIO(BaseIO):
                                    **group_meta)
                 blk.channel_indexes.append(chx)
                 clusters = model.spike_clusters
+                waveforms = None
+                if get_waveforms and raw_waveforms and not lazy:
+                    waveforms = self.read_waveforms(model,
+                                                    units=raw_data_units)
                 for cluster_id in model.cluster_ids:
                     meta = model.cluster_metadata[cluster_id]
                     if cluster_group is None:
                         pass
                     elif cluster_group != meta:
                         continue
-                    sptr = self.read_spiketrain(cluster_id=cluster_id,
-                                                model=model, lazy=lazy,
-                                                cascade=cascade,
-                                                get_waveforms=get_waveforms,
-                                                raw_data_units=raw_data_units)
+                    sptr = self.read_spiketrain(
+                        cluster_id=cluster_id, model=model, lazy=lazy,
+                        cascade=cascade,
+                        get_waveforms=get_waveforms and waveforms is None,
+                        raw_data_units=raw_data_units)
+                    if waveforms is not None:
+                        sptr.waveforms = waveforms[cluster_id]
                     sptr.annotations.update({'cluster_group': meta,
                                              'group_id': model.channel_group})
                     sptr.channel_index = chx
@@ -165,15 +179,76 @@ class KwikIO(BaseIO):
         """
         Reads analogsignals
 
+        The raw traces are memory-mapped, and scaled by the voltage gain
+        when they are read. If lazy is True, an empty signal is returned,
+        whose `lazy_proxy` attribute is an :class:`AnalogSignalProxy`, which
+        reads only the requested time range and channels of the traces with
+        its :meth:`load` and :meth:`time_slice` methods.
+
         Parameters:
         units: str, default = "uV"
             SI units of the raw trace according to voltage_gain given to klusta
         """
-        arr = model.traces[:]*model.metadata['voltage_gain']
-        ana = AnalogSignal(arr, sampling_rate=model.sample_rate*pq.Hz,
-                           units=units,
-                           file_origin=model.metadata['raw_data_files'])
-        return ana
+        ana = self._traces_proxy(model, units)
+        if lazy:
+            return ana.lazy_signal()
+        return ana.load()
+
+    def _traces_proxy(self, model, units):
+        return AnalogSignalProxy(model.traces, units=units,
+                                 sampling_rate=model.sample_rate*pq.Hz,
+                                 gain=model.metadata['voltage_gain'],
+                                 file_origin=model.metadata['raw_data_files'])
+
+    def read_waveforms(self, model, cluster_ids=None, n_before=None,
+                       n_after=None, units='uV'):
+        """
+        Cuts the waveforms of the spikes of many clusters from the raw
+        traces at once.
+
+        The traces are read by large contiguous blocks, in which the
+        waveforms of all the spikes are gathered with vectorized indexing.
+
+        Parameters:
+        model: klusta.kwik.KwikModel
+            A KwikModel object obtained by klusta.kwik.KwikModel(fname)
+        cluster_ids: list of int, default = None
+            Which clusters to load, all of them if None
+        n_before, n_after: int, default = None
+            Number of samples before and after each spike, taken from the
+            klusta parameters 'extract_s_before' and 'extract_s_after' if
+            None
+        units: str, default = "uV"
+            SI units of the raw trace according to voltage_gain given to klusta
+
+        Returns:
+        A dict of Quantity arrays of shape (spikes, channels, samples), one
+        per cluster id.
+        """
+        if cluster_ids is None:
+            cluster_ids = model.cluster_ids
+        if n_before is None:
+            n_before = model.metadata['extract_s_before']
+        if n_after is None:
+            n_after = model.metadata['extract_s_after']
+
+        clusters = np.asarray(model.spike_clusters)
+        selected = np.flatnonzero(np.in1d(clusters, cluster_ids))
+        samples = np.rint(np.asarray(model.spike_times)[selected] *
+                          model.sample_rate).astype(np.intp)
+        w = self._traces_proxy(model, units).load_waveforms(
+            samples, n_before, n_after)
+
+        # waveforms of each cluster, in the order of their spikes
+        order = np.argsort(clusters[selected], kind='mergesort')
+        ids, starts = np.unique(clusters[selected][order], return_index=True)
+        stops = np.append(starts[1:], len(order))
+        waveforms = dict((cluster_id, w[order[i:j]])
+                         for cluster_id, i, j in zip(ids, starts, stops))
+        for cluster_id in cluster_ids:
+            if cluster_id not in waveforms:
+                waveforms[cluster_id] = w[:0]
+        return waveforms
 
     def read_spiketrain(self, cluster_id, model,
                         lazy=False,
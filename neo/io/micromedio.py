@@ -25,6 +25,7 @@ import numpy as np
 import quantities as pq
 
 from neo.io.baseio import BaseIO
+from neo.io.proxyobjects import AnalogSignalProxy, memmap_signals
 from neo.core import Segment, AnalogSignal, Epoch, Event
 
 
@@ -128,11 +129,9 @@ class MicromedIO(BaseIO):
             zones[zname] = zname2, pos, length
             #~ print zname2, pos, length
 
-        # reading raw data
-        if not lazy:
-            f.seek(Data_Start_Offset, 0)
-            rawdata = np.fromstring(f.read(), dtype='u' + str(Bytes))
-            rawdata = rawdata.reshape((rawdata.size / Num_Chan, Num_Chan))
+        # memory-mapping raw data
+        rawdata = memmap_signals(self.filename, '<u' + str(Bytes), Num_Chan,
+                                 bytes_offset=Data_Start_Offset)
 
         # Reading Code Info
         zname2, pos, length = zones['ORDER']
@@ -160,19 +159,19 @@ class MicromedIO(BaseIO):
             sampling_rate, = f.read_f('H') * pq.Hz
             sampling_rate *= Rate_Min
 
+            factor = float(physical_max - physical_min) / float(
+                logical_max - logical_min + 1)
+            ana_sig = AnalogSignalProxy(rawdata[:, c], units=unit,
+                                        sampling_rate=sampling_rate,
+                                        gain=factor,
+                                        offset=-logical_ground * factor,
+                                        dtype='f', name=label,
+                                        channel_index=c)
+            ana_sig.annotate(ground=ground)
             if lazy:
-                signal = [] * unit
+                ana_sig = ana_sig.lazy_signal()
             else:
-                factor = float(physical_max - physical_min) / float(
-                    logical_max - logical_min + 1)
-                signal = (rawdata[:, c].astype(
-                    'f') - logical_ground) * factor * unit
-
-            ana_sig = AnalogSignal(signal, sampling_rate=sampling_rate,
-                                   name=label, channel_index=c)
-            if lazy:
-                ana_sig.lazy_shape = None
-            ana_sig.annotate(ground=ground)
+                ana_sig = ana_sig.load()
 
             seg.analogsignals.append(ana_sig)
 
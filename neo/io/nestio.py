@@ -15,6 +15,7 @@ Authors: Julia Sprenger, Maximilian Schmidt, Johanna Senk
 # needed for Python3 compatibility
 from __future__ import absolute_import
 
+import json
 import os.path
 import warnings
 from datetime import datetime
@@ -22,6 +23,7 @@ import numpy as np
 import quantities as pq
 
 from neo.io.baseio import BaseIO
+from neo.io.tools import iter_numeric_table
 from neo.core import Block, Segment, SpikeTrain, AnalogSignal
 
 value_type_dict = {'V': pq.mV,
@@ -46,6 +48,12 @@ class NestIO(BaseIO):
                              id_column_gdf=0, time_column_gdf=1,
                              id_column_dat=0, time_column_dat=1,
                              value_columns_dat=2)
+
+    The ASCII files can be converted on first read to a binary copy sorted
+    by neuron ID and time, which later reads memory-map instead of parsing
+    the text again:
+
+        r = NestIO(filenames=files, cache=True)
     """
 
     is_readable = True  # class supports reading, but not writing
@@ -63,18 +71,24 @@ class NestIO(BaseIO):
     extensions = ['gdf', 'dat']
     mode = 'file'
 
-    def __init__(self, filenames=None):
+    def __init__(self, filenames=None, cache=False):
         """
         Parameters
         ----------
             filenames: string or list of strings, default=None
                 The filename or list of filenames to load.
+            cache: bool or string, default=False
+                If True, a binary copy of each file, sorted by neuron ID
+                and time, is stored next to it on first read and used by
+                later reads as long as the file is not modified. A string
+                gives the directory in which to store these copies.
         """
 
         if isinstance(filenames, str):
             filenames = [filenames]
 
         self.filenames = filenames
+        self.cache = cache
         self.avail_formats = {}
         self.avail_IOs = {}
 
@@ -129,24 +143,25 @@ class NestIO(BaseIO):
                     'the same data. Columns were specified to %s.'
                     '' % column_list_no_None)
 
-        # extracting condition and sorting parameters for raw data loading
-        (condition, condition_column,
-         sorting_column) = self._get_conditions_and_sorting(id_column,
-                                                            time_column,
-                                                            gid_list,
-                                                            t_start,
-                                                            t_stop)
-        # loading raw data columns
-        data = self.avail_IOs['dat'].get_columns(
-                column_ids=column_ids,
-                condition=condition,
-                condition_column=condition_column,
-                sorting_columns=sorting_column)
+        # loading raw data columns, filtering the rows while reading
+        data = self._get_data('dat', column_ids, id_column, time_column,
+                              gid_list, t_start, t_stop, time_unit)
+
+        if (sampling_period is None and time_column is not None and
+                len(np.unique(data[:, 1])) < 2):
+            # not enough samples in the time range to estimate the
+            # sampling period, use all of them
+            sampling_data = self._get_data('dat', column_ids, id_column,
+                                           time_column, gid_list,
+                                           -np.inf * pq.s, np.inf * pq.s,
+                                           time_unit)
+        else:
+            sampling_data = data
 
         sampling_period = self._check_input_sampling_period(sampling_period,
                                                             time_column,
                                                             time_unit,
-                                                            data)
+                                                            sampling_data)
         analogsignal_list = []
 
         if not lazy:
@@ -175,8 +190,10 @@ class NestIO(BaseIO):
 
                     # create AnalogSignal objects and annotate them with
                     #  the neuron ID
-                    analogsignal_list.append(AnalogSignal(
-                            signal * value_units[v_id],
+                    analogsignal_list.append(
+                        AnalogSignal.from_trusted_array(
+                            signal.copy(),
+                            units=value_units[v_id],
                             sampling_period=sampling_period,
                             t_start=anasig_start_time,
                             id=i,
@@ -219,15 +236,13 @@ class NestIO(BaseIO):
             if cid is None:
                 column_ids[i] = -1
 
-        (condition, condition_column, sorting_column) = \
-            self._get_conditions_and_sorting(id_column, time_column,
-                                             gdf_id_list, t_start, t_stop)
+        # only the rows of the requested neurons and time range are read
+        data = self._get_data('gdf', column_ids, id_column, time_column,
+                              gdf_id_list, t_start, t_stop, time_unit)
 
-        data = self.avail_IOs['gdf'].get_columns(
-                column_ids=column_ids,
-                condition=condition,
-                condition_column=condition_column,
-                sorting_columns=sorting_column)
+        # the spike times of all the trains are views into a single
+        # contiguous array, which holds only the selected spikes
+        times = data[:, time_column].copy()
 
         # create a list of SpikeTrains for all neuron IDs in gdf_id_list
         # assign spike times to neuron IDs if id_column is given
@@ -240,20 +255,22 @@ class NestIO(BaseIO):
                 selected_ids = self._get_selected_ids(nid, id_column,
                                                       time_column, t_start,
                                                       t_stop, time_unit, data)
-                times = data[selected_ids[0]:selected_ids[1], time_column]
-                spiketrain_list.append(SpikeTrain(
-
-                        times, units=time_unit,
-                        t_start=t_start, t_stop=t_stop,
+                spiketrain_list.append(SpikeTrain.from_trusted_array(
+                        times[selected_ids[0]:selected_ids[1]],
+                        units=time_unit, t_start=t_start, t_stop=t_stop,
                         id=nid, **args))
 
         # if id_column is not given, all spike times are collected in one
         #  spike train with id=None
         else:
-            train = data[:, time_column]
-            spiketrain_list = [SpikeTrain(train, units=time_unit,
-                                          t_start=t_start, t_stop=t_stop,
-                                          id=None, **args)]
+            spiketrain_list = [SpikeTrain.from_trusted_array(
+                times, units=time_unit, t_start=t_start,
+                t_stop=t_stop, id=None, **args)]
+
+        # data is sorted by time (within each gid), which lets
+        # SpikeTrain.time_slice use a binary search
+        for st in spiketrain_list:
+            st._sorted = True
         return spiketrain_list
 
     def _check_input_times(self, t_start, t_stop, mandatory=True):
@@ -399,7 +416,7 @@ class NestIO(BaseIO):
         curr_id = 0
         if ((gid_list != [None]) and (gid_list is not None)):
             if gid_list != []:
-                condition = lambda x: x in gid_list
+                condition = lambda x: np.in1d(x, list(gid_list))
                 condition_column = id_column
             sorting_column.append(curr_id)  # Sorting according to gids first
             curr_id += 1
@@ -415,6 +432,78 @@ class NestIO(BaseIO):
             sorting_column = sorting_column[::-1]
         return condition, condition_column, sorting_column
 
+    def _get_data(self, ext, column_ids, id_column, time_column, gid_list,
+                  t_start, t_stop, time_unit):
+        """
+        Loads the requested columns of the rows with the selected gids and
+        times in the range [t_start, t_stop), sorted by gid and time.
+
+        The binary cache of the file is used if caching is enabled and the
+        data is sorted by gid and time, otherwise the text file is parsed.
+
+        ext: string, extension of the file to read ('gdf' or 'dat').
+        column_ids: list of int, ids of the columns to load.
+        id_column: int, id of the column containing gids.
+        time_column: int, id of the column containing times.
+        gid_list: list of int, gid to be loaded.
+        t_start: pq.quantity.Quantity, start of the time range to load.
+        t_stop: pq.quantity.Quantity, stop of the time range to load.
+        time_unit: pq.quantity.Quantity, time unit of the data to load.
+
+        Returns
+        numpy array containing the requested data.
+        """
+        (condition, condition_column,
+         sorting_column) = self._get_conditions_and_sorting(id_column,
+                                                            time_column,
+                                                            gid_list,
+                                                            t_start,
+                                                            t_stop)
+        column_io = self.avail_IOs[ext]
+        if (self.cache and id_column is not None and
+                sorting_column == [time_column, id_column]):
+            cache_dir = None
+            if not isinstance(self.cache, bool):
+                cache_dir = self.cache
+            cache = column_io.get_cache(id_column, time_column, cache_dir)
+            keys = None
+            if gid_list != []:
+                keys = list(gid_list)
+            return cache.get_columns(column_ids, keys=keys,
+                                     start=t_start.rescale(time_unit).magnitude,
+                                     stop=t_stop.rescale(time_unit).magnitude)
+
+        # the file is read by chunks, keeping only the selected rows
+        return column_io.get_columns(
+                column_ids=column_ids,
+                condition=condition,
+                condition_column=condition_column,
+                sorting_columns=sorting_column,
+                row_filter=self._get_time_filter(time_column, t_start,
+                                                 t_stop, time_unit))
+
+    def _get_time_filter(self, time_column, t_start, t_stop, time_unit):
+        """
+        Returns a function selecting the rows of a chunk of data with times
+        in the range [t_start, t_stop), or None if no time range applies.
+
+        time_column: int, id of the column containing times.
+        t_start: pq.quantity.Quantity, start of the time range to load.
+        t_stop: pq.quantity.Quantity, stop of the time range to load.
+        time_unit: pq.quantity.Quantity, time unit of the data to load.
+        """
+        if time_column is None:
+            return None
+        start = t_start.rescale(time_unit).magnitude
+        stop = t_stop.rescale(time_unit).magnitude
+        if start == -np.inf and stop == np.inf:
+            return None
+
+        def time_filter(chunk):
+            times = chunk[:, time_column]
+            return (times >= start) & (times < stop)
+        return time_filter
+
     def _get_selected_ids(self, gid, id_column, time_column, t_start, t_stop,
                           time_unit, data):
         """
@@ -659,41 +748,122 @@ class NestIO(BaseIO):
 class ColumnIO:
     '''
     Class for reading an ASCII file containing multiple columns of data.
+
+    The file is parsed in chunks, keeping only the requested rows and
+    columns of each chunk, so that files much larger than the memory can
+    be filtered.  The whole table is only loaded, once, when :attr:`data`
+    is accessed.  Text from '#' to the end of a line is a comment.  The
+    values are read as integers if the first line of data has no '.'.
     '''
 
-    def __init__(self, filename):
+    def __init__(self, filename, chunk_size=2 ** 22):
         """
         filename: string, path to ASCII file to read.
+        chunk_size: int, approximate number of bytes parsed at once.
         """
 
         self.filename = filename
+        self.chunk_size = chunk_size
+
+        # read the first line of data to check the data type (int or float)
+        # of the data and the number of columns
+        line = ''
+        with open(self.filename) as f:
+            for line in f:
+                line = line.split('#', 1)[0]
+                if line.strip():
+                    break
+
+        self.dtype = np.float64
+        if '.' not in line:
+            self.dtype = np.int32
+        self.n_columns = max(len(line.split()), 1)
+        self._data = None
+        self._caches = {}
 
-        # read the first line to check the data type (int or float) of the data
-        f = open(self.filename)
-        line = f.readline()
+    @property
+    def data(self):
+        """
+        numpy array containing the whole table.
+        """
+        if self._data is None:
+            self._data = self._read_all()
+        return self._data
 
-        additional_parameters = {}
-        if '.' not in line:
-            additional_parameters['dtype'] = np.int32
+    def _read_all(self):
+        """
+        Read the whole table.
+        """
+        chunks = list(self.iter_chunks())
+        if not chunks:
+            return np.empty((0, self.n_columns), dtype=self.dtype)
+        return np.concatenate(chunks)
 
-        self.data = np.loadtxt(self.filename, **additional_parameters)
+    def get_cache(self, key_column, sort_column, directory=None):
+        """
+        Return the :class:`ColumnCache` of the table sorted by
+        `key_column` then by `sort_column`, creating it if needed.
+
+        key_column : int, id of the column by which rows are grouped.
+        sort_column : int, id of the column by which rows are sorted
+                    within each group.
+        directory : None or string, directory of the cache files. They are
+                    stored next to the ASCII file if None.
+        """
+        key = (key_column % self.n_columns, sort_column % self.n_columns,
+               directory)
+        if key not in self._caches:
+            self._caches[key] = ColumnCache(self, key[0], key[1], directory)
+        return self._caches[key]
+
+    def iter_chunks(self, column_ids=None, row_filter=None):
+        """
+        Iterate over the table by chunks of rows.
 
-        if len(self.data.shape) == 1:
-            self.data = self.data[:, np.newaxis]
+        column_ids : None or list of int, the ids of columns to keep in
+                    each chunk, all of them if None.
+        row_filter : None or function, which is applied to each chunk (with
+                    all its columns) and returns a boolean array selecting
+                    its rows.
+
+        Yields numpy arrays with the selected rows and columns.  A
+        ValueError is raised if the table is read as integers but has a
+        value which is not an integer.
+        """
+        with open(self.filename, 'rb') as f:
+            for chunk in iter_numeric_table(f, self.n_columns,
+                                            self.chunk_size, comments='#'):
+                converted = chunk.astype(self.dtype)
+                if not np.array_equal(converted, chunk):
+                    raise ValueError('%s has values which are not integers, '
+                                     'but its first line only has integers'
+                                     % self.filename)
+                if row_filter is not None:
+                    converted = converted[row_filter(chunk)]
+                if column_ids is not None:
+                    converted = converted[:, column_ids]
+                yield converted
 
     def get_columns(self, column_ids='all', condition=None,
-                    condition_column=None, sorting_columns=None):
+                    condition_column=None, sorting_columns=None,
+                    row_filter=None):
         """
         column_ids : 'all' or list of int, the ids of columns to
                     extract.
-        condition : None or function, which is applied to each row to evaluate
-                    if it should be included in the result.
-                    Needs to return a bool value.
+        condition : None or function, which is applied to the values of
+                    `condition_column` to evaluate if the rows should be
+                    included in the result. Needs to return a bool value
+                    for each of them. Functions of a single value are
+                    vectorized, but NumPy predicates applied to whole
+                    arrays are much faster.
         condition_column : int, id of the column on which the condition
                     function is applied to
         sorting_columns : int or list of int, column ids to sort by.
                     List entries have to be ordered by increasing sorting
                     priority!
+        row_filter : None or function, which is applied to each chunk of
+                    rows (with all the columns of the file), and returns a
+                    boolean array selecting the rows to include.
 
         Returns
         -------
@@ -701,28 +871,25 @@ class ColumnIO:
         """
 
         if column_ids == [] or column_ids == 'all':
-            column_ids = range(self.data.shape[-1])
+            column_ids = range(self.n_columns)
 
         if isinstance(column_ids, (int, float)):
             column_ids = [column_ids]
         column_ids = np.array(column_ids)
 
         if column_ids is not None:
-            if max(column_ids) >= len(self.data) - 1:
+            if max(column_ids) >= self.n_columns:
                 raise ValueError('Can not load column ID %i. File contains '
                                  'only %i columns' % (max(column_ids),
-                                                      len(self.data)))
+                                                      self.n_columns))
 
         if sorting_columns is not None:
             if isinstance(sorting_columns, int):
                 sorting_columns = [sorting_columns]
-            if (max(sorting_columns) >= self.data.shape[1]):
+            if (max(sorting_columns) >= self.n_columns):
                 raise ValueError('Can not sort by column ID %i. File contains '
                                  'only %i columns' % (max(sorting_columns),
-                                                      self.data.shape[1]))
-
-        # Starting with whole dataset being selected for return
-        selected_data = self.data
+                                                      self.n_columns))
 
         # Apply filter condition to rows
         if condition and (condition_column is None):
@@ -733,21 +900,331 @@ class ColumnIO:
                           'given. No filtering will be performed.')
 
         elif (condition is not None) and (condition_column is not None):
-            condition_function = np.vectorize(condition)
-            mask = condition_function(
-                    selected_data[
-                    :, condition_column]).astype(bool)
-
-            selected_data = selected_data[mask, :]
+            row_filter = _combine_filters(
+                row_filter, _column_filter(condition, condition_column))
+
+        # Read the selected rows, keeping only the requested columns and
+        # those needed for sorting
+        column_ids = column_ids % self.n_columns
+        if sorting_columns is None:
+            needed = np.unique(column_ids)
+        else:
+            sorting_columns = np.array(sorting_columns) % self.n_columns
+            needed = np.union1d(column_ids, sorting_columns)
+        if self._data is not None:
+            chunks = [self._data[:, needed] if row_filter is None else
+                      self._data[row_filter(self._data)][:, needed]]
+        else:
+            chunks = list(self.iter_chunks(column_ids=needed,
+                                           row_filter=row_filter))
+        if not chunks:
+            selected_data = np.empty((0, len(needed)), dtype=self.dtype)
+        elif len(chunks) == 1:
+            selected_data = chunks[0]
+        else:
+            selected_data = np.concatenate(chunks)
 
         # Apply sorting if requested
         if sorting_columns is not None:
-            values_to_sort = selected_data[:, sorting_columns].T
+            sort_ids = np.searchsorted(needed, sorting_columns)
+            values_to_sort = selected_data[:, sort_ids].T
             ordered_ids = np.lexsort(tuple(values_to_sort[i] for i in
                                            range(len(values_to_sort))))
             selected_data = selected_data[ordered_ids, :]
 
         # Select only requested columns
-        selected_data = selected_data[:, column_ids]
+        selected_data = selected_data[:, np.searchsorted(needed, column_ids)]
 
         return selected_data
+
+
+class ColumnCache(object):
+    '''
+    Binary copy of a table read by :class:`ColumnIO`, sorted by a key column
+    and then by a sort column.
+
+    Each column is stored in a .npy file, together with the unique keys and
+    the offsets of their rows, in a directory named after the ASCII file.
+    The copy is written on first use and rewritten when the modification
+    time or size of the ASCII file change. Queries memory-map the columns
+    and only read the selected rows, which are found by binary search.
+    '''
+
+    def __init__(self, column_io, key_column, sort_column, directory=None):
+        """
+        column_io: ColumnIO, the table to cache.
+        key_column: int, id of the column by which rows are grouped.
+        sort_column: int, id of the column by which rows are sorted within
+                    each group.
+        directory: None or string, directory of the cache files. They are
+                    stored next to the ASCII file if None.
+        """
+        self.column_io = column_io
+        self.key_column = key_column
+        self.sort_column = sort_column
+
+        source = column_io.filename
+        if directory is None:
+            directory = os.path.dirname(os.path.abspath(source))
+        self.path = os.path.join(directory, '%s.sorted_%i_%i' % (
+            os.path.basename(source), key_column, sort_column))
+
+        if not self._is_valid():
+            self._write()
+        self.keys = self._load('keys')
+        self.offsets = self._load('offsets')
+        self.columns = [self._load('column_%i' % i)
+                        for i in range(column_io.n_columns)]
+
+    def _source_info(self):
+        stat = os.stat(self.column_io.filename)
+        return {'mtime': stat.st_mtime, 'size': stat.st_size,
+                'dtype': np.dtype(self.column_io.dtype).str,
+                'n_columns': self.column_io.n_columns}
+
+    def _is_valid(self):
+        try:
+            with open(os.path.join(self.path, 'source.json')) as f:
+                info = json.load(f)
+        except (IOError, OSError, ValueError):
+            return False
+        return info == self._source_info()
+
+    def _load(self, name):
+        return np.load(os.path.join(self.path, name + '.npy'),
+                       mmap_mode='r')
+
+    def _write(self):
+        """
+        Sort the table and write the cache files.
+
+        The table is sorted by chunks, which are saved as sorted runs and
+        then merged into the memory-mapped column files, so that only about
+        two chunks of the table are held in memory.
+        """
+        info = self._source_info()
+        if not os.path.isdir(self.path):
+            os.makedirs(self.path)
+        info_file = os.path.join(self.path, 'source.json')
+        if os.path.exists(info_file):
+            os.remove(info_file)
+
+        data = self.column_io._data
+        if data is not None:
+            chunks = [data]
+        else:
+            chunks = self.column_io.iter_chunks()
+        runs = []
+        try:
+            for chunk in chunks:
+                # only the last run is kept in memory
+                if runs:
+                    runs[-1] = self._save_run(runs[-1], len(runs) - 1)
+                runs.append(chunk[np.lexsort((chunk[:, self.sort_column],
+                                              chunk[:, self.key_column]))])
+            self._merge(runs)
+        finally:
+            del runs[:]
+            for name in os.listdir(self.path):
+                if name.startswith('run_'):
+                    os.remove(os.path.join(self.path, name))
+
+        # the description of the source is written last, so that
+        # incomplete caches are never used
+        with open(info_file, 'w') as f:
+            json.dump(info, f)
+
+    def _save_run(self, run, index):
+        """
+        Save a sorted run of rows, and return it memory-mapped.
+        """
+        name = os.path.join(self.path, 'run_%i.npy' % index)
+        np.save(name, run)
+        return np.load(name, mmap_mode='r')
+
+    def _merge(self, runs):
+        """
+        Merge the sorted runs of rows into the column files, and write the
+        keys and their offsets.
+
+        The runs are read by blocks.  The rows which are not after the last
+        row read from any unfinished run are sorted and written, and the
+        others are kept with the next blocks.  Rows with the same key and
+        sort values stay in the order of the file.
+        """
+        key, sort = self.key_column, self.sort_column
+        n_rows = sum(len(run) for run in runs)
+        dtype = np.dtype(self.column_io.dtype)
+        if runs:
+            dtype = runs[0].dtype
+        columns = []
+        for i in range(self.column_io.n_columns):
+            name = os.path.join(self.path, 'column_%i.npy' % i)
+            if n_rows:
+                columns.append(np.lib.format.open_memmap(
+                    name, mode='w+', dtype=dtype, shape=(n_rows,)))
+            else:
+                np.save(name, np.empty(0, dtype=dtype))
+
+        block = max(self.column_io.chunk_size //
+                    (dtype.itemsize * self.column_io.n_columns *
+                     max(len(runs), 1)), 16)
+        positions = [0] * len(runs)
+        buffers = [run[:0] for run in runs]
+        keys = []
+        offsets = []
+        last_key = None
+        row = 0
+        while True:
+            for i, run in enumerate(runs):
+                if not len(buffers[i]) and positions[i] < len(run):
+                    buffers[i] = np.asarray(run[positions[i]:
+                                                positions[i] + block])
+                    positions[i] += len(buffers[i])
+            active = [i for i in range(len(runs)) if len(buffers[i])]
+            if not active:
+                break
+
+            # the smallest (key, sort, run) of the last rows read
+            # from the runs which have more rows
+            bounds = [(buffers[i][-1, key], buffers[i][-1, sort], i)
+                      for i in active if positions[i] < len(runs[i])]
+            bound = min(bounds) if bounds else None
+            merged = np.concatenate([buffers[i] for i in active])
+            run_ids = np.concatenate([np.repeat(i, len(buffers[i]))
+                                      for i in active])
+            order = np.lexsort((run_ids, merged[:, sort], merged[:, key]))
+            merged = merged[order]
+            run_ids = run_ids[order]
+            if bound is None:
+                n = len(merged)
+            else:
+                k, v = merged[:, key], merged[:, sort]
+                n = np.count_nonzero(
+                    (k < bound[0]) | ((k == bound[0]) & (
+                        (v < bound[1]) | ((v == bound[1]) &
+                                          (run_ids <= bound[2])))))
+
+            for j, column in enumerate(columns):
+                column[row:row + n] = merged[:n, j]
+            block_keys, starts = np.unique(merged[:n, key],
+                                           return_index=True)
+            if row and block_keys[0] == last_key:
+                block_keys, starts = block_keys[1:], starts[1:]
+            keys.append(block_keys)
+            offsets.append(starts + row)
+            last_key = merged[n - 1, key]
+            row += n
+
+            merged, run_ids = merged[n:], run_ids[n:]
+            for i in active:
+                buffers[i] = merged[run_ids == i]
+
+        for column in columns:
+            column.flush()
+        del columns[:]
+        np.save(os.path.join(self.path, 'keys.npy'),
+                np.concatenate(keys) if keys else np.empty(0, dtype=dtype))
+        np.save(os.path.join(self.path, 'offsets.npy'),
+                np.append(np.concatenate(offsets) if offsets else
+                          np.empty(0, dtype=int), n_rows))
+
+    def get_columns(self, column_ids, keys=None, start=None, stop=None):
+        """
+        column_ids : list of int, the ids of columns to extract.
+        keys : None or list, values of the key column of the rows to
+                    extract. All rows are extracted if None.
+        start, stop : None or float, the range [start, stop) of the values
+                    of the sort column of the rows to extract.
+
+        Returns
+        -------
+        numpy array containing the requested data, sorted by key then by
+        the sort column.
+        """
+        if keys is None:
+            starts = self.offsets[:-1]
+            stops = self.offsets[1:]
+        else:
+            keys = np.unique(keys)
+            ids = np.searchsorted(self.keys, keys)
+            found = ids < len(self.keys)
+            found[found] = self.keys[ids[found]] == keys[found]
+            ids = ids[found]
+            starts = self.offsets[ids]
+            stops = self.offsets[ids + 1]
+
+        if start is not None and start == -np.inf:
+            start = None
+        if stop is not None and stop == np.inf:
+            stop = None
+        if start is not None or stop is not None:
+            sort_values = self.columns[self.sort_column]
+            ranges = []
+            for i0, i1 in zip(starts, stops):
+                values = sort_values[i0:i1]
+                if start is not None:
+                    i0 += np.searchsorted(values, start, side='left')
+                if stop is not None:
+                    i1 += np.searchsorted(values, stop, side='left') - \
+                        len(values)
+                ranges.append((i0, i1))
+        else:
+            ranges = zip(starts, stops)
+
+        # merge the adjacent ranges of rows, to copy them at once
+        selected = []
+        for i0, i1 in ranges:
+            if i1 <= i0:
+                continue
+            if selected and selected[-1][1] == i0:
+                selected[-1][1] = i1
+            else:
+                selected.append([i0, i1])
+
+        column_ids = np.array(column_ids) % self.column_io.n_columns
+        result = np.empty((sum(i1 - i0 for i0, i1 in selected),
+                           len(column_ids)), dtype=self.columns[0].dtype)
+        for j, column_id in enumerate(column_ids):
+            column = self.columns[column_id]
+            row = 0
+            for i0, i1 in selected:
+                result[row:row + i1 - i0, j] = column[i0:i1]
+                row += i1 - i0
+        return result
+
+
+def _column_filter(condition, column):
+    """
+    Return a row filter applying `condition` to the values of `column`.
+
+    `condition` is first applied to the whole column, and vectorized with
+    :func:`np.vectorize` if this does not give one bool value per row.
+    """
+    def row_filter(chunk):
+        values = chunk[:, column]
+        try:
+            mask = np.asarray(condition(values))
+        except (ValueError, TypeError):
+            mask = None
+        if mask is None or mask.shape != values.shape:
+            mask = np.vectorize(condition)(values)
+        return mask.astype(bool)
+    return row_filter
+
+
+def _combine_filters(*filters):
+    """
+    Return a row filter selecting the rows selected by all `filters`,
+    ignoring those that are None.
+    """
+    filters = [f for f in filters if f is not None]
+    if len(filters) <= 1:
+        return filters[0] if filters else None
+
+    def row_filter(chunk):
+        mask = filters[0](chunk)
+        for f in filters[1:]:
+            mask &= f(chunk)
+        return mask
+    return row_filter
@@ -79,6 +79,12 @@ class NeuroScopeIO(BaseIO):
                      cascade = True,
                     ):
         """
+        Read the channel groups and the signals of the .dat file.
+
+        The samples are memory-mapped and scaled by the voltage range and
+        amplification when they are loaded. With lazy=True, the empty
+        signals keep an AnalogSignalProxy in their `lazy_proxy` attribute,
+        which only reads and scales the part of the file that is loaded.
         """
 
         
@@ -114,11 +120,9 @@ class NeuroScopeIO(BaseIO):
                                                         unit = pq.V, nbchannel = nbchannel,
                                                         bytesoffset = 0,
                                                         dtype = np.int16 if nbits<=16 else np.int32,
-                                                        rangemin = -voltage_range/2.,
-                                                        rangemax = voltage_range/2.,)
+                                                        rangemin = -voltage_range/2./amplification,
+                                                        rangemax = voltage_range/2./amplification,)
             for s, sig in enumerate(seg2.analogsignals):
-                if not lazy:
-                    sig /= amplification
                 sig.segment = seg
                 seg.analogsignals.append(sig)
                 chx.analogsignals.append(sig)
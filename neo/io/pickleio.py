@@ -11,14 +11,26 @@ Supported: Read/Write
 Authors: Andrew Davison
 """
 
+import os
+import shutil
+import tempfile
+import warnings
+
 try:
     import cPickle as pickle  # Python 2
 except ImportError:
     import pickle  # Python 3
 
+import numpy as np
+import quantities as pq
+
 from neo.io.baseio import BaseIO
 from neo.core import (Block, Segment,
                       AnalogSignal, SpikeTrain)
+from neo.core.container import Container
+
+BLOCK_FILENAME = 'block.pkl'
+SEGMENT_FILENAME = 'segment.pkl'
 
 
 class PickleIO(BaseIO):
@@ -28,6 +40,41 @@ class PickleIO(BaseIO):
     Note that files in this format may not be readable if using a different version
     of Neo to that used to create the file. It should therefore not be used for
     long-term storage, but rather for intermediate results in a pipeline.
+
+    With `directory=True`, the Block is written to a directory rather than a
+    single file::
+
+        filename/
+            block.pkl
+            segment_0/
+                segment.pkl
+                array_0.npy
+                ...
+            segment_1/
+            ...
+
+    Each Segment is pickled in its own subdirectory, and the arrays of at
+    least `min_size` bytes (the signals, spike times, waveforms...) are
+    stored out of the pickles, as raw .npy files. When reading, these are
+    memory-mapped with `mmap_mode` (see :func:`numpy.load`; the default,
+    'c', gives writable arrays whose changes are not written to the files),
+    so that a large Block is loaded quickly and its data is only read when
+    it is used. :meth:`read_segment` loads a single Segment of the Block.
+    The layout is detected when reading.
+
+    The links from the objects of a Segment to the Block and its
+    ChannelIndexes and Units are restored with
+    :meth:`Block.create_many_to_one_relationship` when reading the whole
+    Block, and are None when reading a single Segment.
+
+    Usage::
+
+        >>> from neo import io
+        >>> w = io.PickleIO(filename='checkpoint', directory=True)
+        >>> w.write_block(block)
+        >>> r = io.PickleIO(filename='checkpoint')
+        >>> block = r.read_block()
+        >>> seg = r.read_segment(index=3)
     """
     is_readable = True
     is_writable = True
@@ -40,11 +87,174 @@ class PickleIO(BaseIO):
     name = "Python pickle file"
     extensions = ['pkl', 'pickle']
 
+    def __init__(self, filename=None, directory=False, min_size=2 ** 16,
+                 mmap_mode='c'):
+        """
+        Arguments:
+            filename : the file or directory to read or write
+            directory : write a directory rather than a single file
+            min_size : minimum size, in bytes, of the arrays written to .npy
+                files in a directory
+            mmap_mode : how the .npy files are memory-mapped when read, or
+                None to read them into memory
+        """
+        BaseIO.__init__(self, filename=filename)
+        self.directory = directory
+        self.min_size = min_size
+        self.mmap_mode = mmap_mode
+
     def read_block(self, lazy=False, cascade=True):
+        if os.path.isdir(self.filename):
+            return self._read_block_directory()
         with open(self.filename, "rb") as fp:
             block = pickle.load(fp)
         return block
 
+    def read_segment(self, lazy=False, cascade=True, index=0):
+        """
+        Read the Segment `index` of the Block. From a directory, only this
+        Segment is loaded.
+        """
+        if os.path.isdir(self.filename):
+            return self._load_segment(index)
+        return self.read_block().segments[index]
+
     def write_block(self, block):
+        if self.directory:
+            self._write_block_directory(block)
+            return
         with open(self.filename, "wb") as fp:
-            pickle.dump(block, fp)
+            pickle.dump(block, fp, pickle.HIGHEST_PROTOCOL)
+
+    def _segment_path(self, root, index):
+        return os.path.join(root, 'segment_%d' % index)
+
+    def _write_block_directory(self, block):
+        path = os.path.abspath(self.filename)
+        if os.path.exists(path) and not \
+                os.path.isfile(os.path.join(path, BLOCK_FILENAME)):
+            raise IOError('%s exists and is not a PickleIO directory' %
+                          self.filename)
+
+        # write to a new directory which then replaces the old one, so that
+        # memory-mapped files of the old one are never overwritten
+        parent = os.path.dirname(path)
+        tmp = tempfile.mkdtemp(prefix=os.path.basename(path) + '.',
+                               dir=parent)
+        done = False
+        try:
+            # mkdtemp creates the directory with mode 0700, give it the
+            # mode os.mkdir would
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp, 0o777 & ~umask)
+            references = {}
+            for i, seg in enumerate(block.segments):
+                seg_path = self._segment_path(tmp, i)
+                os.mkdir(seg_path)
+                _dump(seg, seg_path, SEGMENT_FILENAME, self.min_size,
+                      lambda obj, seg=seg: ('parent',) if (
+                          isinstance(obj, Container) and
+                          obj is not seg) else None)
+                references[id(seg)] = ('segment', i)
+                for container in seg._data_child_containers:
+                    for j, obj in enumerate(getattr(seg, container)):
+                        references[id(obj)] = ('child', i, container, j)
+            _dump(block, tmp, BLOCK_FILENAME, self.min_size,
+                  lambda obj: references.get(id(obj)))
+            done = True
+        finally:
+            if not done:
+                shutil.rmtree(tmp, ignore_errors=True)
+
+        if os.path.exists(path):
+            old = tempfile.mkdtemp(prefix=os.path.basename(path) + '.',
+                                   dir=parent)
+            os.rename(path, os.path.join(old, 'old'))
+            os.rename(tmp, path)
+            try:
+                shutil.rmtree(old)
+            except OSError as err:
+                warnings.warn('the previous content of %s could not be '
+                              'removed from %s: %s' % (self.filename, old,
+                                                       err))
+        else:
+            os.rename(tmp, path)
+
+    def _load_segment(self, index):
+        seg_path = self._segment_path(self.filename, index)
+        # the Block, ChannelIndexes and Units are not in the Segment file
+        return _load(seg_path, SEGMENT_FILENAME, self.mmap_mode,
+                     lambda pid: None)
+
+    def _read_block_directory(self):
+        segments = {}
+
+        def load_reference(pid):
+            if pid[1] not in segments:
+                segments[pid[1]] = self._load_segment(pid[1])
+            seg = segments[pid[1]]
+            if pid[0] == 'segment':
+                return seg
+            return getattr(seg, pid[2])[pid[3]]
+
+        block = _load(self.filename, BLOCK_FILENAME, self.mmap_mode,
+                      load_reference)
+        block.create_many_to_one_relationship()
+        return block
+
+
+def _dump(obj, path, filename, min_size, reference):
+    """
+    Pickle `obj` in the file `filename` of the directory `path`.
+
+    The arrays of at least `min_size` bytes are saved to .npy files in the
+    same directory. `reference(obj)` returns a persistent ID for the objects
+    which are stored in other files, or a false value.
+    """
+    arrays = {}
+    # the arrays must stay alive so that their ids are not reused
+    saved = []
+
+    def persistent_id(obj):
+        pid = reference(obj)
+        if pid:
+            return pid
+        if type(obj) not in (np.ndarray, np.memmap, pq.Quantity) or \
+                obj.nbytes < max(min_size, 1) or obj.dtype.hasobject:
+            return None
+        if id(obj) not in arrays:
+            name = 'array_%d.npy' % len(arrays)
+            np.save(os.path.join(path, name), obj.view(np.ndarray))
+            units = None
+            if isinstance(obj, pq.Quantity):
+                units = obj.dimensionality
+            arrays[id(obj)] = ('array', name, units)
+            saved.append(obj)
+        return arrays[id(obj)]
+
+    with open(os.path.join(path, filename), 'wb') as fp:
+        pickler = pickle.Pickler(fp, pickle.HIGHEST_PROTOCOL)
+        pickler.persistent_id = persistent_id
+        pickler.dump(obj)
+
+
+def _load(path, filename, mmap_mode, load_reference):
+    """
+    Unpickle the file `filename` of the directory `path` written by
+    :func:`_dump`. `load_reference(pid)` returns the objects stored in other
+    files.
+    """
+    def persistent_load(pid):
+        if pid[0] != 'array':
+            return load_reference(pid)
+        _, name, units = pid
+        arr = np.load(os.path.join(path, name), mmap_mode=mmap_mode)
+        if units is not None:
+            arr = pq.Quantity(arr, units, copy=False)
+        return arr
+
+    with open(os.path.join(path, filename), 'rb') as fp:
+        unpickler = pickle.Unpickler(fp)
+        unpickler.persistent_load = persistent_load
+        return unpickler.load()
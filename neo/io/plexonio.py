@@ -263,9 +263,10 @@ class PlexonIO(BaseIO):
             else:
                 times = evarrays[chan]['times']
                 labels = evarrays[chan]['labels']
-            ea = Event(
-                times*pq.s,
+            ea = Event.from_trusted_array(
+                times,
                 labels=labels,
+                units=pq.s,
                 channel_name=eventHeaders[chan]['Name'],
                 channel_index=chan
             )
@@ -290,8 +291,9 @@ class PlexonIO(BaseIO):
                         slowChannelHeaders[chan]['Gain'] *
                         slowChannelHeaders[chan]['PreampGain'])
                 signal = sigarrays[chan] * gain
-            anasig = AnalogSignal(
-                signal * pq.V,
+            anasig = AnalogSignal.from_trusted_array(
+                signal,
+                units=pq.V,
                 sampling_rate=float(
                     slowChannelHeaders[chan]['ADFreq']) * pq.Hz,
                 t_start=t_starts[chan] * pq.s,
@@ -327,7 +329,7 @@ class PlexonIO(BaseIO):
                     waveforms = swfarrays[chan, unit] * gain * pq.V
                 else:
                     waveforms = None
-            sptr = SpikeTrain(
+            sptr = SpikeTrain.from_trusted_array(
                 times,
                 units='s',
                 t_stop=t_stop*pq.s,
@@ -335,6 +337,9 @@ class PlexonIO(BaseIO):
                 sampling_rate=float(
                     global_header['WaveformFreq']) * pq.Hz,
             )
+            # the data blocks are read in time order, which lets
+            # SpikeTrain.time_slice use a binary search
+            sptr._sorted = True
             sptr.annotate(unit_name = dspChannelHeaders[chan]['Name'])
             sptr.annotate(channel_index = chan)
             for key, val in dspChannelHeaders[chan].items():
@@ -0,0 +1,316 @@
+# -*- coding: utf-8 -*-
+"""
+Proxy objects returned by the IO classes when reading lazily.
+
+A proxy describes a data object stored in a file, and only reads the part of
+it which is asked for, when it is asked for:
+  * :class:`AnalogSignalProxy` wraps a 2D array of raw samples (typically a
+    :class:`numpy.memmap`) and gives :class:`AnalogSignal` objects, scaled to
+    physical units on access.
+
+The lazily read objects put in the Neo tree are the usual empty objects with
+a `lazy_shape` attribute, which keep their proxy in a `lazy_proxy`
+attribute::
+
+    >>> seg = reader.read_segment(lazy=True)
+    >>> sig = seg.analogsignals[0].lazy_proxy.load(
+    ...     time_slice=(1 * pq.s, 2 * pq.s), channel_indexes=[0, 3])
+
+:func:`memmap_signals` memory-maps the samples of binary files for them.
+"""
+
+# needed for python 3 compatibility
+from __future__ import absolute_import, division
+
+import numbers
+import os
+
+import numpy as np
+import quantities as pq
+
+from neo.core import AnalogSignal
+
+
+class AnalogSignalProxy(object):
+    """
+    Lazy :class:`AnalogSignal` of raw samples stored in a file.
+
+    `raw` is an array-like of shape (samples, channels), or (samples,) for a
+    single channel, which supports basic slicing along its first axis, such
+    as a :class:`numpy.memmap` or an HDF5 dataset. Only the requested rows
+    are read, and they are converted to physical values with::
+
+        signal = raw * gain + offset
+
+    where `gain` and `offset` are scalars or have one value per channel.
+
+    *Usage*::
+
+        >>> raw = np.memmap('data.dat', dtype='int16', mode='r')
+        >>> proxy = AnalogSignalProxy(raw.reshape(-1, 32), units='uV',
+        ...                           sampling_rate=20 * pq.kHz, gain=0.195)
+        >>> sig = proxy.load(time_slice=(1 * pq.s, 2 * pq.s),
+        ...                  channel_indexes=[0, 3])
+
+    *Required arguments*:
+        :raw: (array-like) The raw samples.
+        :units: (quantity units) The units of the scaled signal. A quantity
+            scalar such as ``pq.nano * pq.V`` also multiplies the values.
+        :sampling_rate: (quantity scalar) The sampling rate.
+
+    *Optional arguments*:
+        :gain: (float or array) The scaling factor(s). Default: 1.
+        :offset: (float or array) The offset(s), in `units`. Default: 0.
+        :t_start: (quantity scalar) Time of the first sample. Default: 0 s.
+        :dtype: (numpy dtype) The dtype of the loaded signals.
+            Default: float64.
+        :name, file_origin, description: passed to the loaded signals.
+        :annotations: passed to the loaded signals.
+
+    *Properties*:
+        :shape: The shape of the signal, (samples, channels).
+        :sampling_period, t_stop, duration: as for :class:`AnalogSignal`.
+    """
+
+    def __init__(self, raw, units, sampling_rate, gain=1., offset=0.,
+                 t_start=0 * pq.s, dtype='float64', name=None,
+                 file_origin=None, description=None, **annotations):
+        if isinstance(units, numbers.Number):
+            units = pq.Quantity(units, pq.dimensionless)
+        if isinstance(units, pq.Quantity) and units.magnitude != 1:
+            # e.g. pq.nano * pq.V, the values are multiplied by units
+            gain = np.asarray(gain) * float(units.magnitude)
+            offset = np.asarray(offset) * float(units.magnitude)
+            units = units.dimensionality
+        self.raw = raw
+        self.units = pq.quantity.validate_dimensionality(units)
+        self.sampling_rate = sampling_rate
+        self.gain = np.asarray(gain, dtype=dtype)
+        self.offset = np.asarray(offset, dtype=dtype)
+        self.t_start = t_start
+        self.dtype = np.dtype(dtype)
+        self.name = name
+        self.file_origin = file_origin
+        self.description = description
+        self.annotations = annotations
+
+    @classmethod
+    def from_file(cls, filename, raw_dtype, n_channels, units, sampling_rate,
+                  bytes_offset=0, interleaved=True, **kwargs):
+        """
+        Memory-map the samples of `n_channels` channels stored in a binary
+        file with :func:`memmap_signals`, and return an
+        :class:`AnalogSignalProxy` of them. The other arguments are passed
+        to the constructor.
+        """
+        raw = memmap_signals(filename, raw_dtype, n_channels,
+                             bytes_offset=bytes_offset,
+                             interleaved=interleaved)
+        return cls(raw, units, sampling_rate, **kwargs)
+
+    @property
+    def shape(self):
+        """
+        The shape of the signal, (samples, channels).
+        """
+        shape = tuple(self.raw.shape)
+        if len(shape) == 1:
+            shape += (1,)
+        return shape
+
+    def __len__(self):
+        return self.shape[0]
+
+    @property
+    def sampling_period(self):
+        return 1. / self.sampling_rate
+
+    @property
+    def duration(self):
+        return len(self) / self.sampling_rate
+
+    @property
+    def t_stop(self):
+        return self.t_start + self.duration
+
+    def annotate(self, **annotations):
+        """
+        Add annotations, which are passed to the loaded signals.
+        """
+        self.annotations.update(annotations)
+
+    def _time_index(self, t):
+        """
+        Index of the sample at time `t`, rounded as in
+        :meth:`AnalogSignal.time_slice`.
+        """
+        units = self.sampling_period.units
+        i = (t.rescale(units) - self.t_start.rescale(units)) / \
+            self.sampling_period
+        return int(np.rint(i.simplified.magnitude))
+
+    def _channels(self, channel_indexes):
+        if channel_indexes is None:
+            return None
+        return np.atleast_1d(np.asarray(channel_indexes, dtype=np.intp))
+
+    def _scale(self, values, channels):
+        """
+        Convert a (samples, channels) array of raw `values` in place.
+        """
+        gain, offset = self.gain, self.offset
+        if channels is not None:
+            if gain.ndim:
+                gain = gain[channels]
+            if offset.ndim:
+                offset = offset[channels]
+        if gain.ndim or gain != 1:
+            values *= gain
+        if offset.ndim or offset != 0:
+            values += offset
+        return values
+
+    def _read(self, i, j, channels=None):
+        """
+        Read and scale the rows `i` to `j` of the selected `channels` (all
+        of them if None).
+        """
+        values = np.asarray(self.raw[i:j])
+        if values.ndim == 1:
+            values = values[:, np.newaxis]
+        # always copy, so that the file is never modified
+        if channels is None:
+            values = values.astype(self.dtype)
+        else:
+            values = values[:, channels].astype(self.dtype, copy=False)
+        return self._scale(values, channels)
+
+    def load(self, time_slice=None, channel_indexes=None):
+        """
+        Read the signal, or part of it, into an :class:`AnalogSignal`.
+
+        `time_slice` is None to read the whole signal or a (t_start, t_stop)
+        tuple of quantities, either of which can be None; times are rounded
+        to the nearest sampling bins. `channel_indexes` is None to read all
+        the channels or a list of column indexes.
+        """
+        i, j = 0, len(self)
+        if time_slice is not None:
+            t_start, t_stop = time_slice
+            if t_start is not None:
+                i = self._time_index(t_start)
+            if t_stop is not None:
+                j = self._time_index(t_stop)
+            if (i < 0) or (j > len(self)):
+                raise ValueError('t_start, t_stop have to be within the '
+                                 'analog signal duration')
+            j = max(i, j)
+        channels = self._channels(channel_indexes)
+
+        return AnalogSignal.from_trusted_array(
+            self._read(i, j, channels), units=self.units,
+            t_start=self.t_start + i * self.sampling_period,
+            sampling_rate=self.sampling_rate, name=self.name,
+            file_origin=self.file_origin, description=self.description,
+            **self.annotations.copy())
+
+    def time_slice(self, t_start, t_stop):
+        """
+        Read the part of the signal between `t_start` and `t_stop`, as
+        :meth:`AnalogSignal.time_slice` does.
+        """
+        return self.load(time_slice=(t_start, t_stop))
+
+    def lazy_signal(self):
+        """
+        Return the empty :class:`AnalogSignal` which stands for the signal
+        when reading lazily. It has the attributes and annotations of the
+        signal, its shape in `lazy_shape`, and this proxy in `lazy_proxy`.
+        """
+        sig = AnalogSignal(np.empty((0, self.shape[1]), dtype=self.dtype),
+                           units=self.units, t_start=self.t_start,
+                           sampling_rate=self.sampling_rate, name=self.name,
+                           file_origin=self.file_origin,
+                           description=self.description,
+                           **self.annotations.copy())
+        sig.lazy_shape = self.shape
+        sig.lazy_proxy = self
+        return sig
+
+    def load_waveforms(self, indexes, n_before, n_after,
+                       channel_indexes=None, max_rows=2 ** 20):
+        """
+        Extract the snippets of signal around many samples at once, such as
+        spike waveforms.
+
+        The snippets go from `n_before` samples before each of the sample
+        `indexes` to `n_after` samples after it (excluded). They are
+        returned as a :class:`~quantities.Quantity` of shape (snippets,
+        channels, samples), which is the layout of
+        :attr:`SpikeTrain.waveforms`, in the order of `indexes`. Samples
+        outside the recording are set to 0.
+
+        The indexes are sorted and the raw file is read by contiguous blocks
+        of at most about `max_rows` rows, from which all the snippets they
+        contain are gathered with a single indexing operation.
+        """
+        indexes = np.asarray(indexes, dtype=np.intp).ravel()
+        channels = self._channels(channel_indexes)
+        n_channels = self.shape[1] if channels is None else len(channels)
+        offsets = np.arange(-n_before, n_after)
+        result = np.zeros((len(indexes), len(offsets), n_channels),
+                          dtype=self.dtype)
+
+        order = np.argsort(indexes, kind='mergesort')
+        sorted_indexes = indexes[order]
+        k = 0
+        while k < len(order):
+            i = max(sorted_indexes[k] - n_before, 0)
+            last = np.searchsorted(sorted_indexes,
+                                   i + n_before + max_rows, side='right')
+            last = max(last, k + 1)
+            j = min(sorted_indexes[last - 1] + n_after, len(self))
+            block = self._read(i, max(i, j), channels)
+            if len(block):
+                rows = sorted_indexes[k:last, np.newaxis] + offsets - i
+                outside = (rows < 0) | (rows >= len(block))
+                snippets = block[np.clip(rows, 0, len(block) - 1)]
+                snippets[outside] = 0
+                result[order[k:last]] = snippets
+            k = last
+
+        return pq.Quantity(result.swapaxes(1, 2), units=self.units,
+                           copy=False)
+
+    def __repr__(self):
+        return '<%s(%s, [%s, %s], sampling rate: %s, shape: %s)>' % (
+            self.__class__.__name__, self.units.string, self.t_start,
+            self.t_stop, self.sampling_rate, self.shape)
+
+
+def memmap_signals(filename, raw_dtype, n_channels, bytes_offset=0,
+                   n_samples=None, interleaved=True):
+    """
+    Memory-map the samples of `n_channels` channels stored in a binary file
+    from `bytes_offset`, as a read-only array of shape (samples, channels).
+
+    `raw_dtype` is the dtype of the samples in the file, including their
+    byte order (e.g. '>i2' for big-endian 16-bit integers). The samples of
+    all the channels at the same time are stored together if `interleaved`
+    is True (multiplexed), otherwise the channels are stored one after the
+    other (vectorized). If `n_samples` is None, the file is read to its
+    end, and trailing bytes which do not make a complete sample of all the
+    channels are ignored.
+    """
+    raw_dtype = np.dtype(raw_dtype)
+    if n_samples is None:
+        size = os.path.getsize(filename) - bytes_offset
+        n_samples = max(size, 0) // (raw_dtype.itemsize * n_channels)
+    n_samples = int(n_samples)
+    if n_samples == 0:
+        return np.empty((0, n_channels), dtype=raw_dtype)
+    if interleaved:
+        return np.memmap(filename, dtype=raw_dtype, mode='r',
+                         offset=bytes_offset, shape=(n_samples, n_channels))
+    return np.memmap(filename, dtype=raw_dtype, mode='r',
+                     offset=bytes_offset, shape=(n_channels, n_samples)).T
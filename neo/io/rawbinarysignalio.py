@@ -11,12 +11,14 @@ Author: sgarcia
 
 """
 
+import itertools
 import os
 
 import numpy as np
 import quantities as pq
 
 from neo.io.baseio import BaseIO
+from neo.io.proxyobjects import AnalogSignalProxy
 from neo.core import Segment, AnalogSignal
 
 
@@ -105,6 +107,16 @@ class RawBinarySignalIO(BaseIO):
 
             dtype : dtype of the data
             rangemin , rangemax : if the dtype is integer, range can give in volt the min and the max of the range
+
+        The file is memory-mapped. Float samples are returned as a view of
+        the memmap, without copy. Integer samples are converted to float32
+        values in the range [rangemin, rangemax], which loads the whole
+        signal in memory.
+
+        To keep the memmap for integer samples, read with lazy=True: the
+        empty AnalogSignal then keeps an AnalogSignalProxy of the memmap in
+        its `lazy_proxy` attribute, and its `load` method only reads and
+        converts the requested time slice and channels.
         """
         seg = Segment(file_origin = os.path.basename(self.filename))
         if not cascade:
@@ -122,71 +134,142 @@ class RawBinarySignalIO(BaseIO):
 
         unit = pq.Quantity(1, unit)
 
-        if lazy:
-            sig = []
-        else:
-            sig = np.memmap(self.filename, dtype = dtype, mode = 'r', offset = bytesoffset)
-            if sig.size % nbchannel != 0 :
-                sig = sig[:- sig.size%nbchannel]
-            sig = sig.reshape((sig.size/nbchannel,nbchannel))
-            if dtype.kind == 'i' :
-                sig = sig.astype('f')
-                sig /= 2**(8*dtype.itemsize)
-                sig *= ( rangemax-rangemin )
-                sig += ( rangemax+rangemin )/2.
-            elif dtype.kind == 'u' :
-                sig = sig.astype('f')
-                sig /= 2**(8*dtype.itemsize)
-                sig *= ( rangemax-rangemin )
-                sig += rangemin
+        gain, offset = 1., 0.
+        if dtype.kind == 'i' :
+            gain = ( rangemax-rangemin ) / 2.**(8*dtype.itemsize)
+            offset = ( rangemax+rangemin )/2.
+        elif dtype.kind == 'u' :
+            gain = ( rangemax-rangemin ) / 2.**(8*dtype.itemsize)
+            offset = rangemin
 
-        anaSig = AnalogSignal(sig, units=unit, sampling_rate=sampling_rate,
-                              t_start=t_start, copy=False)
+        anaSig = AnalogSignalProxy.from_file(
+            self.filename, dtype, nbchannel, units=unit,
+            sampling_rate=sampling_rate, bytes_offset=bytesoffset,
+            gain=gain, offset=offset, t_start=t_start,
+            dtype='f' if dtype.kind in 'iu' else dtype)
 
         if lazy:
-            # TODO
-            anaSig.lazy_shape = None
+            anaSig = anaSig.lazy_signal()
+        else:
+            if dtype.kind in 'iu':
+                anaSig = anaSig.load()
+            else:
+                # floats are used without scaling nor copy
+                anaSig = AnalogSignal(anaSig.raw, units=unit,
+                                      sampling_rate=sampling_rate,
+                                      t_start=t_start, copy=False)
         seg.analogsignals.append(anaSig)
         seg.create_many_to_one_relationship()
         return seg
 
     def write_segment(self, segment, dtype='f4', rangemin=-10,
-                      rangemax=10, bytesoffset=0):
+                      rangemax=10, bytesoffset=0, append=False,
+                      chunk_size=2**16):
         """
 
          **Arguments**
             segment : the segment to write. Only analog signals will be written.
+                      It can also be a sequence or a generator of segments, whose
+                      signals are written one after the other.
 
             dtype : dtype of the data
             rangemin , rangemax : if the dtype is integer, range can give in volt the min and the max of the range
-
+            bytesoffset : nb of bytes before the data. The first bytesoffset
+                          bytes of an existing file (e.g. a header) are kept,
+                          and the file is truncated after the written data
+            append : if True, the data is added at the end of an existing file
+            chunk_size : nb of samples converted and written at once
+
+        The channels are interleaved and written by chunks of chunk_size
+        samples, so that the memory used does not depend on the length of
+        the signals.
+
+        The signals of a segment, or of a sequence of segments, are checked
+        before the file is opened. The segments of a generator are checked
+        one at a time before being written: if one of them is invalid, a
+        ValueError is raised and the file keeps the data of the previous
+        segments.
         """
-        if bytesoffset:
-            raise NotImplementedError('bytesoffset values other than 0 ' +
-                                      'not supported')
-
         dtype = np.dtype(dtype)
-
-        # all AnaologSignal from Segment must have the same length
-        for anasig in segment.analogsignals[1:]:
-            assert anasig.size == segment.analogsignals[0].size
-
-        sigs = np.empty((segment.analogsignals[0].size, len(segment.analogsignals)))
-        for i, anasig in enumerate(segment.analogsignals):
-            sigs[:, i] = anasig.magnitude
-
-        if dtype.kind == 'i':
-            sigs -= ( rangemax+rangemin )/2.
-            sigs /= (rangemax - rangemin)
-            sigs *= 2 ** (8 * dtype.itemsize )
-        elif dtype.kind == 'u' :
-            sigs -= rangemin
-            sigs /= (rangemax - rangemin)
-            sigs *= 2 ** (8 * dtype.itemsize)
-        sigs = sigs.astype(dtype)
-            
-        f = open(self.filename, 'wb')
-        f.write(sigs.tostring())
-        f.close()
-
-
+        if isinstance(segment, Segment):
+            segment = [segment]
+        signals = self._check_segments(segment)
+        if isinstance(segment, (list, tuple)):
+            signals = list(signals)
+        else:
+            first = next(signals, None)
+            signals = itertools.chain([] if first is None else [first],
+                                      signals)
+
+        if append:
+            f = open(self.filename, 'ab')
+        elif bytesoffset and os.path.exists(self.filename):
+            f = open(self.filename, 'r+b')
+        else:
+            f = open(self.filename, 'wb')
+        try:
+            if not append:
+                f.seek(bytesoffset)
+            for sigs in signals:
+                self._write_signals(f, sigs, dtype, rangemin, rangemax,
+                                    chunk_size)
+            if not append:
+                f.truncate()
+        finally:
+            f.close()
+
+    def _check_segments(self, segments):
+        """
+        Iterate over the signals of the segments, as lists of 2D arrays,
+        checking that the signals of a segment have the same length and
+        that all the segments have the same number of channels.
+        """
+        nb_channel = None
+        for seg in segments:
+            sigs = [anasig.magnitude.reshape(anasig.shape[0], -1)
+                    for anasig in seg.analogsignals]
+            if not sigs:
+                continue
+
+            # all AnaologSignal from Segment must have the same length
+            length = sigs[0].shape[0]
+            for sig in sigs[1:]:
+                if sig.shape[0] != length:
+                    raise ValueError('All AnalogSignals must have the same '
+                                     'length (%i != %i)' %
+                                     (sig.shape[0], length))
+            nb = sum(sig.shape[1] for sig in sigs)
+            if nb_channel is not None and nb != nb_channel:
+                raise ValueError('All segments must have the same number of '
+                                 'channels (%i != %i)' % (nb, nb_channel))
+            nb_channel = nb
+            yield sigs
+
+    def _write_signals(self, f, sigs, dtype, rangemin, rangemax,
+                       chunk_size):
+        """
+        Write the interleaved channels of sigs, checked by _check_segments,
+        to the file object f, by chunks of chunk_size samples.
+        """
+        length = sigs[0].shape[0]
+        nb = sum(sig.shape[1] for sig in sigs)
+        buf = np.empty((min(chunk_size, length), nb))
+        out = np.empty(buf.shape, dtype=dtype)
+        for start in range(0, length, chunk_size):
+            stop = min(start + chunk_size, length)
+            chunk = buf[:stop - start]
+            col = 0
+            for sig in sigs:
+                chunk[:, col:col + sig.shape[1]] = sig[start:stop]
+                col += sig.shape[1]
+
+            if dtype.kind == 'i':
+                chunk -= ( rangemax+rangemin )/2.
+                chunk /= (rangemax - rangemin)
+                chunk *= 2 ** (8 * dtype.itemsize )
+            elif dtype.kind == 'u' :
+                chunk -= rangemin
+                chunk /= (rangemax - rangemin)
+                chunk *= 2 ** (8 * dtype.itemsize)
+            out[:stop - start] = chunk
+            f.write(out[:stop - start].tobytes())
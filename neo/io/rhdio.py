@@ -140,8 +140,6 @@ class RHDIO(BaseIO):
         channel_idx.analogsignals.append(signals)
         segment.analogsignals.append(signals)
         block.channel_indexes.append(channel_idx)
-        block.create_many_to_one_relationship(force=True, recursive=True)
-        block.create_many_to_many_relationship()
 
         # Now get ADC channel data. This is additonal analog inputs to the Intan board
         if header["num_board_adc_channels"] > 0:
@@ -166,8 +164,6 @@ class RHDIO(BaseIO):
             channel_idx.analogsignals.append(signals)
             segment.analogsignals.append(signals)
             block.channel_indexes.append(channel_idx)
-            block.create_many_to_one_relationship(force=True, recursive=True)
-            block.create_many_to_many_relationship()
 
         # Import aux data
         if header["num_aux_input_channels"] > 0:
@@ -192,8 +188,6 @@ class RHDIO(BaseIO):
             channel_idx.analogsignals.append(signals)
             segment.analogsignals.append(signals)
             block.channel_indexes.append(channel_idx)
-            block.create_many_to_one_relationship(force=True, recursive=True)
-            block.create_many_to_many_relationship()
 
         # Create event arrays from digital inputs
         # Loop through all rows of the digital input data and create event arrays
@@ -222,14 +216,15 @@ class RHDIO(BaseIO):
                     #channel_idx.events.append(ea)
                     segment.events.append(ea)
                 block.channel_indexes.append(channel_idx)
-                block.create_many_to_one_relationship(force=True, recursive=True)
-                block.create_many_to_many_relationship()
-                segment.create_many_to_one_relationship()
             else:
                 print(header["num_board_dig_in_channels"],' found in rhd file but will NOT be stored')
 
         del data
 
+        # link everything once all the children have been added
+        block.create_relationship(force=True)
+        segment.create_many_to_one_relationship()
+
         return segment
 
     def read_block(self, lazy=False, cascade=True, storeDIG=True, **kwargs):
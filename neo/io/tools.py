@@ -3,9 +3,12 @@
 Tools for IO coder:
   * Creating RecordingChannel and making links with AnalogSignals and
     SPikeTrains
+  * Parsing delimited numeric text files
 """
 
 import collections
+import multiprocessing
+import warnings
 
 import numpy as np
 
@@ -156,3 +159,217 @@ def binary_converter(code, bits_per_char):
         vals[ii] = np.sum((2 ** np.arange(bits_per_char - 1, -1, -1)) * binvec)
 
     return "".join(map(chr, vals.astype(np.uint8)))
+
+
+def read_numeric_table(fileobj, n_columns, chunk_size=2 ** 22):
+    """
+    Parse whitespace-delimited numbers from the binary file object
+    `fileobj`, from its current position to its end, into a 2D float array
+    with `n_columns` columns.
+
+    The file is read and parsed in chunks of about `chunk_size` bytes, cut
+    at line ends, so it is never held in memory as text, and each chunk is
+    converted by NumPy in a single call.  A ValueError is raised if a value
+    is not a number or if a line does not have `n_columns` values.
+    """
+    chunks = list(iter_numeric_table(fileobj, n_columns, chunk_size))
+    if not chunks:
+        return np.empty((0, n_columns))
+    elif len(chunks) == 1:
+        return chunks[0]
+    return np.concatenate(chunks)
+
+
+def iter_numeric_table(fileobj, n_columns, chunk_size=2 ** 22,
+                       delimiter=None, size=None, comments=None):
+    """
+    Iterate over the chunks of :func:`read_numeric_table`, as 2D float
+    arrays with `n_columns` columns, so that a file can be processed with
+    a bounded amount of memory.
+
+    Values may also be separated by `delimiter` (e.g. ',' or ';') rather
+    than by whitespace.  If `size` is given, only that many bytes are read.
+    Text from `comments` (e.g. '#') to the end of a line is ignored.
+    """
+    name = getattr(fileobj, 'name', fileobj)
+    rest = b''
+    while True:
+        if size is None:
+            data = fileobj.read(chunk_size)
+        else:
+            data = fileobj.read(min(chunk_size, size))
+            size -= len(data)
+        if not data:
+            if rest.strip():
+                yield parse_numbers(rest, n_columns, delimiter, name,
+                                    comments)
+            return
+        data = rest + data
+        cut = data.rfind(b'\n') + 1
+        data, rest = data[:cut], data[cut:]
+        if data:
+            yield parse_numbers(data, n_columns, delimiter, name, comments)
+
+
+def parse_numbers(data, n_columns=1, delimiter=None, name='data',
+                  comments=None):
+    """
+    Parse the numbers in the bytes `data`, separated by whitespace or by
+    `delimiter`, into a 2D float array with `n_columns` columns.
+
+    Empty fields between delimiters, and blank lines, are ignored, as well
+    as the text from `comments` to the end of each line.  If `n_columns`
+    is more than 1, a ValueError is raised if a line does not have
+    `n_columns` values; otherwise the values of all the lines are returned
+    in a single column.
+    """
+    if comments is not None:
+        comments = comments.encode('ascii')
+        if comments in data:
+            data = b'\n'.join(line.split(comments, 1)[0]
+                               for line in data.split(b'\n'))
+    if delimiter is not None and not delimiter.isspace():
+        data = data.replace(delimiter.encode('ascii'), b' ')
+    if not data.strip():
+        # numpy parses blank data as [-1.]
+        return np.empty((0, n_columns))
+    with warnings.catch_warnings():
+        # numpy only warns when it stops at something that is not a number
+        warnings.simplefilter('error', DeprecationWarning)
+        try:
+            values = np.fromstring(data, dtype=np.float64, sep=' ')
+        except DeprecationWarning:
+            raise ValueError("Could not parse the numbers in %s" % name)
+    if values.size % n_columns or (
+            n_columns > 1 and not _check_line_lengths(data, n_columns)):
+        raise ValueError("Expected %d values per line in %s" %
+                         (n_columns, name))
+    return values.reshape(-1, n_columns)
+
+
+def _check_line_lengths(data, n_columns):
+    """
+    Whether each non-blank line of the bytes `data` has `n_columns` fields
+    separated by whitespace, counted with NumPy on the bytes.
+    """
+    buf = np.frombuffer(data, dtype=np.uint8)
+    space = (buf == 32) | ((buf >= 9) & (buf <= 13))
+    # a field starts at a byte which is not whitespace, after one which is
+    starts = ~space
+    starts[1:] &= space[:-1]
+    counts = np.bincount(np.cumsum(buf == 10)[starts])
+    return bool((counts[counts != 0] == n_columns).all())
+
+
+def read_text_columns(filename, usecols=None, skiprows=0, delimiter=None,
+                      dtype=np.float64, chunk_size=2 ** 22, parallel=False,
+                      order='C'):
+    """
+    Read the numeric columns of a delimited text file into a 2D array.
+
+    `usecols` is None to read all the columns, or the list of the indexes
+    of the columns to keep, in the order they are wanted.  The first
+    `skiprows` lines are skipped, and the number of columns is taken from
+    the first non-empty line after them.  Values are separated by
+    whitespace or by `delimiter`.
+
+    The lines are counted first, so that the output, which only contains
+    the selected columns in `dtype`, is allocated once with the given
+    `order`.  The file is then parsed in chunks of about `chunk_size` bytes,
+    cut at line ends.  If `parallel` is True, or a number of processes, the
+    file is divided into ranges of lines which are parsed by a pool of
+    processes.
+    """
+    with open(filename, 'rb') as f:
+        for i in range(skiprows):
+            f.readline()
+        start = f.tell()
+        line = f.readline()
+        while line and not line.strip():
+            line = f.readline()
+        n_columns = len(parse_numbers(line, 1, delimiter, filename))
+        n_rows = 0
+        f.seek(start)
+        data = f.read(chunk_size)
+        while data:
+            n_rows += data.count(b'\n')
+            last = data
+            data = f.read(chunk_size)
+        if n_columns and not last.endswith(b'\n'):
+            n_rows += 1
+        end = f.tell()
+
+        ranges = [(start, end - start)]
+        n_procs = parallel
+        if parallel is True:
+            n_procs = multiprocessing.cpu_count()
+        if n_procs and n_procs > 1:
+            ranges = []
+            step = (end - start) // n_procs + 1
+            position = start
+            while position < end:
+                f.seek(min(position + step, end))
+                f.readline()
+                stop = min(max(f.tell(), position + 1), end)
+                ranges.append((position, stop - position))
+                position = stop
+
+    if usecols is None:
+        usecols = range(n_columns)
+    usecols = np.asarray(usecols, dtype=np.intp) % max(n_columns, 1)
+    out = np.empty((n_rows, len(usecols)), dtype=dtype, order=order)
+    if not n_columns:
+        return out[:0]
+
+    tasks = [(filename, offset, size, n_columns, usecols, delimiter,
+              chunk_size) for offset, size in ranges]
+    row = 0
+    if len(tasks) > 1:
+        pool = multiprocessing.Pool(len(tasks))
+        try:
+            chunks = pool.imap(_read_text_range_task, tasks)
+            for values in chunks:
+                row = _fill_rows(out, row, values, n_columns, filename)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        for values in _iter_text_range(*tasks[0]):
+            row = _fill_rows(out, row, values, n_columns, filename)
+    # blank lines were counted but hold no values
+    return out[:row]
+
+
+def _fill_rows(out, row, values, n_columns, name):
+    """
+    Copy `values` into `out` from `row`, and return the next row.
+    """
+    if row + len(values) > len(out):
+        raise ValueError("Expected %d values per line in %s" %
+                         (n_columns, name))
+    out[row:row + len(values)] = values
+    return row + len(values)
+
+
+def _iter_text_range(filename, offset, size, n_columns, usecols, delimiter,
+                     chunk_size):
+    """
+    Iterate over the selected columns of the lines in a range of bytes of
+    a text file, by chunks.
+    """
+    with open(filename, 'rb') as f:
+        f.seek(offset)
+        for values in iter_numeric_table(f, n_columns, chunk_size,
+                                         delimiter, size):
+            yield values[:, usecols]
+
+
+def _read_text_range_task(task):
+    """
+    Read the selected columns of a range of bytes of a text file, for
+    `Pool.imap`.
+    """
+    chunks = list(_iter_text_range(*task))
+    if not chunks:
+        return np.empty((0, len(task[4])))
+    return np.concatenate(chunks)
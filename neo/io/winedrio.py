@@ -18,10 +18,10 @@ import os
 import struct
 import sys
 
-import numpy as np
 import quantities as pq
 
 from neo.io.baseio import BaseIO
+from neo.io.proxyobjects import AnalogSignalProxy, memmap_signals
 from neo.core import Segment, AnalogSignal
 
 PY3K = (sys.version_info[0] == 3)
@@ -97,11 +97,9 @@ class WinEdrIO(BaseIO):
                 val = float(val)
             header[key] = val
 
-        if not lazy:
-            data = np.memmap(self.filename , np.dtype('i2')  , 'r',
-                  #shape = (header['NC'], header['NP']) ,
-                  shape = (header['NP']/header['NC'],header['NC'], ) ,
-                  offset = header['NBH'])
+        data = memmap_signals(self.filename, '<i2', header['NC'],
+                              bytes_offset=header['NBH'],
+                              n_samples=header['NP']//header['NC'])
 
         for c in range(header['NC']):
 
@@ -123,18 +121,18 @@ class WinEdrIO(BaseIO):
             except:
                 unit = pq.Quantity(1., '')
 
+            gain = AD/( YCF*YAG*(ADCMAX+1))
+            ana = AnalogSignalProxy(data[:,int(header['YO%d'%c])],
+                                    units=unit,
+                                    sampling_rate=pq.Hz / DT,
+                                    gain=gain, offset=-YZ*gain,
+                                    t_start=0. * pq.s, dtype='f4',
+                                    name=header['YN%d' % c],
+                                    channel_index=c)
             if lazy:
-                signal = [ ] * unit
+                ana = ana.lazy_signal()
             else:
-                signal = (data[:,header['YO%d'%c]].astype('f4')-YZ) *AD/( YCF*YAG*(ADCMAX+1)) * unit
-
-            ana = AnalogSignal(signal,
-                               sampling_rate=pq.Hz / DT,
-                               t_start=0. * pq.s,
-                               name=header['YN%d' % c],
-                               channel_index=c)
-            if lazy:
-                ana.lazy_shape = header['NP']/header['NC']
+                ana = ana.load()
 
             seg.analogsignals.append(ana)
 
@@ -16,10 +16,10 @@ import os
 import struct
 import sys
 
-import numpy as np
 import quantities as pq
 
 from neo.io.baseio import BaseIO
+from neo.io.proxyobjects import AnalogSignalProxy, memmap_signals
 from neo.core import Block, Segment, AnalogSignal
 
 PY3K = (sys.version_info[0] == 3)
@@ -107,15 +107,13 @@ class WinWcpIO(BaseIO):
             analysisHeader = HeaderReader(fid , AnalysisDescription ).read_f(offset = offset)
             #print analysisHeader
 
-            # read data
-            NP = (SECTORSIZE*header['NBD'])/2
+            # memory-map data
+            NP = (SECTORSIZE*header['NBD'])//2
             NP = NP - NP%header['NC']
-            NP = NP/header['NC']
-            if not lazy:
-                data = np.memmap(self.filename , np.dtype('i2')  , 'r',
-                              #shape = (header['NC'], header['NP']) ,
-                              shape = (NP,header['NC'], ) ,
-                              offset = offset+header['NBA']*SECTORSIZE)
+            NP = NP//header['NC']
+            data = memmap_signals(self.filename, '<i2', header['NC'],
+                                  bytes_offset=offset+header['NBA']*SECTORSIZE,
+                                  n_samples=NP)
 
             # create a segment
             seg = Segment()
@@ -129,23 +127,23 @@ class WinWcpIO(BaseIO):
                 except:
                     unit = pq.Quantity(1., '')
 
-                if lazy:
-                    signal = [ ] * unit
-                else:
-                    YG = float(header['YG%d'%c].replace(',','.'))
-                    ADCMAX = header['ADCMAX']
-                    VMax = analysisHeader['VMax'][c]
-                    signal = data[:,header['YO%d'%c]].astype('f4')*VMax/ADCMAX/YG * unit
-                anaSig = AnalogSignal(signal,
-                                      sampling_rate=
-                                      pq.Hz /
-                                      analysisHeader['SamplingInterval'] ,
-                                      t_start=analysisHeader['TimeRecorded'] *
-                                      pq.s,
-                                      name=header['YN%d'%c], channel_index=c)
+                YG = float(header['YG%d'%c].replace(',','.'))
+                ADCMAX = header['ADCMAX']
+                VMax = analysisHeader['VMax'][c]
+                anaSig = AnalogSignalProxy(data[:,int(header['YO%d'%c])],
+                                           units=unit,
+                                           sampling_rate=
+                                           pq.Hz /
+                                           analysisHeader['SamplingInterval'] ,
+                                           gain=VMax/ADCMAX/YG,
+                                           t_start=analysisHeader['TimeRecorded'] *
+                                           pq.s, dtype='f4',
+                                           name=header['YN%d'%c], channel_index=c)
 
                 if lazy:
-                    anaSig.lazy_shape = NP
+                    anaSig = anaSig.lazy_signal()
+                else:
+                    anaSig = anaSig.load()
                 seg.analogsignals.append(anaSig)
 
         fid.close()
@@ -22,8 +22,9 @@ else:
     HAVE_IPYTHON = True
 
 from numpy.testing import assert_array_equal
-from neo.core.analogsignal import AnalogSignal
-from neo.core import Segment, ChannelIndex
+from neo.core.analogsignal import AnalogSignal, concatenate_signals
+from neo.core.baseneo import MergeError
+from neo.core import Segment, ChannelIndex, Epoch
 from neo.test.tools import (assert_arrays_almost_equal, assert_arrays_equal,
                             assert_neo_object_is_compliant,
                             assert_same_sub_schema)
@@ -150,6 +151,26 @@ class TestAnalogSignalArrayConstructor(unittest.TestCase):
         data[3, 0] = 99*pq.mV
         self.assertEqual(signal[3, 0], 99000*pq.uV)
 
+    def test__from_trusted_array(self):
+        data = np.arange(20.0).reshape((10, 2))
+        signal = AnalogSignal.from_trusted_array(data, units='mV',
+                                                 sampling_rate=1*pq.kHz,
+                                                 t_start=1*pq.s,
+                                                 name='spam', arg1='test')
+        assert_neo_object_is_compliant(signal)
+        self.assertEqual(signal.t_start, 1*pq.s)
+        self.assertEqual(signal.t_stop, 1.01*pq.s)
+        self.assertEqual(signal[9, 1], 19*pq.mV)
+        self.assertEqual(signal.name, 'spam')
+        self.assertEqual(signal.annotations, {'arg1': 'test'})
+        self.assertTrue(np.may_share_memory(signal, data))
+
+        signal = AnalogSignal.from_trusted_array(np.arange(5.0)*pq.nA,
+                                                 sampling_period=1*pq.ms)
+        self.assertEqual(signal.shape, (5, 1))
+        self.assertEqual(signal.units, pq.nA)
+        self.assertEqual(signal.sampling_rate, 1*pq.kHz)
+
     # signal must not be 1D - should raise Exception if 1D
 
 
@@ -365,6 +386,22 @@ class TestAnalogSignalArrayArrayMethods(unittest.TestCase):
         self.assertEqual(result.sampling_rate, self.signal1.sampling_rate)
         assert_arrays_equal(result, self.data1[2:7])
 
+    def test__slice_attributes_independent(self):
+        result = self.signal1[2:7]
+        result.name = 'ham'
+        result.t_start = 5*pq.s
+        self.assertEqual(self.signal1.name, 'spam')
+        self.assertEqual(self.signal1.t_start, 0*pq.s)
+        self.assertEqual(result.units, self.signal1.units)
+        self.assertIsNot(result._dimensionality,
+                         self.signal1._dimensionality)
+
+    def test__slice_other_attributes_not_copied(self):
+        self.signal1.extra = 'eggs'
+        result = self.signal1[2:7]
+        self.assertFalse(hasattr(result, 'extra'))
+        self.assertEqual(result.name, 'spam')
+
     def test__getitem_should_return_single_quantity(self):
         # quantities drops the units in this case
         self.assertEqual(self.signal1[9, 3], 48000*pq.pA)
@@ -576,6 +613,64 @@ class TestAnalogSignalArrayArrayMethods(unittest.TestCase):
             assert_array_equal(result.magnitude, targ.magnitude)
             assert_same_sub_schema(result, targ)
 
+    def test__time_slice__copy(self):
+        result = self.signal2.time_slice(2 * pq.s, 4 * pq.s)
+        result[0, 0] = -1 * pq.mV
+        self.assertEqual(self.signal2[2, 0], 2 * pq.mV)
+        self.assertFalse(np.may_share_memory(result, self.signal2))
+
+    def test__time_slice__view(self):
+        t_start = 2 * pq.s
+        t_stop = 4 * pq.s
+
+        result = self.signal2.time_slice(t_start, t_stop, copy=False)
+        targ = self.signal2.time_slice(t_start, t_stop)
+        self.assertIsInstance(result, AnalogSignal)
+        assert_neo_object_is_compliant(result)
+        self.assertEqual(result.t_start, t_start)
+        self.assertEqual(result.t_stop, t_stop)
+        self.assertEqual(result.annotations, {'arg1': 'test'})
+        assert_array_equal(result.magnitude, targ.magnitude)
+
+        self.assertTrue(np.may_share_memory(result, self.signal2))
+        result[0, 0] = -1 * pq.mV
+        self.assertEqual(self.signal2[2, 0], -1 * pq.mV)
+
+    def test__time_slice__view_out_of_bounds_ValueError(self):
+        self.assertRaises(ValueError, self.signal2.time_slice,
+                          -2 * pq.s, 4 * pq.s, copy=False)
+        self.assertRaises(ValueError, self.signal2.time_slice,
+                          2 * pq.s, 40 * pq.s, copy=False)
+
+    def test__time_slices(self):
+        times = [0, 3, 1] * pq.s
+        result = self.signal2.time_slices(times, 2 * pq.s)
+        self.assertIsInstance(result, pq.Quantity)
+        self.assertEqual(result.shape, (3, 2, 2))
+        self.assertEqual(result.units, pq.mV)
+        for k, t in enumerate(times):
+            targ = self.signal2.time_slice(t, t + 2 * pq.s)
+            assert_array_equal(result[k].magnitude, targ.magnitude)
+
+    def test__time_slices__epoch(self):
+        self.signal2.t_start = 10.0 * pq.ms
+        epoch = Epoch(times=[1010., 3010.] * pq.ms,
+                      durations=[2., 2.] * pq.s,
+                      labels=np.array(['a', 'b'], dtype='S'))
+        result = self.signal2.time_slices(epoch)
+        targ = np.array([[[1, 1], [2, 2]], [[3, 3], [4, 4]]])
+        assert_array_equal(result.magnitude, targ)
+
+    def test__time_slices__inconsistent_durations_ValueError(self):
+        self.assertRaises(ValueError, self.signal2.time_slices,
+                          [0, 1] * pq.s, [1, 2] * pq.s)
+
+    def test__time_slices__out_of_bounds_ValueError(self):
+        self.assertRaises(ValueError, self.signal2.time_slices,
+                          [0, 5] * pq.s, 2 * pq.s)
+        self.assertRaises(ValueError, self.signal2.time_slices,
+                          [-1, 2] * pq.s, 2 * pq.s)
+
 
 class TestAnalogSignalArrayEquality(unittest.TestCase):
     def test__signals_with_different_data_complement_should_be_not_equal(self):
@@ -776,6 +871,59 @@ class TestAnalogSignalArrayCombination(unittest.TestCase):
         assert_arrays_equal(mergeddata23, targdata23)
         assert_arrays_equal(mergeddata24, targdata24)
 
+    def test__concatenate_signals__channels(self):
+        data3 = np.arange(1000.0, 1033.0).reshape((11, 3)) * pq.uV
+        signal3 = AnalogSignal(data3, sampling_rate=1*pq.kHz, name='spam',
+                               description='eggs', file_origin='testfile.txt',
+                               arg1='test')
+        result = concatenate_signals([self.signal1, self.signal2, signal3])
+
+        assert_neo_object_is_compliant(result)
+        self.assertEqual(result.shape, (11, 13))
+        self.assertEqual(result.units, pq.mV)
+        target = np.hstack([self.data1, self.data2,
+                            data3.rescale(pq.mV).magnitude])
+        assert_arrays_almost_equal(result.magnitude, target, 1e-12)
+        self.assertEqual(result.name, 'spam')
+        self.assertEqual(result.annotations, {'arg1': 'test'})
+        assert_array_equal(result.channel_index.index, np.arange(13))
+
+        # same result as pairwise merging
+        merged = self.signal1.merge(self.signal2).merge(signal3)
+        assert_arrays_almost_equal(result.magnitude, merged.magnitude, 1e-12)
+
+    def test__concatenate_signals__time(self):
+        signal2 = AnalogSignal(self.data2quant.rescale(pq.V),
+                               sampling_rate=1*pq.kHz,
+                               t_start=self.signal1.t_stop.rescale(pq.ms),
+                               name='ham', arg1='test2')
+        result = concatenate_signals([self.signal1, signal2], axis='time')
+
+        assert_neo_object_is_compliant(result)
+        self.assertEqual(result.shape, (22, 5))
+        self.assertEqual(result.units, pq.mV)
+        self.assertEqual(result.t_start, self.signal1.t_start)
+        self.assertEqual(result.t_stop, signal2.t_stop)
+        assert_arrays_almost_equal(result.magnitude,
+                                   np.vstack([self.data1, self.data2]),
+                                   1e-9)
+        self.assertEqual(result.name, 'merge(spam, ham)')
+        self.assertEqual(result.annotations, {'arg1': 'test;test2'})
+
+    def test__concatenate_signals__incompatible(self):
+        self.assertRaises(ValueError, concatenate_signals, [])
+        self.assertRaises(ValueError, concatenate_signals,
+                          [self.signal1, self.signal2], axis='rows')
+        # signal2 overlaps signal1 in time
+        self.assertRaises(MergeError, concatenate_signals,
+                          [self.signal1, self.signal2], axis='time')
+        signal3 = AnalogSignal(self.data1quant, sampling_rate=2*pq.kHz)
+        self.assertRaises(MergeError, concatenate_signals,
+                          [self.signal1, signal3])
+        signal4 = AnalogSignal(self.data1quant[:5], sampling_rate=1*pq.kHz)
+        self.assertRaises(MergeError, concatenate_signals,
+                          [self.signal1, signal4])
+
 
 class TestAnalogSignalArrayFunctions(unittest.TestCase):
     def test__pickle(self):
@@ -24,7 +24,8 @@ else:
     HAVE_IPYTHON = True
 
 from neo.core.baseneo import (BaseNeo, _check_annotations,
-                              merge_annotations, merge_annotation)
+                              merge_annotations, merge_annotation,
+                              merge_many_annotations)
 from neo.test.tools import assert_arrays_equal
 
 
@@ -218,6 +219,28 @@ class Test_BaseNeo_merge_annotations_merge(unittest.TestCase):
         assert_arrays_equal(val61, val61c)
         assert_arrays_equal(val62, val62c)
 
+    def test_merge_many_annotations__func__dict(self):
+        ann1 = {'val0': 'val0', 'val1': 1, 'val3': 'test1', 'val4': [.4],
+                'val6': np.array([0, 1, 2])}
+        ann2 = {'val1': 1, 'val3': 'test2', 'val4': [4],
+                'val6': np.array([4, 5])}
+        ann3 = {'val3': 'test3', 'val4': [4.4], 'val6': np.array([6]),
+                'val7': True}
+
+        targ = {'val0': 'val0', 'val1': 1, 'val3': 'test1;test2;test3',
+                'val4': [.4, 4, 4.4], 'val7': True}
+
+        res = merge_many_annotations([ann1, ann2, ann3])
+        val6r = res.pop('val6')
+
+        self.assertEqual(res, targ)
+        assert_arrays_equal(val6r, np.array([0, 1, 2, 4, 5, 6]))
+
+        # same result as pairwise merging
+        pairwise = merge_annotations(merge_annotations(ann1, ann2), ann3)
+        pairwise.pop('val6')
+        self.assertEqual(res, pairwise)
+
     def test_merge_annotation__func__str(self):
         ann1 = 'test1'
         ann2 = 'test2'
@@ -6,7 +6,9 @@ Tests of the neo.core.block.Block class
 # needed for python 3 compatibility
 from __future__ import absolute_import, division, print_function
 
+import copy
 from datetime import datetime
+import pickle
 
 try:
     import unittest2 as unittest
@@ -14,6 +16,7 @@ except ImportError:
     import unittest
 
 import numpy as np
+import quantities as pq
 
 try:
     from IPython.lib.pretty import pretty
@@ -24,8 +27,9 @@ else:
 
 from neo.core.block import Block
 from neo.core.container import filterdata
-from neo.core import SpikeTrain, Unit
-from neo.test.tools import (assert_neo_object_is_compliant,
+from neo.core import AnalogSignal, ChannelIndex, Segment, SpikeTrain, Unit
+from neo.test.tools import (assert_arrays_equal,
+                            assert_neo_object_is_compliant,
                             assert_same_sub_schema)
 from neo.test.generate_datasets import (get_fake_value, get_fake_values,
                                         fake_neo, clone_object,
@@ -333,6 +337,99 @@ class TestBlock(unittest.TestCase):
                                self.units1[2:],
                                exclude=['channel_index'])
 
+    def test__iter_children(self):
+        assert_same_sub_schema(list(self.blk1.iter_children()),
+                               list(self.blk1.children_recur))
+        assert_same_sub_schema(list(self.blk1.iter_children(recursive=False)),
+                               self.segs1 + self.chxs1)
+        assert_same_sub_schema(
+            list(self.blk1.iter_children(container=False)),
+            list(self.blk1.data_children_recur))
+
+        # SpikeTrains are in both Segments and Units but are returned once
+        trains = list(self.blk1.iter_children(cls=SpikeTrain))
+        self.assertEqual(len(trains), len(self.trains1))
+        self.assertEqual(len(set(id(train) for train in trains)),
+                         len(self.trains1))
+        assert_same_sub_schema(trains,
+                               list(self.blk1.iter_children(cls='SpikeTrain')))
+        assert_same_sub_schema(list(self.blk1.iter_children(cls='Unit')),
+                               self.units1)
+        self.assertEqual(
+            list(self.blk1.iter_children(cls=Unit, recursive=False)), [])
+
+    def test__create_relationship(self):
+        blk = Block()
+        seg = Segment()
+        chx = ChannelIndex(index=np.array([0]))
+        unit = Unit()
+        train = SpikeTrain([1, 2, 3]*pq.ms, t_stop=10*pq.ms)
+        blk.segments.append(seg)
+        blk.channel_indexes.append(chx)
+        chx.units.append(unit)
+        seg.spiketrains.append(train)
+        unit.spiketrains.append(train)
+
+        other = Segment()
+        train.segment = other
+        blk.create_relationship()
+        self.assertIs(seg.block, blk)
+        self.assertIs(chx.block, blk)
+        self.assertIs(unit.channel_index, chx)
+        self.assertIs(train.unit, unit)
+        self.assertIs(train.segment, other)
+
+        blk.create_relationship(force=True)
+        self.assertIs(train.segment, seg)
+
+        seg.block = None
+        blk.create_relationship(recursive=False)
+        self.assertIs(seg.block, blk)
+
+    def test__time_slice(self):
+        blk = Block(name='blk')
+        chx = ChannelIndex(index=np.array([0]), name='chx')
+        unit = Unit(name='unit')
+        blk.channel_indexes.append(chx)
+        chx.units.append(unit)
+        for i in range(2):
+            seg = Segment(index=i)
+            train = SpikeTrain([1, 2, 3, 5]*pq.ms, t_stop=10*pq.ms)
+            sig = AnalogSignal(np.arange(10.), units='mV',
+                               sampling_rate=1*pq.kHz)
+            seg.spiketrains.append(train)
+            seg.analogsignals.append(sig)
+            unit.spiketrains.append(train)
+            chx.analogsignals.append(sig)
+            blk.segments.append(seg)
+        blk.create_many_to_one_relationship()
+
+        result = blk.time_slice(2*pq.ms, 4*pq.ms)
+        self.assertEqual(result.name, 'blk')
+        self.assertEqual(len(result.segments), 2)
+        new_chx = result.channel_indexes[0]
+        new_unit = new_chx.units[0]
+        self.assertIsNot(new_chx, chx)
+        self.assertIsNot(new_unit, unit)
+        self.assertEqual(new_chx.name, 'chx')
+        self.assertEqual(new_unit.name, 'unit')
+        self.assertIs(new_unit.channel_index, new_chx)
+        for seg, new_seg in zip(blk.segments, result.segments):
+            self.assertEqual(new_seg.index, seg.index)
+            train = new_seg.spiketrains[0]
+            sig = new_seg.analogsignals[0]
+            assert_arrays_equal(train.magnitude, np.array([2., 3.]))
+            self.assertEqual(sig.shape, (2, 1))
+            self.assertIs(train.segment, new_seg)
+            self.assertIs(train.unit, new_unit)
+            self.assertIs(sig.segment, new_seg)
+            self.assertIs(sig.channel_index, new_chx)
+            self.assertIn(id(train), [id(st) for st in new_unit.spiketrains])
+            self.assertIn(id(sig), [id(a) for a in new_chx.analogsignals])
+        # the original block is untouched
+        self.assertIs(blk.segments[0].spiketrains[0].unit, unit)
+        self.assertEqual(len(unit.spiketrains), 2)
+
     def test__size(self):
         targ = {'segments': self.nchildren,
                 'channel_indexes': self.nchildren}
@@ -497,6 +594,48 @@ class TestBlock(unittest.TestCase):
         assert_same_sub_schema(res1, targ)
         assert_same_sub_schema(res2, targ)
 
+    def test__filter_use_index(self):
+        name = self.trains1[0].name
+        for targdict in [{'j': 1}, {'j': 5}, {'name': name},
+                         {'name': name, 'j': 1}, [{'j': 0}, {'i': 0}]]:
+            targ = self.targobj.filter(targdict)
+            res0 = self.targobj.filter(targdict, use_index=True)
+            res1 = self.targobj.filter(targdict, use_index=True)
+            assert_same_sub_schema(res0, targ)
+            assert_same_sub_schema(res1, targ)
+
+        res = self.targobj.filter(j=1, objects=SpikeTrain, use_index=True)
+        assert_same_sub_schema(res, self.trains1[1::2])
+
+    def test__filter_use_index_children_changed(self):
+        res0 = self.targobj.filter(j=1, objects=SpikeTrain, use_index=True)
+        train = SpikeTrain([1, 2] * pq.s, t_stop=10 * pq.s, j=1)
+        self.targobj.segments[0].spiketrains.append(train)
+        res1 = self.targobj.filter(j=1, objects=SpikeTrain, use_index=True)
+        self.assertEqual(len(res1), len(res0) + 1)
+        self.assertTrue(any(res is train for res in res1))
+
+        self.targobj.segments[0].spiketrains = [train]
+        res2 = self.targobj.filter(j=1, objects=SpikeTrain, use_index=True)
+        assert_same_sub_schema(res2, self.targobj.filter(j=1,
+                                                       objects=SpikeTrain))
+
+        self.targobj.segments.pop()
+        res3 = self.targobj.filter(j=1, objects=SpikeTrain, use_index=True)
+        assert_same_sub_schema(res3, self.targobj.filter(j=1,
+                                                       objects=SpikeTrain))
+
+    def test__filter_use_index_not_copied(self):
+        self.targobj.filter(j=1, use_index=True)
+        self.assertTrue(hasattr(self.targobj, '_filter_indices'))
+        self.assertFalse(hasattr(copy.copy(self.targobj), '_filter_indices'))
+        self.assertFalse(hasattr(copy.deepcopy(self.targobj),
+                                 '_filter_indices'))
+        obj = pickle.loads(pickle.dumps(self.targobj))
+        self.assertFalse(hasattr(obj, '_filter_indices'))
+        assert_same_sub_schema(obj.filter(j=1, use_index=True),
+                               self.targobj.filter(j=1))
+
     def test__filter_single_annotation_obj_single(self):
         targ = self.trains1[1::2]
 
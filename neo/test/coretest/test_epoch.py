@@ -123,6 +123,20 @@ class TestEpoch(unittest.TestCase):
         self.assertEqual(epc.annotations['test2'], 'y1')
         self.assertTrue(epc.annotations['test3'])
 
+    def test_Epoch_from_trusted_array(self):
+        times = np.array([1.1, 1.5, 1.7])
+        labels = np.array(['a', 'b', 'c'], dtype='S')
+        epc = Epoch.from_trusted_array(times, durations=[20, 40, 60]*pq.ns,
+                                       labels=labels, units='ms',
+                                       name='test', test1=1)
+        assert_neo_object_is_compliant(epc)
+        assert_arrays_equal(epc.times, [1.1, 1.5, 1.7]*pq.ms)
+        assert_arrays_equal(epc.durations, [20, 40, 60]*pq.ns)
+        assert_arrays_equal(epc.labels, labels)
+        self.assertEqual(epc.name, 'test')
+        self.assertEqual(epc.annotations, {'test1': 1})
+        self.assertIsNone(epc.segment)
+
     def test_Epoch_repr(self):
         params = {'test2': 'y1', 'test3': True}
         epc = Epoch([1.1, 1.5, 1.7]*pq.ms, durations=[20, 40, 60]*pq.ns,
@@ -485,6 +499,50 @@ class TestEpoch(unittest.TestCase):
         self.assertEqual(result.annotations['test1'], targ.annotations['test1'])
         self.assertEqual(result.annotations['test2'], targ.annotations['test2'])
     
+    def test_time_slice_sorted_and_unsorted(self):
+        times = [0.5, 1.1, 1.5, 2.2, 2.9]
+        durations = [0.1, 0.2, 0.3, 0.4, 0.5]
+        labels = np.array(['a', 'b', 'c', 'd', 'e'], dtype='S')
+        epc = Epoch(times*pq.s, durations=durations*pq.s, labels=labels)
+
+        result = epc.time_slice(1.0*pq.s, 2.2*pq.s)
+        self.assertTrue(epc._sorted)
+        assert_arrays_equal(result.magnitude, np.array([1.1, 1.5, 2.2]))
+        assert_arrays_equal(result.durations.magnitude,
+                            np.array([0.2, 0.3, 0.4]))
+        assert_arrays_equal(result.labels, labels[1:4])
+        self.assertTrue(np.may_share_memory(result, epc))
+
+        epc[4] = 1.2*pq.s
+        result = epc.time_slice(1000*pq.ms, None)
+        self.assertFalse(epc._sorted)
+        assert_arrays_equal(result.magnitude,
+                            np.array([1.1, 1.5, 2.2, 1.2]))
+        assert_arrays_equal(result.durations.magnitude,
+                            np.array([0.2, 0.3, 0.4, 0.5]))
+        assert_arrays_equal(result.labels, labels[1:])
+
+    def test_time_slice_in_place_changes(self):
+        epc = Epoch([0.5, 1.1, 1.5]*pq.s, durations=[0.1, 0.2, 0.3]*pq.s,
+                    labels=np.array(['a', 'b', 'c'], dtype='S'))
+        epc.time_slice(None, None)
+        self.assertTrue(epc._sorted)
+
+        epc -= 2*pq.s
+        epc *= -1
+        self.assertIsNone(epc._sorted)
+        result = epc.time_slice(0.6*pq.s, 1.5*pq.s)
+        assert_arrays_almost_equal(result.magnitude, np.array([1.5, 0.9]),
+                                   1e-9)
+        assert_arrays_equal(result.durations.magnitude, np.array([0.1, 0.2]))
+
+        epc.sort()
+        self.assertIsNone(epc._sorted)
+        result = epc.time_slice(0.6*pq.s, 1.5*pq.s)
+        self.assertTrue(epc._sorted)
+        assert_arrays_almost_equal(result.magnitude, np.array([0.9, 1.5]),
+                                   1e-9)
+
     def test_as_array(self):
         times = [2, 3, 4, 5]
         durations = [0.1, 0.2, 0.3, 0.4]
@@ -117,6 +117,18 @@ class TestEvent(unittest.TestCase):
         self.assertEqual(evt.annotations['test2'], 'y1')
         self.assertTrue(evt.annotations['test3'])
 
+    def test_Event_from_trusted_array(self):
+        times = np.array([1.1, 1.5, 1.7])
+        labels = np.array(['a', 'b', 'c'], dtype='S')
+        evt = Event.from_trusted_array(times, labels=labels, units='ms',
+                                       name='test', test1=1)
+        assert_neo_object_is_compliant(evt)
+        assert_arrays_equal(evt.times, [1.1, 1.5, 1.7]*pq.ms)
+        assert_arrays_equal(evt.labels, labels)
+        self.assertEqual(evt.name, 'test')
+        self.assertEqual(evt.annotations, {'test1': 1})
+        self.assertIsNone(evt.segment)
+
     def tests_time_slice (self):
         params = {'test2': 'y1', 'test3': True}
         evt = Event([0.1, 0.5, 1.1, 1.5, 1.7, 2.2, 2.9, 3.0, 3.1, 3.3]*pq.ms,
@@ -269,6 +281,61 @@ class TestEvent(unittest.TestCase):
         self.assertEqual(targ.annotations['test1'], result.annotations['test1'])
         self.assertEqual(targ.annotations['test2'], result.annotations['test2'])
 
+    def test_time_slice_sorted_and_unsorted(self):
+        times = [0.1, 0.5, 1.1, 1.5, 1.7, 2.2, 2.9, 3.0, 3.1, 3.3]
+        labels = np.array(['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j'],
+                          dtype='S')
+        evt = Event(times*pq.ms, labels=labels)
+
+        result = evt.time_slice(2.0*pq.ms, 3.0*pq.ms)
+        self.assertTrue(evt._sorted)
+        assert_arrays_equal(result.magnitude, np.array([2.2, 2.9, 3.0]))
+        assert_arrays_equal(result.labels, labels[5:8])
+        # a view, found by binary search
+        self.assertTrue(np.may_share_memory(result, evt))
+
+        evt[0] = 2.5*pq.ms
+        self.assertIsNone(evt._sorted)
+        result = evt.time_slice(0.002*pq.s, 0.003*pq.s)
+        self.assertFalse(evt._sorted)
+        assert_arrays_equal(result.magnitude, np.array([2.5, 2.2, 2.9, 3.0]))
+        assert_arrays_equal(result.labels, labels[[0, 5, 6, 7]])
+
+    def test_time_slice_labels(self):
+        # the labels are sliced with the times, whether they are sorted or not
+        labels = np.array(['a', 'b', 'c', 'd'], dtype='S')
+        for times, targ in [([0.1, 0.5, 1.1, 1.5], [1, 2]),
+                            ([1.5, 0.5, 0.1, 1.1], [1, 3])]:
+            evt = Event(times*pq.ms, labels=labels)
+            result = evt.time_slice(0.2*pq.ms, 1.2*pq.ms)
+            self.assertEqual(len(result), 2)
+            assert_arrays_equal(result.labels, labels[targ])
+
+    def test_time_slice_in_place_changes(self):
+        evt = Event([0.1, 0.5, 1.1, 1.5]*pq.ms,
+                    labels=np.array(['a', 'b', 'c', 'd'], dtype='S'))
+        evt.time_slice(None, None)
+        self.assertTrue(evt._sorted)
+
+        evt *= -1
+        self.assertIsNone(evt._sorted)
+        result = evt.time_slice(-1.2*pq.ms, 0*pq.ms)
+        assert_arrays_equal(result.magnitude, np.array([-0.1, -0.5, -1.1]))
+
+        evt.sort()
+        self.assertIsNone(evt._sorted)
+        result = evt.time_slice(-1.2*pq.ms, -0.2*pq.ms)
+        self.assertTrue(evt._sorted)
+        assert_arrays_equal(result.magnitude, np.array([-1.1, -0.5]))
+
+        for change in [lambda: evt.__iadd__(1*pq.ms),
+                       lambda: evt.__itruediv__(2),
+                       lambda: evt.fill(0),
+                       lambda: evt.put([0], [1]*pq.ms)]:
+            evt.time_slice(None, None)
+            change()
+            self.assertIsNone(evt._sorted)
+
     def test_Event_repr(self):
         params = {'test2': 'y1', 'test3': True}
         evt = Event([1.1, 1.5, 1.7]*pq.ms,
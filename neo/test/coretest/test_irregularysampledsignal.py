@@ -22,7 +22,7 @@ else:
     HAVE_IPYTHON = True
 
 from neo.core.irregularlysampledsignal import IrregularlySampledSignal
-from neo.core import Segment
+from neo.core import Segment, AnalogSignal
 from neo.test.tools import (assert_arrays_almost_equal, assert_arrays_equal,
                             assert_neo_object_is_compliant,
                             assert_same_sub_schema)
@@ -329,8 +329,74 @@ class TestIrregularlySampledSignalArrayMethods(unittest.TestCase):
     def test_mean_interpolation_NotImplementedError(self):
         self.assertRaises(NotImplementedError, self.signal1.mean, True)
 
+    def test_mean_linear(self):
+        values = self.data1quant
+        targmean = ((values[:-1] + values[1:]) / 2 *
+                    np.diff(self.time1quant)).sum()
+        targmean /= self.time1quant[-1] - self.time1quant[0]
+        assert_arrays_almost_equal(self.signal1.mean('linear'), targmean,
+                                   1e-12)
+
     def test_resample_NotImplementedError(self):
-        self.assertRaises(NotImplementedError, self.signal1.resample, True)
+        self.assertRaises(NotImplementedError, self.signal1.resample,
+                          1*pq.Hz, 'cubic')
+
+    def test_resample_ValueError(self):
+        self.assertRaises(ValueError, self.signal1.resample, True)
+        self.assertRaises(ValueError, self.signal1.resample, 1*pq.mV)
+        # no extrapolation
+        self.assertRaises(ValueError, self.signal1.resample,
+                          [0.0, 50.0]*pq.ms)
+
+    def test_resample_times(self):
+        times = np.array([[0.0, 0.0], [1.0, 10.0], [3.0, 30.0]])
+        signal = IrregularlySampledSignal([0.0, 1.0, 3.0]*pq.s, times,
+                                          units='mV', name='spam', arg1='a')
+        at = [500.0, 1000.0, 2500.0]*pq.ms
+
+        result = signal.resample(at)
+        self.assertIsInstance(result, IrregularlySampledSignal)
+        assert_neo_object_is_compliant(result)
+        assert_arrays_equal(result.times.magnitude, np.array([0.5, 1.0, 2.5]))
+        self.assertEqual(result.times.units, pq.s)
+        assert_arrays_equal(result.magnitude,
+                            np.array([[0.0, 0.0], [1.0, 10.0], [1.0, 10.0]]))
+        self.assertEqual(result.name, 'spam')
+        self.assertEqual(result.annotations, {'arg1': 'a'})
+
+        result = signal.resample(at, interpolation='linear')
+        assert_arrays_almost_equal(result.magnitude,
+                                   np.array([[0.5, 5.0], [1.0, 10.0],
+                                             [2.5, 25.0]]), 1e-12)
+        # same as np.interp channel by channel
+        for i in range(2):
+            assert_arrays_almost_equal(
+                result.magnitude[:, i],
+                np.interp(at.rescale(pq.s).magnitude,
+                          signal.times.magnitude, signal.magnitude[:, i]),
+                1e-12)
+
+    def test_resample_regular(self):
+        signal = IrregularlySampledSignal([1.0, 2.0, 4.0]*pq.s,
+                                          [0.0, 2.0, 6.0]*pq.mV)
+        for at in (0.5*pq.s, 2*pq.Hz):
+            result = signal.resample(at, interpolation='linear')
+            self.assertIsInstance(result, AnalogSignal)
+            assert_neo_object_is_compliant(result)
+            self.assertEqual(result.t_start, 1.0*pq.s)
+            self.assertEqual(result.sampling_period, 0.5*pq.s)
+            assert_arrays_almost_equal(result.magnitude.ravel(),
+                                       np.arange(0.0, 6.5, 1.0), 1e-12)
+
+        target = AnalogSignal(np.zeros((3, 2)), units='V', t_start=1.5*pq.s,
+                              sampling_rate=1*pq.Hz)
+        result = signal.resample(target)
+        self.assertIsInstance(result, AnalogSignal)
+        self.assertEqual(result.units, pq.mV)
+        self.assertEqual(result.t_start, target.t_start)
+        self.assertEqual(result.sampling_rate, target.sampling_rate)
+        assert_arrays_equal(result.magnitude.ravel(),
+                            np.array([0.0, 2.0, 2.0]))
 
     def test__rescale_same(self):
         result = self.signal1.copy()
@@ -391,6 +457,49 @@ class TestIrregularlySampledSignalArrayMethods(unittest.TestCase):
         self.assertEqual(result.file_origin, 'testfile.txt')
         self.assertEqual(result.annotations, {'arg1': 'test'})
     
+    def test_time_slice_sorted_and_unsorted(self):
+        result = self.signal1.time_slice(15*pq.ms, 0.25*pq.s)
+        self.assertTrue(self.signal1._is_sorted())
+        assert_arrays_equal(result.magnitude.ravel(), self.data1[1:4])
+        assert_arrays_equal(result.times.magnitude, self.time1[1:4])
+        self.assertTrue(np.may_share_memory(result, self.signal1))
+
+        # from the first sample in the window to the first one after it
+        times = [1.0, 2.0, 5.0, 3.0, 4.0]*pq.s
+        signal = IrregularlySampledSignal(times, np.arange(5.0), units='mV')
+        result = signal.time_slice(1.5, 4.5)
+        self.assertFalse(signal._is_sorted())
+        assert_arrays_equal(result.times.magnitude, np.array([2.0]))
+        self.assertEqual(len(signal.time_slice(6.0, None)), 0)
+
+        # the check is done again when times is assigned
+        signal.times = [1.0, 2.0, 3.0, 4.0, 5.0]*pq.s
+        self.assertTrue(signal._is_sorted())
+        result = signal.time_slice(1.5, 4.5)
+        assert_arrays_equal(result.times.magnitude, np.array([2.0, 3.0, 4.0]))
+
+    def test_time_slice_no_sample_in_window(self):
+        # an empty signal, not the whole signal
+        for times in ([1.0, 2.0, 3.0], [3.0, 1.0, 2.0]):
+            signal = IrregularlySampledSignal(times*pq.s, [4.0, 5.0, 6.0],
+                                              units='mV')
+            for t_start, t_stop in [(1.2, 1.8), (4.0, None), (None, 0.5)]:
+                result = signal.time_slice(t_start, t_stop)
+                self.assertEqual(result.shape, (0, 1))
+                self.assertEqual(len(result.times), 0)
+
+    def test_time_slice_signal_in_place_changes(self):
+        signal = IrregularlySampledSignal([1.0, 2.0, 3.0]*pq.s,
+                                          [4.0, 5.0, 6.0], units='mV')
+        self.assertTrue(signal._is_sorted())
+        signal *= -1
+        self.assertIsNone(signal._sorted)
+        self.assertTrue(signal._is_sorted())
+        signal.times = signal.times[::-1]
+        self.assertIsNone(signal._sorted)
+        result = signal.time_slice(1.5, 3.5)
+        assert_arrays_equal(result.times.magnitude, np.array([3.0, 2.0]))
+
     def test_time_slice_out_of_boundries(self):
         targdataquant = self.data1quant
         targtimequant = self.time1quant
@@ -25,9 +25,11 @@ else:
 
 from neo.core.segment import Segment
 from neo.core import (AnalogSignal, Block,
-                      Epoch, ChannelIndex, SpikeTrain, Unit)
+                      Epoch, Event, ChannelIndex, IrregularlySampledSignal,
+                      SpikeTrain, Unit)
 from neo.core.container import filterdata
-from neo.test.tools import (assert_neo_object_is_compliant,
+from neo.test.tools import (assert_arrays_equal,
+                            assert_neo_object_is_compliant,
                             assert_same_sub_schema)
 from neo.test.generate_datasets import (fake_neo, get_fake_value,
                                         get_fake_values, get_annotations,
@@ -232,6 +234,94 @@ class TestSegment(unittest.TestCase):
             self.assertEqual(seg.t_start,targ_t_start)
             self.assertEqual(seg.t_stop,targ_t_stop)
 
+    def test_times_mixed_units(self):
+        seg = Segment()
+        self.assertIsNone(seg.t_start)
+        self.assertIsNone(seg.t_stop)
+
+        train1 = SpikeTrain([1, 2]*pq.s, t_start=500*pq.ms, t_stop=3*pq.s)
+        train2 = SpikeTrain([900, 1500]*pq.ms, t_start=800*pq.ms,
+                            t_stop=4000*pq.ms)
+        seg.spiketrains.extend([train1, train2])
+        self.assertIs(seg.t_start, train1.t_start)
+        self.assertIs(seg.t_stop, train2.t_stop)
+
+        # the bounds follow changes of the children
+        train1.t_stop = 5*pq.s
+        self.assertIs(seg.t_stop, train1.t_stop)
+        for t_stop in (7, 9, 3):
+            train1.t_stop = t_stop*pq.s
+            self.assertEqual(seg.t_stop, max(t_stop, 4)*pq.s)
+        train1.t_stop = 5*pq.s
+        seg.events.append(Event([0.1, 0.2]*pq.s,
+                                labels=np.array(['a', 'b'], dtype='S')))
+        self.assertEqual(seg.t_start, 0.1*pq.s)
+        seg.spiketrains.remove(train1)
+        self.assertEqual(seg.t_stop, 4*pq.s)
+
+    def test__time_slice(self):
+        seg = Segment(name='seg', index=3, foo='bar')
+        sig = AnalogSignal(np.arange(20.).reshape((10, 2)), units='mV',
+                           sampling_rate=1*pq.kHz, t_start=1*pq.ms)
+        train = SpikeTrain([1, 2, 3, 5, 8]*pq.ms, t_stop=10*pq.ms,
+                           waveforms=np.arange(5.).reshape((5, 1, 1))*pq.mV)
+        sorted_train = train.copy()
+        sorted_train.sort()
+        evt = Event([1, 4, 6]*pq.ms,
+                    labels=np.array(['a', 'b', 'c'], dtype='S'))
+        epc = Epoch([1, 4, 6]*pq.ms, durations=[1, 2, 3]*pq.ms,
+                    labels=np.array(['a', 'b', 'c'], dtype='S'))
+        irsig = IrregularlySampledSignal([1, 3, 4, 7]*pq.ms,
+                                         [1, 2, 3, 4]*pq.mV)
+        seg.analogsignals.append(sig)
+        seg.spiketrains.extend([train, sorted_train])
+        seg.events.append(evt)
+        seg.epochs.append(epc)
+        seg.irregularlysampledsignals.append(irsig)
+
+        t_start = 0.003*pq.s
+        t_stop = 6*pq.ms
+        result = seg.time_slice(t_start, t_stop)
+        self.assertEqual(result.name, 'seg')
+        self.assertEqual(result.index, 3)
+        self.assertEqual(result.annotations, {'foo': 'bar'})
+
+        targ = sig.time_slice(t_start, t_stop)
+        assert_arrays_equal(result.analogsignals[0].magnitude,
+                            targ.magnitude)
+        self.assertEqual(result.analogsignals[0].t_start, targ.t_start)
+        self.assertTrue(np.may_share_memory(result.analogsignals[0], sig))
+
+        for res, orig in zip(result.spiketrains, seg.spiketrains):
+            targ = orig.time_slice(t_start, t_stop)
+            assert_arrays_equal(res, targ)
+            assert_arrays_equal(res.waveforms, targ.waveforms)
+            self.assertEqual(res.t_start, targ.t_start)
+            self.assertEqual(res.t_stop, targ.t_stop)
+
+        assert_arrays_equal(result.events[0], [4, 6]*pq.ms)
+        assert_arrays_equal(result.events[0].labels,
+                            np.array(['b', 'c'], dtype='S'))
+        assert_arrays_equal(result.epochs[0], [4, 6]*pq.ms)
+        assert_arrays_equal(result.epochs[0].durations, [2, 3]*pq.ms)
+        assert_arrays_equal(result.irregularlysampledsignals[0].times,
+                            [3, 4]*pq.ms)
+
+        for child in result.data_children:
+            self.assertIs(child.segment, result)
+        self.assertIs(seg.analogsignals[0].segment, None)
+
+        # signals not overlapping the interval are empty
+        result = seg.time_slice(20*pq.ms, 30*pq.ms)
+        self.assertEqual(result.analogsignals[0].shape, (0, 2))
+        self.assertEqual(len(result.spiketrains[0]), 0)
+        self.assertEqual(len(result.irregularlysampledsignals[0]), 0)
+
+        result = seg.time_slice()
+        assert_arrays_equal(result.analogsignals[0].magnitude,
+                            sig.magnitude)
+        assert_arrays_equal(result.spiketrains[0], train)
+
     def test__merge(self):
         seg1a = fake_neo(Block, seed=self.seed1, n=self.nchildren).segments[0]
         assert_same_sub_schema(self.seg1, seg1a)
@@ -253,6 +253,24 @@ class TestConstructor(unittest.TestCase):
         self.assertEqual(train.t_start.dtype, dtype)
         self.assertEqual(train.t_start.dtype, train.times.t_start.dtype)
 
+    def test__from_trusted_array(self):
+        data = np.array([3., 4., 5.])
+        train = SpikeTrain.from_trusted_array(data, t_stop=10.0, units='ms',
+                                              t_start=0.001*pq.s,
+                                              name='n', arb='arbb')
+        self.result_spike_check(train, data*pq.ms, 1.0*pq.ms, 10.0*pq.ms,
+                                np.float64, pq.ms)
+        self.assertEqual(train.name, 'n')
+        self.assertEqual(train.annotations, {'arb': 'arbb'})
+        self.assertIsNone(train.segment)
+        self.assertIsNone(train.unit)
+        self.assertTrue(np.may_share_memory(train, data))
+
+        train = SpikeTrain.from_trusted_array(data*pq.s, t_stop=10.0)
+        self.assertEqual(train.units, pq.s)
+        self.assertRaises(ValueError, SpikeTrain.from_trusted_array,
+                          data, t_stop=10.0)
+
     def test__create_minimal(self):
         t_start = 0.0
         t_stop = 10.0
@@ -874,6 +892,20 @@ class TestSlice(unittest.TestCase):
         assert_arrays_equal(self.train1.waveforms[1:2], result.waveforms)
         assert_arrays_equal(targwaveforms, result.waveforms)
 
+    def test_slice_attributes_independent(self):
+        result = self.train1[1:2]
+        result.name = 'm'
+        result.t_stop = 20.0*pq.s
+        self.assertEqual(self.train1.name, 'n')
+        self.assertEqual(self.train1.t_stop, 10.0*pq.s)
+        self.assertEqual(result.units, self.train1.units)
+
+    def test_slice_other_attributes_not_copied(self):
+        self.train1.extra = 'o'
+        result = self.train1[1:2]
+        self.assertFalse(hasattr(result, 'extra'))
+        self.assertEqual(result.name, 'n')
+
     def test_slice_to_end(self):
         # slice spike train, keep sliced spike times
         result = self.train1[1:]
@@ -1144,6 +1176,63 @@ class TestTimeSlice(unittest.TestCase):
         self.assertEqual(self.train1.t_start, result.t_start)
         self.assertEqual(self.train1.t_stop, result.t_stop)
 
+    def test_time_slice_sorted(self):
+        self.train1.sort()
+        for t_start, t_stop in [(0.12 * pq.ms, 3.5 * pq.ms),
+                                (0.00012 * pq.s, 0.0035 * pq.s),
+                                (0.1 * pq.ms, 7.0 * pq.ms),
+                                (1 * pq.ms, None), (None, 1 * pq.ms),
+                                (None, None), (8 * pq.ms, 9 * pq.ms)]:
+            result = self.train1.time_slice(t_start, t_stop)
+            ind = np.ones(len(self.data1), dtype=bool)
+            if t_start is not None:
+                ind &= self.data1quant >= t_start
+            if t_stop is not None:
+                ind &= self.data1quant <= t_stop
+            assert_arrays_equal(self.data1quant[ind], result)
+            assert_arrays_equal(self.waveforms1[ind], result.waveforms)
+            assert_neo_object_is_compliant(result)
+            if len(result):
+                self.assertTrue(np.may_share_memory(result.waveforms,
+                                                    self.train1.waveforms))
+
+    def test_sorted_flag(self):
+        train = SpikeTrain([3, 1, 2] * pq.ms, t_stop=10.0)
+        self.assertFalse(train._sorted)
+        train.sort()
+        self.assertTrue(train._sorted)
+        self.assertTrue(train[1:]._sorted)
+        self.assertTrue(train[train > 1 * pq.ms]._sorted)
+        self.assertFalse(train[::-1]._sorted)
+        self.assertFalse(train[[2, 0]]._sorted)
+        train[0] = 5 * pq.ms
+        self.assertFalse(train._sorted)
+        result = train.time_slice(2 * pq.ms, 4 * pq.ms)
+        assert_arrays_equal([2, 3] * pq.ms, result)
+
+    def test_time_slice_in_place_changes(self):
+        train = SpikeTrain([1, 2, 3, 4], t_start=-10, t_stop=10, units='s')
+        train.sort()
+        self.assertTrue(train._sorted)
+
+        train *= -1
+        self.assertIsNone(train._sorted)
+        result = train.time_slice(-3.5 * pq.s, -1.5 * pq.s)
+        assert_arrays_equal([-2, -3] * pq.s, result)
+        self.assertFalse(train._sorted)
+
+        train.sort()
+        for change in [lambda: train.__iadd__(1 * pq.s),
+                       lambda: train.__isub__(1 * pq.s),
+                       lambda: train.fill(0),
+                       lambda: train.put([0], [1] * pq.s),
+                       lambda: train.itemset(0, 5)]:
+            train.time_slice(None, None)
+            self.assertIsNotNone(train._sorted)
+            change()
+            self.assertIsNone(train._sorted)
+
+
 class TestDuplicateWithNewData(unittest.TestCase):
     def setUp(self):
         self.waveforms = np.array([[[0., 1.],
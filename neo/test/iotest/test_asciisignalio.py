@@ -6,12 +6,19 @@ Tests of neo.io.asciisignalio
 # needed for python 3 compatibility
 from __future__ import absolute_import, division
 
+import os
+import tempfile
+
 try:
     import unittest2 as unittest
 except ImportError:
     import unittest
 
+import numpy as np
+import quantities as pq
+
 from neo.io import AsciiSignalIO
+from neo.io.tools import read_text_columns
 from neo.test.iotest.common_io_test import BaseTestIO
 
 
@@ -24,5 +31,70 @@ class TestAsciiSignalIO(BaseTestIO, unittest.TestCase, ):
     files_to_test = files_to_download
 
 
+class TestAsciiSignalIOFast(unittest.TestCase):
+    def setUp(self):
+        fd, self.filename = tempfile.mkstemp(suffix='.txt')
+        os.close(fd)
+        self.data = np.column_stack([np.arange(500) / 1000. + 1.,
+                                     np.random.randn(500, 3)])
+        np.savetxt(self.filename, self.data, delimiter=',', fmt='%.6f',
+                   header='time,a,b,c\n', comments='')
+
+    def tearDown(self):
+        os.remove(self.filename)
+
+    def test_read_text_columns(self):
+        expected = np.round(self.data, 6)
+        for parallel in (False, 3):
+            values = read_text_columns(self.filename, usecols=[2, 0],
+                                       skiprows=2, delimiter=',',
+                                       chunk_size=100, parallel=parallel)
+            np.testing.assert_array_equal(values, expected[:, [2, 0]])
+        values = read_text_columns(self.filename, skiprows=2,
+                                   delimiter=',', dtype='f', order='F')
+        self.assertEqual(values.dtype, np.float32)
+        self.assertTrue(values.flags['F_CONTIGUOUS'])
+        np.testing.assert_array_equal(values, expected.astype('f'))
+
+    def test_read_text_columns_blank_lines(self):
+        # ranges of the file may start with, or only hold, blank lines, and
+        # the last line may have no newline
+        cases = [(b'1\t2\t3\n4\t5\t6\n\n7\t8\t9', [[1, 2, 3], [4, 5, 6],
+                                                  [7, 8, 9]]),
+                 (b'1\n2\n\n\n\n\n3', [[1], [2], [3]]),
+                 (b'\n1 2\n\n\n3 4\n\n', [[1, 2], [3, 4]])]
+        for text, expected in cases:
+            with open(self.filename, 'wb') as f:
+                f.write(text)
+            for parallel in (False, 2, 3, 4, 8):
+                for chunk_size in (2, 100):
+                    values = read_text_columns(self.filename,
+                                               chunk_size=chunk_size,
+                                               parallel=parallel)
+                    np.testing.assert_array_equal(values, expected)
+
+    def test_fast_method(self):
+        io = AsciiSignalIO(filename=self.filename)
+        seg = io.read_segment(method='fast', delimiter=',', skiprows=2,
+                              timecolumn=0, usecols=[3, 1])
+        self.assertEqual([sig.name for sig in seg.analogsignals],
+                         ['Column 1', 'Column 3'])
+        sig = seg.analogsignals[1]
+        np.testing.assert_array_equal(sig.magnitude[:, 0],
+                                      np.round(self.data[:, 3], 6)
+                                      .astype('f'))
+        self.assertAlmostEqual(sig.t_start.rescale(pq.s).magnitude, 1.)
+        self.assertAlmostEqual(sig.sampling_rate.rescale(pq.Hz).magnitude,
+                               1000., places=1)
+
+        reference = io.read_segment(method='genfromtxt', delimiter=',',
+                                    skiprows=2, timecolumn=0)
+        seg = io.read_segment(method='fast', delimiter=',', skiprows=2,
+                              timecolumn=0)
+        for sig, sig_ref in zip(seg.analogsignals, reference.analogsignals):
+            np.testing.assert_array_equal(sig.magnitude, sig_ref.magnitude)
+            self.assertEqual(sig.sampling_rate, sig_ref.sampling_rate)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -6,11 +6,17 @@ Tests of neo.io.asciispiketrainio
 # needed for python 3 compatibility
 from __future__ import absolute_import, division
 
+import os
+import tempfile
+
 try:
     import unittest2 as unittest
 except ImportError:
     import unittest
 
+import numpy as np
+
+from neo.core import Segment, SpikeTrain
 from neo.io import AsciiSpikeTrainIO
 from neo.test.iotest.common_io_test import BaseTestIO
 
@@ -21,5 +27,24 @@ class TestAsciiSpikeTrainIO(BaseTestIO, unittest.TestCase, ):
     files_to_test = files_to_download
 
 
+class TestAsciiSpikeTrainIOReadWrite(unittest.TestCase):
+    def test_write_read(self):
+        fd, filename = tempfile.mkstemp(suffix='.txt')
+        os.close(fd)
+        self.addCleanup(os.remove, filename)
+        seg = Segment()
+        for n in (10, 1, 30):
+            seg.spiketrains.append(SpikeTrain(np.linspace(0.5, 8., n),
+                                              t_stop=10., units='s'))
+        io = AsciiSpikeTrainIO(filename=filename)
+        io.write_segment(seg)
+        result = io.read_segment()
+        self.assertEqual([len(st) for st in result.spiketrains], [10, 1, 30])
+        for st, st_result in zip(seg.spiketrains, result.spiketrains):
+            np.testing.assert_allclose(st_result.magnitude, st.magnitude,
+                                       rtol=1e-6)
+            self.assertEqual(st_result.t_stop, st_result.max())
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -6,15 +6,70 @@ Tests of neo.io.axonio
 # needed for python 3 compatibility
 from __future__ import absolute_import
 
+import os
+import shutil
+import struct
 import sys
+import tempfile
 
 try:
     import unittest2 as unittest
 except ImportError:
     import unittest
 
+import numpy as np
+import quantities as pq
+
 from neo.io import AxonIO
+from neo.io import axonio
+from neo.io.axonio import BLOCKSIZE
 from neo.test.iotest.common_io_test import BaseTestIO
+from neo.test.tools import assert_arrays_almost_equal
+
+
+def write_abf1(filename, data, offsets, sample_interval=50.):
+    """
+    Write a minimal episodic ABF1 file.
+
+    data is an int16 array of shape (episodes, samples, channels), offsets
+    gives the start of each episode in samples and sample_interval is the
+    interval between two samples of the sequence in us.
+    """
+    nb_episode, nb_sample, nb_channel = data.shape
+    header = bytearray(11 * BLOCKSIZE)
+
+    def put(offset, fmt, *values):
+        struct.pack_into('<' + fmt, header, offset, *values)
+
+    put(0, '4s', b'ABF ')
+    put(4, 'f', 1.83)
+    put(8, 'h', 5)  # fixed-length episodes
+    put(10, 'i', data.size)
+    put(16, 'i', nb_episode)
+    put(40, 'i', 12)  # data section block
+    put(92, 'i', 11)  # synch array block
+    put(96, 'i', nb_episode)
+    put(100, 'h', 0)  # int16
+    put(120, 'h', nb_channel)
+    put(122, 'f', sample_interval)
+    put(138, 'i', nb_sample * nb_channel)
+    put(244, 'f', 10.)
+    put(252, 'i', 32768)
+    put(378, '16h', *range(16))
+    put(410, '16h', *(list(range(nb_channel)) + [-1] * (16 - nb_channel)))
+    for i in range(nb_channel):
+        put(442 + 10 * i, '10s', ('ch%d' % i).encode('ascii'))
+        put(602 + 8 * i, '8s', b'mV')
+    for offset in (730, 922, 1050):  # gains
+        put(offset, '16f', *[1.] * 16)
+
+    synch = np.zeros(nb_episode, [('offset', '<i4'), ('len', '<i4')])
+    synch['offset'] = offsets
+    synch['len'] = nb_sample * nb_channel
+    with open(filename, 'wb') as f:
+        f.write(header)
+        f.write(synch.tostring().ljust(BLOCKSIZE, b'\x00'))
+        f.write(data.astype('<i2').tostring())
 
 
 class TestAxonIO(BaseTestIO, unittest.TestCase):
@@ -31,5 +86,132 @@ class TestAxonIO(BaseTestIO, unittest.TestCase):
     ioclass = AxonIO
 
 
+class TestAxonIOSynthetic(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmpdir, 'synthetic.abf')
+        np.random.seed(0)
+        self.data = np.random.randint(-2000, 2000,
+                                      size=(3, 100, 2)).astype('i2')
+        # 10 kHz, episodes at 0, 0.2 and 0.4 s
+        write_abf1(self.filename, self.data, [0, 2000, 4000])
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_read_block(self):
+        bl = AxonIO(filename=self.filename).read_block()
+        self.assertEqual(len(bl.segments), 3)
+        for j, seg in enumerate(bl.segments):
+            self.assertEqual(len(seg.analogsignals), 2)
+            for c, sig in enumerate(seg.analogsignals):
+                self.assertEqual(sig.name, 'ch%d' % c)
+                self.assertEqual(sig.sampling_rate, 10 * pq.kHz)
+                self.assertAlmostEqual(sig.t_start.rescale('s').magnitude,
+                                       0.2 * j)
+                assert_arrays_almost_equal(
+                    sig.rescale('mV').magnitude[:, 0],
+                    self.data[j, :, c] * 10. / 32768, 1e-6)
+
+    def test_selection(self):
+        io = AxonIO(filename=self.filename)
+        full = io.read_block()
+
+        bl = io.read_block(episodes=[2, 0], channels=[1])
+        self.assertEqual([seg.index for seg in bl.segments], [2, 0])
+        for seg in bl.segments:
+            self.assertEqual(len(seg.analogsignals), 1)
+            sig = seg.analogsignals[0]
+            ref = full.segments[seg.index].analogsignals[1]
+            self.assertEqual(sig.name, ref.name)
+            self.assertEqual(sig.t_start, ref.t_start)
+            assert_arrays_almost_equal(sig.magnitude, ref.magnitude, 1e-9)
+
+        # samples 11 to 50 of the last episode
+        bl = io.read_block(channels=[0], t_start=0.40105 * pq.s,
+                           t_stop=0.40505 * pq.s)
+        self.assertEqual([seg.index for seg in bl.segments], [2])
+        sig = bl.segments[0].analogsignals[0]
+        ref = full.segments[2].analogsignals[0]
+        self.assertAlmostEqual(sig.t_start.rescale('s').magnitude,
+                               ref.times[11].rescale('s').magnitude)
+        assert_arrays_almost_equal(sig.magnitude, ref.magnitude[11:51], 1e-9)
+
+        bl = io.read_block(lazy=True, episodes=[1], channels=[1, 0])
+        self.assertEqual([sig.name for sig in
+                          bl.segments[0].analogsignals], ['ch1', 'ch0'])
+        self.assertEqual(bl.segments[0].analogsignals[0].lazy_shape, 100)
+
+    def test_selection_errors(self):
+        io = AxonIO(filename=self.filename)
+        self.assertRaises(ValueError, io.read_block, episodes=[3])
+        self.assertRaises(ValueError, io.read_block, episodes=[-1])
+        self.assertRaises(ValueError, io.read_block, channels=[2])
+        self.assertRaises(ValueError, io.read_block, channels=[0, -1])
+
+    def cached_filenames(self):
+        return [key[0] for key in axonio._header_cache]
+
+    def test_header_cache(self):
+        header = AxonIO(filename=self.filename).read_header()
+        self.assertIs(AxonIO(filename=self.filename).read_header(), header)
+        self.assertIs(AxonIO(filename=self.filename).read_header(
+            metadata_only=True), header)
+        self.assertRaises(TypeError, header.__setitem__, 'nADCNumChannels', 1)
+
+        # a modified file is parsed again
+        write_abf1(self.filename, self.data, [0, 2000, 4000],
+                   sample_interval=25.)
+        mtime = os.path.getmtime(self.filename) + 10
+        os.utime(self.filename, (mtime, mtime))
+        header2 = AxonIO(filename=self.filename).read_header()
+        self.assertIsNot(header2, header)
+        self.assertEqual(header2['fADCSampleInterval'], 25.)
+        bl = AxonIO(filename=self.filename).read_block()
+        self.assertEqual(bl.segments[0].analogsignals[0].sampling_rate,
+                         20 * pq.kHz)
+
+    def test_header_cache_size(self):
+        filenames = [os.path.join(self.tmpdir, '%s.abf' % name)
+                     for name in 'abc']
+        for filename in filenames:
+            shutil.copy(self.filename, filename)
+        a, b, c = filenames
+
+        old_size = axonio._HEADER_CACHE_SIZE
+        axonio._HEADER_CACHE_SIZE = 2
+        try:
+            header = AxonIO(filename=a).read_header()
+            AxonIO(filename=b).read_header()
+            self.assertIs(AxonIO(filename=a).read_header(), header)
+            AxonIO(filename=c).read_header()
+            # b is the least recently used
+            self.assertEqual(self.cached_filenames(), [a, c])
+            self.assertIs(AxonIO(filename=a).read_header(), header)
+            AxonIO(filename=b).read_header()
+            self.assertEqual(self.cached_filenames(), [a, b])
+        finally:
+            axonio._HEADER_CACHE_SIZE = old_size
+
+    def test_header_metadata_only(self):
+        full = AxonIO(filename=self.filename)._parse_header()
+        header = AxonIO(filename=self.filename).read_header(
+            metadata_only=True)
+        self.assertEqual(self.cached_filenames()[-1], self.filename)
+        self.assertEqual(set(full) - set(header), set(['listTag']))
+        for key in header:
+            if isinstance(header[key], np.ndarray):
+                np.testing.assert_array_equal(header[key], full[key])
+            else:
+                self.assertEqual(header[key], full[key])
+
+        # the full header is parsed when needed, and then preferred
+        header2 = AxonIO(filename=self.filename).read_header()
+        self.assertIsNot(header2, header)
+        self.assertEqual(header2['listTag'], ())
+        self.assertIs(AxonIO(filename=self.filename).read_header(
+            metadata_only=True), header2)
+
+
 if __name__ == "__main__":
     unittest.main()
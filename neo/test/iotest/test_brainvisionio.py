@@ -6,11 +6,18 @@ Tests of neo.io.brainvisionio
 # needed for python 3 compatibility
 from __future__ import absolute_import, division
 
+import os
+import shutil
+import tempfile
+
 try:
     import unittest2 as unittest
 except ImportError:
     import unittest
 
+import numpy as np
+import quantities as pq
+
 from neo.io import BrainVisionIO
 
 from neo.test.iotest.common_io_test import BaseTestIO
@@ -42,5 +49,66 @@ class TestBrainVisionIO(BaseTestIO, unittest.TestCase, ):
                          ]
 
 
+class TestBrainVisionIOSynthetic(unittest.TestCase):
+    """
+    Compares the signals read from small generated files, with both data
+    orientations, with the values given by their resolution.
+    """
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        np.random.seed(0)
+        self.resolutions = [0.5, 0.1, 2.]
+        self.raw = np.random.randint(-30000, 30000, (500, 3)).astype('<i2')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def write(self, orientation):
+        filename = os.path.join(self.tmpdir, orientation)
+        header = ['[Common Infos]', 'DataFile=%s.eeg' % orientation,
+                  'MarkerFile=%s.vmrk' % orientation, 'DataFormat=BINARY',
+                  'DataOrientation=' + orientation, 'NumberOfChannels=3',
+                  'SamplingInterval=1000', '[Binary Infos]',
+                  'BinaryFormat=INT_16', '[Channel Infos]']
+        header += ['Ch%d=C%d,,%g,uV' % (c + 1, c, self.resolutions[c])
+                   for c in range(3)]
+        with open(filename + '.vhdr', 'w') as f:
+            f.write('\n'.join(header) + '\n')
+        with open(filename + '.vmrk', 'w') as f:
+            f.write('[Marker Infos]\nMk1=Stimulus,S1,10,1,0\n'
+                    'Mk2=Stimulus,S2,20,1,0\n')
+        if orientation == 'MULTIPLEXED':
+            self.raw.tofile(filename + '.eeg')
+        else:
+            self.raw.T.tofile(filename + '.eeg')
+        return filename + '.vhdr'
+
+    def test_read_segment(self):
+        for orientation in ['MULTIPLEXED', 'VECTORIZED']:
+            filename = self.write(orientation)
+            seg = BrainVisionIO(filename=filename).read_segment()
+            self.assertEqual(len(seg.analogsignals), 3)
+            for c, sig in enumerate(seg.analogsignals):
+                self.assertEqual(sig.name, 'C%d' % c)
+                self.assertEqual(sig.units, pq.uV)
+                self.assertEqual(sig.sampling_rate, 1000 * pq.Hz)
+                self.assertEqual(sig.shape, (500, 1))
+                np.testing.assert_allclose(
+                    sig.magnitude[:, 0],
+                    self.raw[:, c].astype('f') * self.resolutions[c],
+                    rtol=1e-6)
+
+            seg = BrainVisionIO(filename=filename).read_segment(lazy=True)
+            for c, sig in enumerate(seg.analogsignals):
+                self.assertEqual(sig.shape, (0, 1))
+                self.assertEqual(sig.lazy_shape, (500, 1))
+                part = sig.lazy_proxy.load(
+                    time_slice=(0.1 * pq.s, 0.3 * pq.s), channel_indexes=[0])
+                np.testing.assert_allclose(
+                    part.magnitude[:, 0],
+                    self.raw[100:300, c].astype('f') * self.resolutions[c],
+                    rtol=1e-6)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -6,13 +6,19 @@ Tests of neo.io.elanio
 # needed for python 3 compatibility
 from __future__ import absolute_import, division
 
+import os
+import shutil
 import sys
+import tempfile
 
 try:
     import unittest2 as unittest
 except ImportError:
     import unittest
 
+import numpy as np
+import quantities as pq
+
 from neo.io import ElanIO
 from neo.test.iotest.common_io_test import BaseTestIO
 
@@ -27,5 +33,63 @@ class TestElanIO(BaseTestIO, unittest.TestCase, ):
                          ]
 
 
+class TestElanIOSynthetic(unittest.TestCase):
+    """
+    Compares the signals read from a small generated file with the values
+    given by the conversion formula of Elan.
+    """
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmpdir, 'test.eeg')
+        np.random.seed(0)
+        # 3 channels, and the 2 event channels
+        self.min_physic = [-3200., -100., 0., -1., -1.]
+        self.max_physic = [3200., 100., 50., 1., 1.]
+        self.raw = np.random.randint(-32768, 32768,
+                                     (1000, 5)).astype('>i2')
+        lines = ['V2', 'info1', 'info2', '01-02-2003 04:05:06', '04:05:06',
+                 '-1', 'reserved', '-1', '0.001', '5']
+        lines += ['ch%d' % c for c in range(5)] + ['EEG'] * 5
+        lines += ['uV', 'uV', 'mV', 'bit', 'bit']
+        lines += ['%g' % v for v in self.min_physic + self.max_physic]
+        lines += ['-32768'] * 5 + ['32767'] * 5 + ['none'] * 5
+        with open(self.filename + '.ent', 'w') as f:
+            f.write('\n'.join(lines) + '\n')
+        with open(self.filename + '.pos', 'w') as f:
+            f.write('100 1 0\n500 2 0\n')
+        self.raw.tofile(self.filename)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def expected(self, c):
+        return ((self.raw[:, c].astype('f4') + 32768.) / 65535. *
+                (self.max_physic[c] - self.min_physic[c]) +
+                self.min_physic[c])
+
+    def test_read_segment(self):
+        seg = ElanIO(filename=self.filename).read_segment()
+        self.assertEqual(len(seg.analogsignals), 3)
+        for c, sig in enumerate(seg.analogsignals):
+            self.assertEqual(sig.name, 'ch%d' % c)
+            self.assertEqual(sig.units, [pq.uV, pq.uV, pq.mV][c])
+            self.assertEqual(sig.sampling_rate, 1000 * pq.Hz)
+            self.assertEqual(sig.shape, (1000, 1))
+            np.testing.assert_allclose(sig.magnitude[:, 0], self.expected(c),
+                                       rtol=1e-5, atol=1e-3)
+        np.testing.assert_array_equal(seg.events[0].times, [.1, .5] * pq.s)
+
+    def test_lazy(self):
+        seg = ElanIO(filename=self.filename).read_segment(lazy=True)
+        for c, sig in enumerate(seg.analogsignals):
+            self.assertEqual(sig.shape, (0, 1))
+            self.assertEqual(sig.lazy_shape, (1000, 1))
+            part = sig.lazy_proxy.load(time_slice=(0.1 * pq.s, 0.3 * pq.s),
+                                       channel_indexes=[0])
+            np.testing.assert_allclose(part.magnitude[:, 0],
+                                       self.expected(c)[100:300],
+                                       rtol=1e-5, atol=1e-3)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -8,7 +8,6 @@ from __future__ import absolute_import
 
 import glob
 import os.path
-import sys
 import tempfile
 
 try:
@@ -22,11 +21,9 @@ import quantities as pq
 import neo
 from neo.test.iotest.common_io_test import BaseTestIO
 from neo.test.tools import assert_arrays_almost_equal
-from neo.io.klustakwikio import KlustaKwikIO, HAVE_MLAB
+from neo.io.klustakwikio import KlustaKwikIO
 
 
-@unittest.skipUnless(HAVE_MLAB, "requires matplotlib")
-@unittest.skipIf(sys.version_info[0] > 2, "not Python 3 compatible")
 class testFilenameParser(unittest.TestCase):
     """Tests that filenames can be loaded with or without basename.
 
@@ -36,8 +33,8 @@ class testFilenameParser(unittest.TestCase):
         self.dirname = os.path.join(tempfile.gettempdir(),
                                     'files_for_testing_neo',
                                     'klustakwik/test1')
-        if not os.path.exists(self.dirname):
-            raise unittest.SkipTest('data directory does not exist: ' +
+        if not os.path.exists(os.path.join(self.dirname, 'basename.fet.0')):
+            raise unittest.SkipTest('data files do not exist: ' +
                                     self.dirname)
 
     def test1(self):
@@ -82,16 +79,14 @@ class testFilenameParser(unittest.TestCase):
                                                       'basename2.clu.1')))
 
 
-@unittest.skipUnless(HAVE_MLAB, "requires matplotlib")
-@unittest.skipIf(sys.version_info[0] > 2, "not Python 3 compatible")
 class testRead(unittest.TestCase):
     """Tests that data can be read from KlustaKwik files"""
     def setUp(self):
         self.dirname = os.path.join(tempfile.gettempdir(),
                                     'files_for_testing_neo',
                                     'klustakwik/test2')
-        if not os.path.exists(self.dirname):
-            raise unittest.SkipTest('data directory does not exist: ' +
+        if not os.path.exists(os.path.join(self.dirname, 'base.fet.0')):
+            raise unittest.SkipTest('data files do not exist: ' +
                                     self.dirname)
 
     def test1(self):
@@ -147,8 +142,6 @@ class testRead(unittest.TestCase):
                                                                      0.228])))
 
 
-@unittest.skipUnless(HAVE_MLAB, "requires matplotlib")
-@unittest.skipIf(sys.version_info[0] > 2, "not Python 3 compatible")
 class testWrite(unittest.TestCase):
     def setUp(self):
         self.dirname = os.path.join(tempfile.gettempdir(),
@@ -204,7 +197,7 @@ class testWrite(unittest.TestCase):
         segment.spiketrains.append(st4)
 
         # Create empty directory for writing
-        delete_test_session()
+        delete_test_session(self.dirname)
 
         # Create writer with default sampling rate
         kio = KlustaKwikIO(filename=os.path.join(self.dirname, 'base1'),
@@ -218,41 +211,39 @@ class testWrite(unittest.TestCase):
 
         # Check files contain correct content
         # Spike times on group 0
-        data = file(os.path.join(self.dirname, 'base1.fet.0')).readlines()
+        data = open(os.path.join(self.dirname, 'base1.fet.0')).readlines()
         data = [int(d) for d in data]
         self.assertEqual(data, [0, 2, 4, 6, 1, 3, 11, 106])
 
         # Clusters on group 0
-        data = file(os.path.join(self.dirname, 'base1.clu.0')).readlines()
+        data = open(os.path.join(self.dirname, 'base1.clu.0')).readlines()
         data = [int(d) for d in data]
         self.assertEqual(data, [2, 0, 0, 0, 1, 1, 1, 0])
 
         # Spike times on group 1
-        data = file(os.path.join(self.dirname, 'base1.fet.1')).readlines()
+        data = open(os.path.join(self.dirname, 'base1.fet.1')).readlines()
         data = [int(d) for d in data]
         self.assertEqual(data, [0, 50, 90, 100])
 
         # Clusters on group 1
-        data = file(os.path.join(self.dirname, 'base1.clu.1')).readlines()
+        data = open(os.path.join(self.dirname, 'base1.clu.1')).readlines()
         data = [int(d) for d in data]
         self.assertEqual(data, [1, -1, -1, -1])
 
         # Spike times on group 2
-        data = file(os.path.join(self.dirname, 'base1.fet.2')).readlines()
+        data = open(os.path.join(self.dirname, 'base1.fet.2')).readlines()
         data = [int(d) for d in data]
         self.assertEqual(data, [0, 5, 9])
 
         # Clusters on group 2
-        data = file(os.path.join(self.dirname, 'base1.clu.2')).readlines()
+        data = open(os.path.join(self.dirname, 'base1.clu.2')).readlines()
         data = [int(d) for d in data]
         self.assertEqual(data, [1, 0, 0])
 
         # Empty out test session again
-        delete_test_session()
+        delete_test_session(self.dirname)
 
 
-@unittest.skipUnless(HAVE_MLAB, "requires matplotlib")
-@unittest.skipIf(sys.version_info[0] > 2, "not Python 3 compatible")
 class testWriteWithFeatures(unittest.TestCase):
     def setUp(self):
         self.dirname = os.path.join(tempfile.gettempdir(),
@@ -305,7 +296,7 @@ class testWriteWithFeatures(unittest.TestCase):
                                                         'base2' + fn)))
 
         # Check files contain correct content
-        fi = file(os.path.join(self.dirname, 'base2.fet.0'))
+        fi = open(os.path.join(self.dirname, 'base2.fet.0'))
 
         # first line is nbFeatures
         self.assertEqual(fi.readline(), '2\n')
@@ -322,7 +313,7 @@ class testWriteWithFeatures(unittest.TestCase):
         assert_arrays_almost_equal(wff, np.array(new_wff), .00001)
 
         # Clusters on group 0
-        data = file(os.path.join(self.dirname, 'base2.clu.0')).readlines()
+        data = open(os.path.join(self.dirname, 'base2.clu.0')).readlines()
         data = [int(d) for d in data]
         self.assertEqual(data, [1, 0, 0, 0])
 
@@ -336,8 +327,115 @@ class testWriteWithFeatures(unittest.TestCase):
         delete_test_session(self.dirname)
 
 
-@unittest.skipUnless(HAVE_MLAB, "requires matplotlib")
-@unittest.skipIf(sys.version_info[0] > 2, "not Python 3 compatible")
+class testReadFeatures(unittest.TestCase):
+    """Tests that each SpikeTrain gets only the features of its spikes"""
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+        with open(os.path.join(self.dirname, 'base.fet.0'), 'w') as f:
+            f.write('2\n1 2 100\n3.5 4 200\n5 6 305\n7 8 400\n')
+        with open(os.path.join(self.dirname, 'base.clu.0'), 'w') as f:
+            f.write('2\n2\n1\n2\n1\n')
+
+    def tearDown(self):
+        delete_test_session(self.dirname)
+        os.rmdir(self.dirname)
+
+    def test1(self):
+        kio = KlustaKwikIO(filename=os.path.join(self.dirname, 'base'),
+                           sampling_rate=1000.)
+        block = kio.read_block()
+        seg = block.segments[0]
+        self.assertEqual(len(seg.spiketrains), 2)
+        st1, st2 = seg.spiketrains
+
+        self.assertEqual(st1.annotations['cluster'], 1)
+        assert_arrays_almost_equal(st1.magnitude, np.array([.2, .4]), 1e-12)
+        assert_arrays_almost_equal(st1.annotations['waveform_features'],
+                                   np.array([[3.5, 4], [7, 8]]), 1e-12)
+        self.assertEqual(st2.annotations['cluster'], 2)
+        assert_arrays_almost_equal(st2.magnitude, np.array([.1, .305]),
+                                   1e-12)
+        assert_arrays_almost_equal(st2.annotations['waveform_features'],
+                                   np.array([[1, 2], [5, 6]]), 1e-12)
+        for st in seg.spiketrains:
+            self.assertEqual(st.t_stop, 0.4*pq.s)
+            self.assertTrue(st._sorted)
+
+        # the features are views into one array, not copies of all of them
+        self.assertIsNotNone(st1.annotations['waveform_features'].base)
+        self.assertIs(st1.annotations['waveform_features'].base,
+                      st2.annotations['waveform_features'].base)
+
+    def test_bad_value(self):
+        with open(os.path.join(self.dirname, 'base.fet.0'), 'w') as f:
+            f.write('2\n1 2 100\n3 x 200\n')
+        kio = KlustaKwikIO(filename=os.path.join(self.dirname, 'base'))
+        self.assertRaises(ValueError, kio.read_block)
+
+
+class testWriteBuffered(unittest.TestCase):
+    """Tests the files written by chunks, serially and in parallel"""
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+        self.block = neo.Block()
+        segment = neo.Segment()
+        segment2 = neo.Segment()
+        self.block.segments.append(segment)
+        self.block.segments.append(segment2)
+
+        st1 = neo.SpikeTrain(times=[.002, .004, .006], units='s', t_stop=1.,
+                             cluster=0, group=0,
+                             waveform_features=np.array([[11.3, 0.2],
+                                                         [-0.3, 12.3],
+                                                         [3.0, -2.5]]))
+        segment.spiketrains.append(st1)
+        st1B = neo.SpikeTrain(times=[.106], units='s', t_stop=1., cluster=1,
+                              waveform_features=np.array([[1.5, 2.0]]))
+        segment2.spiketrains.append(st1B)
+        st2 = neo.SpikeTrain(times=[.05, .09], units='s', t_stop=1.,
+                             cluster=-1, group=1,
+                             waveform_features=np.array([[1, 2, 3],
+                                                         [4, 5, 6]]))
+        segment.spiketrains.append(st2)
+
+    def tearDown(self):
+        delete_test_session(self.dirname)
+        os.rmdir(self.dirname)
+
+    def read(self, filename):
+        with open(os.path.join(self.dirname, filename)) as f:
+            return f.read()
+
+    def check_files(self):
+        self.assertEqual(self.read('base.fet.0'),
+                         '2\n11.3 0.2 2\n-0.3 12.3 4\n3.0 -2.5 6\n'
+                         '1.5 2.0 106\n')
+        self.assertEqual(self.read('base.clu.0'), '2\n0\n0\n0\n1\n')
+        self.assertEqual(self.read('base.fet.1'),
+                         '3\n1 2 3 50\n4 5 6 90\n')
+        self.assertEqual(self.read('base.clu.1'), '1\n-1\n-1\n')
+
+    def test_write(self):
+        kio = KlustaKwikIO(filename=os.path.join(self.dirname, 'base'),
+                           sampling_rate=1000.)
+        kio.write_block(self.block)
+        self.check_files()
+
+        block = kio.read_block()
+        trains = block.segments[0].spiketrains
+        self.assertEqual(len(trains), 3)
+        assert_arrays_almost_equal(trains[1].magnitude, np.array([.106]),
+                                   1e-12)
+        assert_arrays_almost_equal(trains[1].annotations['waveform_features'],
+                                   np.array([[1.5, 2.0]]), 1e-12)
+
+    def test_write_parallel(self):
+        kio = KlustaKwikIO(filename=os.path.join(self.dirname, 'base'),
+                           sampling_rate=1000.)
+        kio.write_block(self.block, parallel=True)
+        self.check_files()
+
+
 class CommonTests(BaseTestIO, unittest.TestCase):
     ioclass = KlustaKwikIO
 
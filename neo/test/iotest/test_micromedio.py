@@ -6,13 +6,20 @@ Tests of neo.io.neomatlabio
 # needed for python 3 compatibility
 from __future__ import absolute_import, division
 
+import os
+import shutil
+import struct
 import sys
+import tempfile
 
 try:
     import unittest2 as unittest
 except ImportError:
     import unittest
 
+import numpy as np
+import quantities as pq
+
 from neo.io import MicromedIO
 from neo.test.iotest.common_io_test import BaseTestIO
 
@@ -24,5 +31,86 @@ class TestMicromedIO(BaseTestIO, unittest.TestCase, ):
     files_to_download = files_to_test
 
 
+@unittest.skipIf(sys.version_info[0] > 2, "not Python 3 compatible")
+class TestMicromedIOSynthetic(unittest.TestCase):
+    """
+    Compares the signals read from a small generated file with the values
+    given by the conversion formula of Micromed.
+    """
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmpdir, 'test.TRC')
+        np.random.seed(0)
+        # logical min, max and ground, physical min and max of the channels
+        self.ranges = [(0, 65535, 32768, -3200, 3200),
+                       (0, 4095, 2048, -100, 100)]
+        self.raw = np.random.randint(0, 4096, (1000, 2)).astype('<u2')
+
+        header = bytearray(4096)
+
+        def put(offset, fmt, *values):
+            struct.pack_into('<' + fmt, header, offset, *values)
+
+        put(64, '22s20s', b'Doe', b'John')
+        put(128, '6b', 1, 2, 103, 4, 5, 6)
+        # data offset, channels, multiplexer, minimum rate, bytes
+        put(138, 'IHHHH', 4096, 2, 0, 256, 2)
+        put(175, 'b', 4)
+        zones = {'ORDER': (512, 4), 'LABCOD': (1024, 256),
+                 'NOTE': (2048, 44), 'EVENT A': (2112, 12),
+                 'EVENT B': (2128, 12), 'TRIGGER': (2144, 12)}
+        for i, name in enumerate(['ORDER', 'LABCOD', 'NOTE', 'FLAGS',
+                                  'TRONCA', 'IMPED_B', 'IMPED_E', 'MONTAGE',
+                                  'COMPRESS', 'AVERAGE', 'HISTORY', 'DVIDEO',
+                                  'EVENT A', 'EVENT B', 'TRIGGER']):
+            put(176 + 16 * i, '8sII', name.encode('ascii'),
+                *zones.get(name, (0, 0)))
+        put(512, '2H', 1, 0)
+        for code, (label, unit) in enumerate([(b'Fp2', 1), (b'Fp1', 0)]):
+            put(1024 + code * 128 + 2, '6s6s', label, b'G2')
+            put(1024 + code * 128 + 14, '5i', *self.ranges[1 - code])
+            put(1024 + code * 128 + 34, 'h', unit)
+            put(1024 + code * 128 + 44, 'H', 2)
+        put(2048, 'I40s', 300, b'note')
+        put(2112, '3I', 1, 100, 200)
+        put(2144, 'IHIH', 10, 1, 20, 2)
+        with open(self.filename, 'wb') as f:
+            f.write(header)
+            f.write(self.raw.tostring())
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def expected(self, c):
+        lmin, lmax, ground, pmin, pmax = self.ranges[c]
+        return ((self.raw[:, c].astype('f') - ground) *
+                float(pmax - pmin) / float(lmax - lmin + 1))
+
+    def test_read_segment(self):
+        seg = MicromedIO(filename=self.filename).read_segment()
+        self.assertEqual(len(seg.analogsignals), 2)
+        for c, sig in enumerate(seg.analogsignals):
+            self.assertEqual(sig.name, ['Fp1', 'Fp2'][c])
+            self.assertEqual(sig.units, [pq.uV, pq.mV][c])
+            self.assertEqual(sig.sampling_rate, 512 * pq.Hz)
+            self.assertEqual(sig.shape, (1000, 1))
+            np.testing.assert_allclose(sig.magnitude[:, 0], self.expected(c),
+                                       rtol=1e-5, atol=1e-4)
+        np.testing.assert_allclose(seg.events[0].times.magnitude,
+                                   [10. / 512, 20. / 512])
+
+    def test_lazy(self):
+        seg = MicromedIO(filename=self.filename).read_segment(lazy=True)
+        for c, sig in enumerate(seg.analogsignals):
+            self.assertEqual(sig.shape, (0, 1))
+            self.assertEqual(sig.lazy_shape, (1000, 1))
+            part = sig.lazy_proxy.load(
+                time_slice=(128. / 512 * pq.s, 384. / 512 * pq.s),
+                channel_indexes=[0])
+            np.testing.assert_allclose(part.magnitude[:, 0],
+                                       self.expected(c)[128:384],
+                                       rtol=1e-5, atol=1e-4)
+
+
 if __name__ == "__main__":
     unittest.main()
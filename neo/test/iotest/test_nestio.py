@@ -5,6 +5,9 @@ Tests of neo.io.exampleio
 
 # needed for python 3 compatibility
 from __future__ import absolute_import, division
+import os
+import shutil
+import tempfile
 import warnings
 
 try:
@@ -15,7 +18,7 @@ except ImportError:
 import quantities as pq
 import numpy as np
 
-from neo.io.nestio import ColumnIO
+from neo.io.nestio import ColumnCache, ColumnIO
 from neo.io.nestio import NestIO
 from neo.test.iotest.common_io_test import BaseTestIO
 from neo.test.iotest.tools import get_test_file_full_path
@@ -807,5 +810,145 @@ class TestColumnIO(BaseTestIO, unittest.TestCase):
         assert all(np.diff(result[:, 0]) >= 0)
 
 
+class TestColumnIOChunks(unittest.TestCase):
+    """
+    Tests that reading by small chunks gives the same result as reading the
+    whole file, without the need of test data.
+    """
+    def setUp(self):
+        np.random.seed(0)
+        times = np.sort(np.random.randint(0, 10000, 1000)) / 10.
+        gids = np.random.randint(1, 20, 1000)
+        self.table = np.column_stack([gids, times])
+        fd, self.filename = tempfile.mkstemp(suffix='.gdf')
+        os.close(fd)
+        np.savetxt(self.filename, self.table, fmt=['%d', '%.1f'])
+        self.testIO = ColumnIO(filename=self.filename, chunk_size=100)
+
+    def tearDown(self):
+        os.remove(self.filename)
+
+    def test_data(self):
+        self.assertEqual(self.testIO.n_columns, 2)
+        np.testing.assert_array_equal(self.testIO.data, self.table)
+
+    def test_condition_and_sorting(self):
+        result = self.testIO.get_columns(
+            condition=lambda x: np.in1d(x, [3, 5]), condition_column=0,
+            sorting_columns=[1, 0])
+        mask = np.in1d(self.table[:, 0], [3, 5])
+        expected = self.table[mask]
+        expected = expected[np.lexsort((expected[:, 1], expected[:, 0]))]
+        np.testing.assert_array_equal(result, expected)
+
+        # conditions on single values are vectorized
+        result = self.testIO.get_columns(
+            condition=lambda x: x in [3, 5], condition_column=0,
+            sorting_columns=[1, 0])
+        np.testing.assert_array_equal(result, expected)
+
+    def test_row_filter(self):
+        result = self.testIO.get_columns(
+            column_ids=[1], row_filter=lambda chunk: chunk[:, 1] < 50.)
+        expected = self.table[self.table[:, 1] < 50., 1:]
+        np.testing.assert_array_equal(result, expected)
+
+    def test_read_spiketrains(self):
+        io = NestIO(filenames=self.filename)
+        seg = io.read_segment(gid_list=[], t_start=20.*pq.ms,
+                              t_stop=800.*pq.ms)
+        gids = np.unique(self.table[:, 0])
+        self.assertEqual(len(seg.spiketrains), len(gids))
+        for st in seg.spiketrains:
+            rows = ((self.table[:, 0] == st.annotations['id']) &
+                    (self.table[:, 1] >= 20.) & (self.table[:, 1] < 800.))
+            np.testing.assert_array_equal(st.magnitude, self.table[rows, 1])
+
+    def test_cache(self):
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        expected = NestIO(filenames=self.filename).read_segment(
+            gid_list=[2, 3, 42], t_start=20. * pq.ms, t_stop=800. * pq.ms)
+        for i in range(2):
+            io = NestIO(filenames=self.filename, cache=cache_dir)
+            seg = io.read_segment(gid_list=[2, 3, 42], t_start=20. * pq.ms,
+                                  t_stop=800. * pq.ms)
+            self.assertEqual(len(seg.spiketrains), 3)
+            for st, st_expected in zip(seg.spiketrains,
+                                       expected.spiketrains):
+                self.assertEqual(st.annotations['id'],
+                                 st_expected.annotations['id'])
+                np.testing.assert_array_equal(st.magnitude,
+                                              st_expected.magnitude)
+        cache = io.avail_IOs['gdf'].get_cache(0, 1, cache_dir)
+        self.assertTrue(os.path.isdir(cache.path))
+        self.assertIsInstance(cache.columns[1], np.memmap)
+
+        # the cache is updated when the file changes
+        np.savetxt(self.filename, self.table[:10], fmt=['%d', '%.1f'])
+        io = NestIO(filenames=self.filename, cache=cache_dir)
+        seg = io.read_segment(gid_list=[], t_start=0. * pq.ms,
+                              t_stop=1000. * pq.ms)
+        self.assertEqual(sum(len(st) for st in seg.spiketrains), 10)
+
+    def test_cache_merge(self):
+        # many rows with the same key and sort values, numbered by the
+        # last column
+        table = np.column_stack([np.random.randint(1, 6, 1000),
+                                 np.random.randint(0, 20, 1000) / 2.,
+                                 np.arange(1000)])
+        np.savetxt(self.filename, table, fmt=['%d', '%.1f', '%d'])
+        expected = table[np.lexsort((table[:, 1], table[:, 0]))]
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        for chunk_size in [100, 2000, 10 ** 6]:
+            io = ColumnIO(filename=self.filename, chunk_size=chunk_size)
+            cache = ColumnCache(io, 0, 1, cache_dir)
+            for i in range(3):
+                np.testing.assert_array_equal(cache.columns[i],
+                                              expected[:, i])
+            np.testing.assert_array_equal(cache.keys, np.arange(1, 6))
+            np.testing.assert_array_equal(
+                cache.offsets, np.searchsorted(expected[:, 0],
+                                               np.arange(1, 7)))
+            self.assertEqual(sorted(os.listdir(cache.path)),
+                             ['column_0.npy', 'column_1.npy',
+                              'column_2.npy', 'keys.npy', 'offsets.npy',
+                              'source.json'])
+            os.remove(os.path.join(cache.path, 'source.json'))
+
+        open(self.filename, 'w').close()
+        cache = ColumnCache(ColumnIO(filename=self.filename), 0, 1, cache_dir)
+        self.assertEqual(len(cache.keys), 0)
+        self.assertEqual(cache.get_columns([0, 1], keys=[1]).shape, (0, 2))
+
+    def test_comments(self):
+        with open(self.filename, 'w') as f:
+            f.write('# gid time\n\n')
+            for i, row in enumerate(self.table):
+                f.write('%d %.1f%s\n' % (row[0], row[1],
+                                          ' # spike' if i % 7 == 0 else ''))
+                if i % 11 == 0:
+                    f.write('# comment line\n')
+        io = ColumnIO(filename=self.filename, chunk_size=100)
+        self.assertEqual(io.n_columns, 2)
+        self.assertEqual(io.dtype, np.float64)
+        np.testing.assert_array_equal(io.data, self.table)
+
+    def test_integers(self):
+        table = self.table[:, 0].astype(int)
+        np.savetxt(self.filename, table, fmt='%d')
+        io = ColumnIO(filename=self.filename, chunk_size=100)
+        self.assertEqual(io.dtype, np.int32)
+        np.testing.assert_array_equal(io.data[:, 0], table)
+
+        # a float after the first chunk is not truncated
+        with open(self.filename, 'a') as f:
+            f.write('2.5\n')
+        io = ColumnIO(filename=self.filename, chunk_size=100)
+        self.assertRaises(ValueError, io.get_columns)
+        self.assertRaises(ValueError, lambda: io.data)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of neo.io.pickleio
+"""
+
+# needed for python 3 compatibility
+from __future__ import absolute_import, division
+
+import os
+import shutil
+import tempfile
+import warnings
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+import numpy as np
+
+from neo.core import Block
+from neo.io.pickleio import PickleIO
+from neo.test.generate_datasets import fake_neo
+from neo.test.tools import assert_same_sub_schema
+
+
+class TestPickleIO(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.block = fake_neo(Block, seed=0, n=2)
+        self.block.create_relationship()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_file(self):
+        filename = os.path.join(self.tmpdir, 'block.pkl')
+        PickleIO(filename=filename).write_block(self.block)
+        block = PickleIO(filename=filename).read_block()
+        assert_same_sub_schema(self.block, block)
+
+    def test_directory(self):
+        filename = os.path.join(self.tmpdir, 'checkpoint')
+        PickleIO(filename=filename, directory=True,
+                 min_size=8).write_block(self.block)
+        names = os.listdir(filename)
+        self.assertTrue(set(['block.pkl', 'segment_0',
+                             'segment_1']).issubset(names))
+        self.assertIn('array_0.npy', os.listdir(os.path.join(filename,
+                                                             'segment_0')))
+
+        block = PickleIO(filename=filename).read_block()
+        assert_same_sub_schema(self.block, block)
+        sig = block.segments[0].analogsignals[0]
+        base = sig
+        while not isinstance(base, np.memmap):
+            base = base.base
+        self.assertIs(sig.segment, block.segments[0])
+        self.assertIs(block.segments[1].block, block)
+        for chx in block.channel_indexes:
+            self.assertIs(chx.block, block)
+            for sig in chx.analogsignals:
+                self.assertIs(sig.channel_index, chx)
+                self.assertTrue(any(sig is other for other in
+                                    sig.segment.analogsignals))
+
+        # the arrays can be modified without modifying the files
+        sig *= 2
+        block2 = PickleIO(filename=filename).read_block()
+        assert_same_sub_schema(self.block, block2)
+
+        seg = PickleIO(filename=filename).read_segment(index=1)
+        assert_same_sub_schema(self.block.segments[1], seg)
+        self.assertIsNone(seg.block)
+        self.assertIsNone(seg.spiketrains[0].unit)
+
+        # overwrite a directory
+        self.block.segments.pop()
+        PickleIO(filename=filename, directory=True).write_block(self.block)
+        self.assertEqual(sorted(os.listdir(filename)),
+                         ['block.pkl', 'segment_0'])
+        self.assertEqual(os.listdir(os.path.join(filename, 'segment_0')),
+                         ['segment.pkl'])
+        assert_same_sub_schema(self.block,
+                               PickleIO(filename=filename).read_block())
+        self.assertEqual(sorted(os.listdir(self.tmpdir)), ['checkpoint'])
+
+        self.assertRaises(IOError, PickleIO(filename=self.tmpdir,
+                                            directory=True).write_block,
+                          self.block)
+
+    def test_directory_mode(self):
+        filename = os.path.join(self.tmpdir, 'checkpoint')
+        os.mkdir(os.path.join(self.tmpdir, 'reference'))
+        PickleIO(filename=filename, directory=True).write_block(self.block)
+        mode = os.stat(filename).st_mode & 0o777
+        self.assertEqual(mode, os.stat(os.path.join(self.tmpdir,
+                                                    'reference')).st_mode &
+                         0o777)
+
+    def test_directory_failed_write(self):
+        filename = os.path.join(self.tmpdir, 'checkpoint')
+        self.block.segments[0].annotations['func'] = lambda x: x
+        self.assertRaises(Exception, PickleIO(filename=filename,
+                                              directory=True).write_block,
+                          self.block)
+        self.assertEqual(os.listdir(self.tmpdir), [])
+
+    def test_directory_cleanup_warning(self):
+        filename = os.path.join(self.tmpdir, 'checkpoint')
+        io = PickleIO(filename=filename, directory=True)
+        io.write_block(self.block)
+
+        def rmtree(path, *args, **kwargs):
+            raise OSError('busy')
+
+        old_rmtree = shutil.rmtree
+        shutil.rmtree = rmtree
+        try:
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter('always')
+                io.write_block(self.block)
+        finally:
+            shutil.rmtree = old_rmtree
+        self.assertEqual(len(caught), 1)
+        self.assertIn(self.tmpdir, str(caught[0].message))
+        assert_same_sub_schema(self.block,
+                               PickleIO(filename=filename).read_block())
+
+
+if __name__ == "__main__":
+    unittest.main()
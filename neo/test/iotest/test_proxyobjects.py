@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of neo.io.proxyobjects
+"""
+
+# needed for python 3 compatibility
+from __future__ import absolute_import, division
+
+import os
+import tempfile
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+import numpy as np
+import quantities as pq
+
+from neo.core import AnalogSignal
+from neo.io.proxyobjects import AnalogSignalProxy, memmap_signals
+
+
+class TestAnalogSignalProxy(unittest.TestCase):
+    def setUp(self):
+        self.data = np.arange(-500, 500, dtype='int16').reshape(-1, 4)
+        fd, self.filename = tempfile.mkstemp(suffix='.dat')
+        os.close(fd)
+        self.data.tofile(self.filename)
+        raw = np.memmap(self.filename, dtype='int16', mode='r')
+        self.gain = np.array([1., 0.5, 2., 0.25])
+        self.offset = np.array([0., 1., -1., 0.])
+        self.proxy = AnalogSignalProxy(raw.reshape(-1, 4), units='uV',
+                                       sampling_rate=1 * pq.kHz,
+                                       gain=self.gain, offset=self.offset,
+                                       t_start=1 * pq.s, name='raw',
+                                       file_origin=self.filename,
+                                       channel_group=3)
+        self.expected = self.data * self.gain + self.offset
+
+    def tearDown(self):
+        del self.proxy
+        os.remove(self.filename)
+
+    def test_attributes(self):
+        self.assertEqual(self.proxy.shape, (250, 4))
+        self.assertEqual(len(self.proxy), 250)
+        self.assertEqual(self.proxy.t_stop, 1.25 * pq.s)
+
+    def test_load(self):
+        sig = self.proxy.load()
+        self.assertIsInstance(sig, AnalogSignal)
+        np.testing.assert_array_equal(sig.magnitude, self.expected)
+        self.assertEqual(sig.units, pq.uV)
+        self.assertEqual(sig.t_start, 1 * pq.s)
+        self.assertEqual(sig.sampling_rate, 1 * pq.kHz)
+        self.assertEqual(sig.name, 'raw')
+        self.assertEqual(sig.annotations, {'channel_group': 3})
+
+        # the file is not modified
+        np.testing.assert_array_equal(np.fromfile(self.filename, 'int16'),
+                                      self.data.ravel())
+
+    def test_lazy_signal(self):
+        sig = self.proxy.lazy_signal()
+        self.assertIsInstance(sig, AnalogSignal)
+        self.assertEqual(sig.size, 0)
+        self.assertEqual(sig.lazy_shape, (250, 4))
+        self.assertIs(sig.lazy_proxy, self.proxy)
+        self.assertEqual(sig.units, pq.uV)
+        self.assertEqual(sig.t_start, 1 * pq.s)
+        self.assertEqual(sig.sampling_rate, 1 * pq.kHz)
+        self.assertEqual(sig.name, 'raw')
+        self.assertEqual(sig.annotations, {'channel_group': 3})
+
+    def test_load_part(self):
+        sig = self.proxy.load(time_slice=(1010 * pq.ms, 1.1 * pq.s),
+                              channel_indexes=[3, 1])
+        np.testing.assert_array_equal(sig.magnitude,
+                                      self.expected[10:100, [3, 1]])
+        self.assertEqual(sig.t_start, 1.01 * pq.s)
+
+        sig = self.proxy.time_slice(None, 1.2 * pq.s)
+        np.testing.assert_array_equal(sig.magnitude, self.expected[:200])
+
+        self.assertRaises(ValueError, self.proxy.time_slice,
+                          0.5 * pq.s, 1.2 * pq.s)
+
+    def test_from_file(self):
+        proxy = AnalogSignalProxy.from_file(self.filename, '<i2', 5,
+                                            units='uV',
+                                            sampling_rate=1 * pq.kHz,
+                                            bytes_offset=2)
+        self.assertEqual(proxy.shape, (199, 5))
+        np.testing.assert_array_equal(proxy.load().magnitude,
+                                      self.data.ravel()[1:996].reshape(-1, 5))
+
+        proxy = AnalogSignalProxy.from_file(self.filename, '<i2', 4,
+                                            units='uV',
+                                            sampling_rate=1 * pq.kHz,
+                                            interleaved=False)
+        np.testing.assert_array_equal(proxy.load().magnitude,
+                                      self.data.reshape(4, -1).T)
+
+    def test_memmap_signals(self):
+        raw = memmap_signals(self.filename, '>i2', 4, bytes_offset=8,
+                             n_samples=10)
+        self.assertEqual(raw.shape, (10, 4))
+        np.testing.assert_array_equal(
+            raw, self.data[1:11].byteswap())
+
+        raw = memmap_signals(self.filename, '<i2', 2, n_samples=100,
+                             interleaved=False)
+        np.testing.assert_array_equal(raw,
+                                      self.data.ravel()[:200].reshape(2, -1).T)
+
+        raw = memmap_signals(self.filename, '<i2', 4, bytes_offset=2000)
+        self.assertEqual(raw.shape, (0, 4))
+
+    def test_units_magnitude(self):
+        proxy = AnalogSignalProxy(np.arange(10, dtype='uint16'),
+                                  units=pq.nano * pq.V,
+                                  sampling_rate=1 * pq.Hz, gain=2.,
+                                  offset=-1.)
+        sig = proxy.load()
+        self.assertEqual(sig.units, pq.V)
+        np.testing.assert_allclose(sig.magnitude[:, 0],
+                                   (2. * np.arange(10) - 1.) * 1e-9)
+        proxy.annotate(ground='G2')
+        self.assertEqual(proxy.load().annotations, {'ground': 'G2'})
+
+    def test_single_channel(self):
+        proxy = AnalogSignalProxy(np.arange(10, dtype='int16'), units='mV',
+                                  sampling_rate=1 * pq.Hz, gain=2.)
+        self.assertEqual(proxy.shape, (10, 1))
+        np.testing.assert_array_equal(proxy.load().magnitude,
+                                      2. * np.arange(10)[:, np.newaxis])
+
+    def test_load_waveforms(self):
+        indexes = [100, 2, 248, 100, 50, 120]
+        for max_rows in (1, 20, 2 ** 20):
+            w = self.proxy.load_waveforms(indexes, 3, 5,
+                                          channel_indexes=[0, 2],
+                                          max_rows=max_rows)
+            self.assertEqual(w.shape, (6, 2, 8))
+            self.assertEqual(w.units, pq.uV)
+            for k, i in enumerate(indexes):
+                for n, j in enumerate(range(i - 3, i + 5)):
+                    expected = [0, 0]
+                    if 0 <= j < 250:
+                        expected = self.expected[j, [0, 2]]
+                    np.testing.assert_array_equal(w.magnitude[k, :, n],
+                                                  expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
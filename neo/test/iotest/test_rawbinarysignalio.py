@@ -6,13 +6,23 @@ Tests of io.rawbinarysignal
 # needed for python 3 compatibility
 from __future__ import absolute_import, division
 
+import os
+import tempfile
+
 try:
     import unittest2 as unittest
 except ImportError:
     import unittest
 
+import numpy as np
+import quantities as pq
+
+from neo.core import AnalogSignal, Segment
 from neo.io import RawBinarySignalIO
+from neo.io.proxyobjects import AnalogSignalProxy
 from neo.test.iotest.common_io_test import BaseTestIO
+from neo.test.tools import (assert_neo_object_is_compliant,
+                            assert_sub_schema_is_lazy_loaded)
 
 
 class TestRawBinarySignalIO(BaseTestIO, unittest.TestCase, ):
@@ -21,5 +31,101 @@ class TestRawBinarySignalIO(BaseTestIO, unittest.TestCase, ):
     files_to_download = files_to_test
 
 
+class TestRawBinarySignalIOLazy(unittest.TestCase):
+    def setUp(self):
+        fd, self.filename = tempfile.mkstemp(suffix='.raw')
+        os.close(fd)
+        self.data = np.arange(-3000, 3001, dtype='int16')
+        self.data.tofile(self.filename)
+
+    def tearDown(self):
+        os.remove(self.filename)
+
+    def test_lazy_proxy(self):
+        params = dict(sampling_rate=1 * pq.kHz, nbchannel=2, dtype='int16',
+                      rangemin=-5, rangemax=5)
+        io = RawBinarySignalIO(filename=self.filename)
+        sig = io.read_segment(**params).analogsignals[0]
+        self.assertEqual(sig.shape, (3000, 2))
+        self.assertEqual(sig.dtype, np.float32)
+        expected = (self.data[:6000].reshape(-1, 2) * 10. / 2 ** 16)
+        np.testing.assert_allclose(sig.magnitude, expected, rtol=1e-6)
+
+        seg = io.read_segment(lazy=True, **params)
+        assert_neo_object_is_compliant(seg)
+        assert_sub_schema_is_lazy_loaded(seg)
+        self.assertEqual(seg.t_start, 0 * pq.s)
+        self.assertEqual(len(seg.time_slice(0 * pq.s, 1 * pq.s)
+                             .analogsignals), 1)
+        lazy_sig = seg.analogsignals[0]
+        self.assertEqual(lazy_sig.lazy_shape, (3000, 2))
+        proxy = lazy_sig.lazy_proxy
+        self.assertIsInstance(proxy, AnalogSignalProxy)
+        self.assertIsInstance(proxy.raw, np.memmap)
+        part = proxy.load(time_slice=(1 * pq.s, 2 * pq.s),
+                          channel_indexes=[1])
+        np.testing.assert_array_equal(part.magnitude,
+                                      sig.magnitude[1000:2000, 1:])
+        self.assertEqual(part.t_start, 1 * pq.s)
+
+
+class TestRawBinarySignalIOWrite(unittest.TestCase):
+    def setUp(self):
+        fd, self.filename = tempfile.mkstemp(suffix='.raw')
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.filename)
+
+    def test_write_chunks_offset_append(self):
+        seg = Segment()
+        signal = np.arange(-50, 50, dtype='f8').reshape(-1, 2) / 10.
+        seg.analogsignals.append(AnalogSignal(signal, units='V',
+                                              sampling_rate=1 * pq.kHz))
+        seg.analogsignals.append(AnalogSignal(-signal[:, 0], units='V',
+                                              sampling_rate=1 * pq.kHz))
+        expected = np.column_stack([signal, -signal[:, 0]])
+
+        with open(self.filename, 'wb') as f:
+            f.write(b'header' + b'\0' * 1000)
+        io = RawBinarySignalIO(filename=self.filename)
+        # the header is kept, and the rest of the file is overwritten
+        io.write_segment((s for s in [seg, seg]), dtype='float32',
+                         bytesoffset=6, chunk_size=7)
+        io.write_segment(seg, dtype='float32', append=True, chunk_size=7)
+        with open(self.filename, 'rb') as f:
+            self.assertEqual(f.read(6), b'header')
+        self.assertEqual(os.path.getsize(self.filename), 6 + 3 * 50 * 3 * 4)
+
+        sig = io.read_segment(nbchannel=3, dtype='float32',
+                              bytesoffset=6).analogsignals[0]
+        np.testing.assert_allclose(sig.magnitude,
+                                   np.vstack([expected] * 3), rtol=1e-6)
+
+        io.write_segment(seg, dtype='int16', rangemin=-10, rangemax=10,
+                         chunk_size=7)
+        sig = io.read_segment(nbchannel=3, dtype='int16', rangemin=-10,
+                              rangemax=10).analogsignals[0]
+        np.testing.assert_allclose(sig.magnitude, expected, atol=1e-3)
+
+        # invalid segments are detected before the file is modified
+        size = os.path.getsize(self.filename)
+        seg2 = Segment()
+        seg2.analogsignals.append(seg.analogsignals[0])
+        bad = Segment()
+        bad.analogsignals = [seg.analogsignals[0],
+                             seg.analogsignals[1][:10]]
+        self.assertRaises(ValueError, io.write_segment, bad)
+        self.assertRaises(ValueError, io.write_segment, [seg, seg2],
+                          bytesoffset=6)
+        self.assertRaises(ValueError, io.write_segment, iter([bad]),
+                          append=True)
+        self.assertEqual(os.path.getsize(self.filename), size)
+
+        # with a generator, the segments before an invalid one are written
+        self.assertRaises(ValueError, io.write_segment, iter([seg, seg2]))
+        self.assertEqual(os.path.getsize(self.filename), 50 * 3 * 4)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of neo.io.tools
+"""
+
+# needed for python 3 compatibility
+from __future__ import absolute_import, division
+
+import io
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+import numpy as np
+
+from neo.io.tools import parse_numbers, read_numeric_table
+from neo.test.tools import assert_arrays_almost_equal
+
+
+class TestReadNumericTable(unittest.TestCase):
+    def test_blank_lines(self):
+        # chunks which only contain blank lines must not add values
+        data = b'1\n2\n\n\n\n\n\n\n3\n'
+        for chunk_size in (1, 2, 3, 4, 100):
+            values = read_numeric_table(io.BytesIO(data), 1,
+                                        chunk_size=chunk_size)
+            assert_arrays_almost_equal(values, np.array([[1.], [2.], [3.]]),
+                                       1e-12)
+            values = read_numeric_table(io.BytesIO(b'1 2\n\n\n\n3 4'), 2,
+                                        chunk_size=chunk_size)
+            assert_arrays_almost_equal(values, np.array([[1., 2.], [3., 4.]]),
+                                       1e-12)
+        self.assertEqual(read_numeric_table(io.BytesIO(b'\n \n'), 3).shape,
+                         (0, 3))
+
+    def test_ragged_lines(self):
+        # 8 values, but not 4 on each line
+        data = b'1 2 3\n4 5 6 7 8\n'
+        for chunk_size in (4, 100):
+            self.assertRaises(ValueError, read_numeric_table,
+                              io.BytesIO(data), 4, chunk_size=chunk_size)
+        self.assertRaises(ValueError, parse_numbers, b'1,2\n3,4,5,6\n', 3,
+                          ',')
+
+        values = read_numeric_table(io.BytesIO(b' 1\t2 \r\n\n3  4\r\n'), 2)
+        assert_arrays_almost_equal(values, np.array([[1., 2.], [3., 4.]]),
+                                   1e-12)
+        # with one column, all the values of a line are kept
+        assert_arrays_almost_equal(parse_numbers(b'1 2 3'),
+                                   np.array([[1.], [2.], [3.]]), 1e-12)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,11 +6,18 @@ Tests of neo.io.wineedrio
 # needed for python 3 compatibility
 from __future__ import absolute_import, division
 
+import os
+import shutil
+import tempfile
+
 try:
     import unittest2 as unittest
 except ImportError:
     import unittest
 
+import numpy as np
+import quantities as pq
+
 from neo.io import WinEdrIO
 from neo.test.iotest.common_io_test import BaseTestIO
 
@@ -24,5 +31,63 @@ class TestWinedrIO(BaseTestIO, unittest.TestCase, ):
     files_to_download = files_to_test
 
 
+class TestWinEdrIOSynthetic(unittest.TestCase):
+    """
+    Compares the signals read from a small generated file with the values
+    given by the conversion formula of WinEDR.
+    """
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmpdir, 'test.EDR')
+        np.random.seed(0)
+        # columns of the samples of each channel
+        self.order = [1, 2, 0]
+        self.YCF = [1., 2.5, 0.5]
+        self.YAG = [2., 1., 10.]
+        self.YZ = [0, 5, -12]
+        self.raw = np.random.randint(-2048, 2048, (1000, 3)).astype('<i2')
+        header = ['NC=3', 'NP=3000', 'NBH=2048', 'ADCMAX=2047', 'AD=10,0',
+                  'DT=0,001']
+        for c in range(3):
+            header += ['YCF%d=%s' % (c, str(self.YCF[c]).replace('.', ',')),
+                       'YAG%d=%s' % (c, str(self.YAG[c]).replace('.', ',')),
+                       'YZ%d=%d' % (c, self.YZ[c]), 'YU%d=mV' % c,
+                       'YN%d=Ch%d' % (c, c), 'YO%d=%d' % (c, self.order[c])]
+        header = ('\r\n'.join(header) + '\r\n').encode('ascii')
+        with open(self.filename, 'wb') as f:
+            f.write(header.ljust(2048, b'\x00'))
+            f.write(self.raw.tostring())
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def expected(self, c):
+        return ((self.raw[:, self.order[c]].astype('f4') - self.YZ[c]) *
+                10. / (self.YCF[c] * self.YAG[c] * 2048))
+
+    def test_read_segment(self):
+        seg = WinEdrIO(filename=self.filename).read_segment()
+        self.assertEqual(len(seg.analogsignals), 3)
+        for c, sig in enumerate(seg.analogsignals):
+            self.assertEqual(sig.name, 'Ch%d' % c)
+            self.assertEqual(sig.units, pq.mV)
+            self.assertEqual(sig.sampling_rate, 1000 * pq.Hz)
+            self.assertEqual(sig.shape, (1000, 1))
+            np.testing.assert_allclose(sig.magnitude[:, 0], self.expected(c),
+                                       rtol=1e-5, atol=1e-6)
+
+    def test_lazy(self):
+        seg = WinEdrIO(filename=self.filename).read_segment(lazy=True)
+        for c, sig in enumerate(seg.analogsignals):
+            self.assertEqual(sig.shape, (0, 1))
+            self.assertEqual(sig.lazy_shape, (1000, 1))
+            part = sig.lazy_proxy.load(time_slice=(0.1 * pq.s, 0.3 * pq.s),
+                                       channel_indexes=[0])
+            self.assertEqual(part.t_start, 0.1 * pq.s)
+            np.testing.assert_allclose(part.magnitude[:, 0],
+                                       self.expected(c)[100:300],
+                                       rtol=1e-5, atol=1e-6)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -6,11 +6,19 @@ Tests of neo.io.winwcpio
 # needed for python 3 compatibility
 from __future__ import absolute_import, division
 
+import os
+import shutil
+import struct
+import tempfile
+
 try:
     import unittest2 as unittest
 except ImportError:
     import unittest
 
+import numpy as np
+import quantities as pq
+
 from neo.io import WinWcpIO
 from neo.test.iotest.common_io_test import BaseTestIO
 
@@ -21,5 +29,75 @@ class TestRawBinarySignalIO(BaseTestIO, unittest.TestCase, ):
     files_to_download = files_to_test
 
 
+class TestWinWcpIOSynthetic(unittest.TestCase):
+    """
+    Compares the signals read from a small generated file with the values
+    given by the conversion formula of WinWCP.
+    """
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmpdir, 'test.wcp')
+        np.random.seed(0)
+        # 3 records of 4 sectors of samples, for 2 channels
+        self.order = [1, 0]
+        self.YG = [2., 0.5]
+        self.raw = np.random.randint(-2048, 2048,
+                                     (3, 512, 2)).astype('<i2')
+        header = ['NC=2', 'NR=3', 'NBH=2', 'NBA=2', 'NBD=4', 'ADCMAX=2047',
+                  'NP=0', 'AD=5,0', 'DT=0,001']
+        for c in range(2):
+            header += ['YG%d=%s' % (c, str(self.YG[c]).replace('.', ',')),
+                       'YU%d=pA' % c, 'YN%d=I%d' % (c, c),
+                       'YO%d=%d' % (c, self.order[c])]
+        header = ('\r\n'.join(header) + '\r\n').encode('ascii')
+        with open(self.filename, 'wb') as f:
+            f.write(header.ljust(1024, b'\x00'))
+            for r in range(3):
+                # status, type, group, time, sampling interval, VMax
+                analysis = struct.pack('<8s4sfff8f', b'ACCEPTED', b'TEST',
+                                       1., 1.5 * r, 0.0001,
+                                       *[5. + r + c for c in range(8)])
+                f.write(analysis.ljust(1024, b'\x00'))
+                f.write(self.raw[r].tostring())
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def expected(self, r, c):
+        VMax = 5. + r + c
+        return (self.raw[r, :, self.order[c]].astype('f4') *
+                VMax / 2047 / self.YG[c])
+
+    def test_read_block(self):
+        bl = WinWcpIO(filename=self.filename).read_block()
+        self.assertEqual(len(bl.segments), 3)
+        for r, seg in enumerate(bl.segments):
+            self.assertEqual(len(seg.analogsignals), 2)
+            for c, sig in enumerate(seg.analogsignals):
+                self.assertEqual(sig.name, 'I%d' % c)
+                self.assertEqual(sig.units, pq.pA)
+                self.assertAlmostEqual(sig.sampling_rate.magnitude, 10000.,
+                                       places=2)
+                self.assertEqual(sig.t_start, 1.5 * r * pq.s)
+                self.assertEqual(sig.shape, (512, 1))
+                np.testing.assert_allclose(sig.magnitude[:, 0],
+                                           self.expected(r, c),
+                                           rtol=1e-5, atol=1e-6)
+
+    def test_lazy(self):
+        bl = WinWcpIO(filename=self.filename).read_block(lazy=True)
+        for r, seg in enumerate(bl.segments):
+            for c, sig in enumerate(seg.analogsignals):
+                self.assertEqual(sig.shape, (0, 1))
+                self.assertEqual(sig.lazy_shape, (512, 1))
+                t_start = sig.t_start + 100 * sig.sampling_period
+                t_stop = sig.t_start + 300 * sig.sampling_period
+                part = sig.lazy_proxy.load(time_slice=(t_start, t_stop),
+                                           channel_indexes=[0])
+                np.testing.assert_allclose(part.magnitude[:, 0],
+                                           self.expected(r, c)[100:300],
+                                           rtol=1e-5, atol=1e-6)
+
+
 if __name__ == "__main__":
     unittest.main()